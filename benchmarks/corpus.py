@@ -0,0 +1,142 @@
+"""Generated texts full of spoken numbers, for timing the parser on them.
+
+The spoken numbers come from ``pronounce_number`` in the language itself, so
+every language is fed words its own parser produced. A corpus is built to a
+length in whitespace tokens, in one of these shapes:
+
+* ``mixed``: filler words with spoken numbers dropped in, a ``density``
+  fraction of the tokens being number words;
+* ``joiners``: one long chain of numbers linked by the language's
+  conjunction ("one and two and three ..."), or by commas where the language
+  has none;
+* ``scales``: scale words over and over ("thousand million thousand ...");
+* ``run``: spoken numbers back to back, with no filler between them.
+
+The last three are the adversarial shapes: the ones that make a scanner look
+further ahead, or restart further back, the longer they go on.
+
+    python benchmarks/corpus.py en 1000                  # mixed, density 0.2
+    python benchmarks/corpus.py pt 500 --shape joiners
+    python benchmarks/corpus.py de 10000 --density 0.5 --seed 3 > de.txt
+"""
+import argparse
+import pkgutil
+import random
+
+import ovos_number_parser as onp
+
+SHAPES = ("mixed", "joiners", "scales", "run")
+
+#: made-up words that read as no number in any language
+_FILLER = ("blorp", "zimmick", "quaffle", "dravno", "pindle", "skrett",
+           "wumbly", "glarsh", "tooven", "mirkle", "frandle", "yossip")
+
+#: values spoken for the corpora: small and large, round and ragged
+_VALUES = (1, 2, 3, 7, 12, 15, 20, 21, 45, 99, 100, 101, 342, 1000, 2023,
+           12345, 10 ** 6, 3 * 10 ** 6 + 17)
+
+#: conjunctions tried after the words of the language's own spoken numbers
+_CONJUNCTIONS = ("and", "und", "y", "i", "e", "et", "og", "och", "en", "eta",
+                 "in", "și", "и", "و", "d", "u", "ed")
+
+
+def languages():
+    """The code of every language with a parser module of its own
+    (``numbers_en``, ``numbers_pt``, ...). Variants read by another
+    language's parser, such as ``pt-br``, are left out: they would time the
+    same code twice."""
+    return [name[len("numbers_"):] for _, name, _ in
+            pkgutil.iter_modules(onp.__path__) if name.startswith("numbers_")]
+
+
+def _spoken(value, lang):
+    try:
+        spoken = onp.pronounce_number(value, lang)
+    except Exception:
+        return None
+    return spoken if isinstance(spoken, str) and spoken else None
+
+
+def numerals(lang):
+    """The spoken forms of ``_VALUES`` in ``lang``, as lists of tokens."""
+    return [spoken.split() for spoken in
+            filter(None, (_spoken(value, lang) for value in _VALUES))]
+
+
+def scale_words(lang):
+    """The words for a hundred, a thousand and a million in ``lang``, as
+    spoken on their own."""
+    words = []
+    for value in (100, 1000, 10 ** 6):
+        spoken = _spoken(value, lang)
+        if spoken:
+            words.append(spoken.split()[-1])
+    return words or ["1000"]
+
+
+def joiner(lang):
+    """The conjunction that links spoken numbers in ``lang``: the first word
+    ``classify_tokens`` calls a joiner, in the language's spoken numbers or
+    among common conjunctions, else the middle word of a spoken "forty five"
+    ("quarenta e cinco"), else ``","``."""
+    words = [word for value in (21, 45, 101, 121, 1001)
+             for word in (_spoken(value, lang) or "").split()]
+    for token in onp.classify_tokens(words + list(_CONJUNCTIONS), lang):
+        if token.kind == onp.TokenKind.JOINER:
+            return token.token
+    # "empat puluh lima" has a middle word too, but it belongs to the forty
+    words = (_spoken(45, lang) or "").split()
+    forty = (_spoken(40, lang) or "").split()
+    if len(words) == 3 and words[1] not in forty:
+        return words[1]
+    return ","
+
+
+def corpus(lang, tokens, shape="mixed", density=0.2, seed=0):
+    """About ``tokens`` whitespace tokens of ``shape`` text in ``lang``
+    (never fewer, and at most one spoken number more)."""
+    if shape not in SHAPES:
+        raise ValueError(f"unknown shape {shape!r}, expected one of {SHAPES}")
+    rnd = random.Random(seed)
+    spoken = numerals(lang) or [["1"]]
+    words = []
+    if shape == "mixed":
+        while len(words) < tokens:
+            if rnd.random() < density:
+                words.extend(rnd.choice(spoken))
+            else:
+                words.append(rnd.choice(_FILLER))
+    elif shape == "joiners":
+        link = joiner(lang)
+        while len(words) < tokens:
+            if words:
+                if link == ",":
+                    words[-1] += ","
+                else:
+                    words.append(link)
+            words.extend(rnd.choice(spoken))
+    elif shape == "scales":
+        scales = scale_words(lang)
+        while len(words) < tokens:
+            words.append(rnd.choice(scales))
+    else:
+        while len(words) < tokens:
+            words.extend(rnd.choice(spoken))
+    return " ".join(words)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("lang")
+    parser.add_argument("tokens", type=int)
+    parser.add_argument("--shape", choices=SHAPES, default="mixed")
+    parser.add_argument("--density", type=float, default=0.2,
+                        help="fraction of number words in a mixed corpus "
+                             "(default 0.2)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(corpus(args.lang, args.tokens, args.shape, args.density, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Cold start: import time by module, and the first call in every language.
+
+Every run happens in a fresh interpreter so nothing is already cached in
+``sys.modules``. The package imports its per-language modules lazily, so a
+plain import should load none of them and leave unicode-rbnf alone too.
+
+The script reports, in order:
+
+* the median import time, and which language modules the import pulled in;
+* ``python -X importtime`` broken down by module: the package's own modules
+  and the heaviest modules it imports, by median self and cumulative time;
+* the first call of every public function in every language, each in its
+  own fresh interpreter. That is what a CLI tool or a serverless handler
+  pays on each invocation: the language module import plus whatever the
+  function builds lazily (ordinal reverse tables, token indexes,
+  unicode-rbnf engines).
+
+Times over ``--import-budget`` / ``--call-budget`` (milliseconds) are
+flagged, and the exit status is then 1.
+
+    python benchmarks/import_time.py                    # 10 runs, all langs
+    python benchmarks/import_time.py 30                 # 30 runs
+    python benchmarks/import_time.py --langs en pt sw --call-budget 150
+    python benchmarks/import_time.py --no-calls         # imports only
+"""
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import ovos_number_parser
+t1 = time.perf_counter()
+loaded = sorted(m for m in sys.modules
+                if m.startswith("ovos_number_parser.numbers_")
+                or m.split(".")[0] == "unicode_rbnf")
+ovos_number_parser.pronounce_number(21, "en")
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_call": t2 - t1, "loaded": loaded}))
+"""
+
+#: one call of a public function, timed in a fresh interpreter after the
+#: import; the arguments come in as JSON on argv
+_CALL_PROBE = """
+import json, sys, time
+import ovos_number_parser
+name, args = sys.argv[1], json.loads(sys.argv[2])
+fn = getattr(ovos_number_parser, name)
+t0 = time.perf_counter()
+try:
+    result = fn(*args)
+    if name == "normalize_for_tts":
+        result = list(result)
+    ok = True
+except Exception:
+    ok = False
+print(json.dumps({"seconds": time.perf_counter() - t0, "ok": ok}))
+"""
+
+#: the public functions, in the order they are reported
+FUNCTIONS = ("pronounce_number", "pronounce_ordinal", "pronounce_fraction",
+             "extract_number", "extract_numbers", "numbers_to_digits",
+             "is_ordinal", "is_fractional", "classify_tokens",
+             "normalize_for_tts")
+_LABELS = ("number", "ordinal", "fraction", "extract", "extracts",
+           "to_digits", "is_ord", "is_frac", "classify", "tts")
+
+_IMPORTTIME_LINE = re.compile(
+    r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def measure_once():
+    out = subprocess.run([sys.executable, "-c", _PROBE], check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def importtime_once(code="import ovos_number_parser"):
+    """``{module: (self us, cumulative us)}`` from one
+    ``-X importtime`` run of ``code``."""
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         check=True, capture_output=True, text=True).stderr
+    modules = {}
+    for line in err.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            own, total, name = match.groups()
+            modules[name] = (int(own), int(total))
+    return modules
+
+
+def importtime_breakdown(runs, top=8):
+    samples = [importtime_once() for _ in range(runs)]
+    names = set().union(*samples)
+
+    def median(name, field):
+        return statistics.median(s[name][field] for s in samples
+                                 if name in s) / 1000
+
+    # what Python imports at startup anyway is not the package's cost
+    startup = set(importtime_once("pass"))
+    package = sorted(n for n in names
+                     if n.split(".")[0] == "ovos_number_parser")
+    others = sorted((n for n in names
+                     if n not in startup and n not in package),
+                    key=lambda n: median(n, 1), reverse=True)[:top]
+    print(f"\n-X importtime, median of {runs} runs (ms)")
+    print(f"  {'module':<32} {'self':>8} {'cumulative':>11}")
+    for name in package + others:
+        print(f"  {name:<32} {median(name, 0):>8.1f} {median(name, 1):>11.1f}")
+
+
+def call_inputs(lang):
+    """Arguments for one representative call of each public function in
+    ``lang``, built in this process so the probe only makes the call."""
+    import ovos_number_parser as onp
+    try:
+        spoken = onp.pronounce_number(21, lang)
+    except Exception:
+        spoken = "21"
+    try:
+        ordinal = onp.pronounce_ordinal(3, lang)
+    except Exception:
+        ordinal = "3"
+    try:
+        half = onp._pronounce_unsigned_fraction(1, 2, lang)
+    except Exception:
+        half = "1/2"
+    return {
+        "pronounce_number": [21, lang],
+        "pronounce_ordinal": [3, lang],
+        "pronounce_fraction": ["1/2", lang],
+        "extract_number": [spoken, lang],
+        "extract_numbers": [spoken, lang],
+        "numbers_to_digits": [spoken, lang],
+        "is_ordinal": [ordinal, lang],
+        "is_fractional": [half, lang],
+        "classify_tokens": [spoken.split(), lang],
+        "normalize_for_tts": ["21 and 3.5", lang],
+    }
+
+
+def first_call(name, args):
+    out = subprocess.run(
+        [sys.executable, "-c", _CALL_PROBE, name, json.dumps(args)],
+        check=True, capture_output=True, text=True).stdout
+    result = json.loads(out)
+    return result["seconds"] * 1000 if result["ok"] else None
+
+
+def first_calls(langs, budget):
+    print(f"\nfirst call in a fresh interpreter, after the import (ms), "
+          f"budget {budget:.0f} ms")
+    print(f"  {'lang':<6}" + "".join(f"{label:>10}" for label in _LABELS))
+    over = []
+    for lang in langs:
+        inputs = call_inputs(lang)
+        cells = []
+        for name in FUNCTIONS:
+            ms = first_call(name, inputs[name])
+            if ms is None:
+                cells.append("-")
+                continue
+            flag = "*" if ms > budget else ""
+            if flag:
+                over.append((lang, name, ms))
+            cells.append(f"{ms:.1f}{flag}")
+        print(f"  {lang:<6}" + "".join(f"{cell:>10}" for cell in cells),
+              flush=True)
+    return over
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("runs", type=int, nargs="?", default=10)
+    parser.add_argument("--langs", nargs="+",
+                        help="languages for the first calls; all by default")
+    parser.add_argument("--import-budget", type=float, default=100.0,
+                        help="ms allowed for the import (default 100)")
+    parser.add_argument("--call-budget", type=float, default=250.0,
+                        help="ms allowed for any first call (default 250)")
+    parser.add_argument("--no-calls", action="store_true",
+                        help="skip the first-call table")
+    args = parser.parse_args(argv)
+
+    if sys.dont_write_bytecode:
+        print("note: bytecode caching is off (PYTHONDONTWRITEBYTECODE), so "
+              "every import compiles the sources")
+    samples = [measure_once() for _ in range(args.runs)]
+    imports = [s["import"] * 1000 for s in samples]
+    first = [s["first_call"] * 1000 for s in samples]
+    median_import = statistics.median(imports)
+    print(f"import ovos_number_parser: median {median_import:.1f} ms"
+          f"  (min {min(imports):.1f}, max {max(imports):.1f}, "
+          f"{args.runs} runs)")
+    print(f"first pronounce_number(21, 'en'): median "
+          f"{statistics.median(first):.1f} ms")
+    loaded = samples[0]["loaded"]
+    print(f"language modules loaded by the import: {len(loaded)}"
+          + (f" ({', '.join(loaded)})" if loaded else ""))
+
+    importtime_breakdown(args.runs)
+
+    over = []
+    if median_import > args.import_budget:
+        over.append(("import", "ovos_number_parser", median_import))
+    if not args.no_calls:
+        from ovos_number_parser import _WARMUP_LANGS
+        over += first_calls(args.langs or _WARMUP_LANGS, args.call_budget)
+
+    if over:
+        print()
+        for what, name, ms in over:
+            print(f"OVER BUDGET {what} {name}: {ms:.1f} ms")
+        return 1
+    print("\nwithin budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""Memory: what the import holds, what each language's tables take, and what
+each call allocates.
+
+On a Raspberry Pi class device memory is as scarce as time, so the script
+measures it with ``tracemalloc``:
+
+* after ``import ovos_number_parser``, in a fresh interpreter: the resident
+  set size and the bytes Python allocated for the import, and then for
+  unicode-rbnf, which the first warmup or spelled-out call imports;
+* per language, each in a fresh interpreter: the bytes allocated by
+  importing the language module and by ``warmup()`` (the lazily built
+  lexicons, ordinal reverse tables and token indexes), the size of the
+  reverse ordinal table, and the largest
+  module-level tables (``_STRING_*`` / ``_NUM_STRING_*`` dicts,
+  ``NumberVocabulary`` and extractor instances) by deep size;
+* per call of each main entry point, once warm: the peak of what it
+  allocates while running (the Token objects, ReplaceableNumber lists and
+  dicts a call builds and drops) and what it leaves allocated afterwards.
+
+    python benchmarks/memory.py                      # en pt de es fr ru
+    python benchmarks/memory.py en sw --json mem.json
+"""
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tracemalloc
+from types import MappingProxyType
+
+_IMPORT_PROBE = """
+import json, tracemalloc
+tracemalloc.start()
+import ovos_number_parser
+traced = tracemalloc.get_traced_memory()[0]
+rss = None
+try:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) * 1024
+except OSError:
+    pass
+import unicode_rbnf
+rbnf = tracemalloc.get_traced_memory()[0] - traced
+print(json.dumps({"traced": traced, "rbnf": rbnf, "rss": rss}))
+"""
+
+_LANGUAGE_PROBE = """
+import gc, importlib, json, sys, tracemalloc
+sys.path.insert(0, {here!r})
+from memory import deep_size, module_tables
+import ovos_number_parser as onp
+import unicode_rbnf  # shared by every language, reported on its own
+lang = sys.argv[1]
+code = onp._backend_code(lang)
+name = code and "ovos_number_parser.numbers_" + code.split("-")[0]
+tracemalloc.start()
+module = importlib.import_module(name) if name else None
+gc.collect()
+imported = tracemalloc.get_traced_memory()[0]
+onp.warmup([lang])
+gc.collect()
+warmed = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+tables = module_tables(module) if module else []
+# the reverse ordinal tables: the generic one, or the backend's own builder
+reverse = onp._ORDINAL_REVERSE_CACHE.get(code)
+builder = module and getattr(module, "_ordinal_reverse_" + code, None)
+if builder is not None:
+    reverse = builder()
+print(json.dumps({{"import": imported, "warm": warmed - imported,
+                  "ordinal_reverse": deep_size(reverse) if reverse else 0,
+                  "tables": tables[:5]}}))
+"""
+
+#: (function, arguments) per entry point; "{n}" is the language's spoken 21
+#: and "{o}" its spoken 3rd
+CALLS = (
+    ("pronounce_number", (1234.5,)),
+    ("pronounce_ordinal", (21,)),
+    ("extract_number", ("{n} {o}",)),
+    ("extract_numbers", ("{n} {o} {n}",)),
+    ("numbers_to_digits", ("{n} {o} {n}",)),
+    ("is_ordinal", ("{o}",)),
+    ("is_fractional", ("{o}",)),
+    ("classify_tokens", ("{n} {o}",)),
+    ("normalize_for_tts", ("It was the 21st of 1,234.5 days.",)),
+)
+
+_ATOMS = (str, bytes, int, float, complex, bool, type(None))
+
+
+def deep_size(obj, seen=None) -> int:
+    """``sys.getsizeof`` of ``obj`` and of everything it holds, each object
+    counted once."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, _ATOMS):
+        return size
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(deep_size(k, seen) + deep_size(v, seen)
+                    for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    if hasattr(obj, "__dict__") and _is_data(obj):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+def _is_data(obj) -> bool:
+    """Whether ``obj`` holds data rather than code (no function, class or
+    module, whose sizes are not the tables')."""
+    return not callable(obj) and type(obj).__name__ != "module"
+
+
+def module_tables(module):
+    """``[name, bytes]`` for the module-level tables ``module`` defines
+    itself, largest first."""
+    from ovos_number_parser import util
+    shared = {id(value) for value in vars(util).values()}
+    tables = [(name, deep_size(value)) for name, value in vars(module).items()
+              if _is_data(value) and not isinstance(value, _ATOMS)
+              and id(value) not in shared and not name.startswith("__")]
+    return sorted(tables, key=lambda t: t[1], reverse=True)
+
+
+def import_footprint():
+    out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def language_footprint(lang):
+    here = __file__.rsplit("/", 1)[0] if "/" in __file__ else "."
+    out = subprocess.run(
+        [sys.executable, "-c", _LANGUAGE_PROBE.format(here=here), lang],
+        check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def call_footprint(fn, args, repeat=200):
+    """(peak bytes allocated during one call, bytes still allocated per
+    call after ``repeat`` calls)."""
+    fn(*args)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn(*args)
+        peak = tracemalloc.get_traced_memory()[1] - before
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(repeat):
+            fn(*args)
+        gc.collect()
+        kept = (tracemalloc.get_traced_memory()[0] - before) / repeat
+    finally:
+        tracemalloc.stop()
+    return peak, kept
+
+
+def _spoken(fn, *args):
+    try:
+        return fn(*args)
+    except Exception:
+        return ""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("langs", nargs="*",
+                        default=["en", "pt", "de", "es", "fr", "ru"])
+    parser.add_argument("--json", metavar="FILE",
+                        help="write the results to FILE")
+    args = parser.parse_args(argv)
+    report = {"import": import_footprint(), "languages": {}, "calls": {}}
+
+    rss = report["import"]["rss"]
+    print(f"after import: {report['import']['traced'] / 1024:.0f} KiB "
+          "allocated by Python"
+          + (f", {rss / 2 ** 20:.1f} MiB resident" if rss else ""))
+    print("importing unicode-rbnf on top: "
+          f"{report['import']['rbnf'] / 1024:.0f} KiB")
+
+    print(f"\n{'lang':<6} {'import KiB':>11} {'warmup KiB':>11} "
+          f"{'ordinals KiB':>13}  largest tables (KiB)")
+    for lang in args.langs:
+        found = language_footprint(lang)
+        report["languages"][lang] = found
+        tables = ", ".join(f"{name} {size / 1024:.0f}"
+                           for name, size in found["tables"][:3])
+        print(f"{lang:<6} {found['import'] / 1024:>11.0f} "
+              f"{found['warm'] / 1024:>11.0f} "
+              f"{found['ordinal_reverse'] / 1024:>13.0f}  {tables}",
+              flush=True)
+
+    import ovos_number_parser as onp
+    onp.warmup(args.langs)
+    print("\nper call, warm: peak allocated while running / kept afterwards "
+          "(bytes)")
+    print(f"{'lang':<6}" + "".join(f"{name[:17]:>19}" for name, _ in CALLS))
+    for lang in args.langs:
+        n = _spoken(onp.pronounce_number, 21, lang)
+        o = _spoken(onp.pronounce_ordinal, 3, lang)
+        cells = []
+        report["calls"][lang] = {}
+        for name, call_args in CALLS:
+            fn = getattr(onp, name)
+            if name == "normalize_for_tts":
+                def fn(text, lang, _tts=fn):
+                    return list(_tts(text, lang))
+            call_args = tuple(a.format(n=n, o=o) if isinstance(a, str) else a
+                              for a in call_args) + (lang,)
+            try:
+                peak, kept = call_footprint(fn, call_args)
+            except Exception:
+                cells.append("-")
+                continue
+            report["calls"][lang][name] = {"peak": peak, "kept": kept}
+            cells.append(f"{peak} / {kept:.0f}")
+        print(f"{lang:<6}" + "".join(f"{cell:>19}" for cell in cells),
+              flush=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Per-language speed of the public functions, with a baseline to compare.
+
+The differential harnesses check what the parser says; this one times how
+fast it says it. For every language it times ``pronounce_number``,
+``pronounce_ordinal``, ``extract_number``, ``numbers_to_digits``,
+``is_ordinal`` and ``is_fractional`` on a fixed set of inputs. The text
+inputs are made from the language's own spoken numbers, so each language is
+timed on words it really parses. It prints the microseconds per call and can
+write them as JSON, or compare them with a JSON file saved earlier:
+
+    python benchmarks/perf_suite.py                          # every language
+    python benchmarks/perf_suite.py en pt --json now.json
+    python benchmarks/perf_suite.py --save baseline.json
+    python benchmarks/perf_suite.py --baseline baseline.json --tolerance 0.25
+
+With ``--baseline``, a timing more than ``--tolerance`` (a fraction, 0.2 by
+default) and more than ``--floor`` microseconds (1 by default, below which
+differences are timer noise) slower than the baseline is reported as a
+regression, and the exit status is 1. Timings are the best of ``--repeat`` rounds after a warmup,
+so a table that is rebuilt on every call shows up as a regression where a
+one-off build does not. Compare baselines from the same machine only.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import ovos_number_parser as onp
+from ovos_number_parser.version import __version__
+
+FUNCTIONS = ("pronounce_number", "pronounce_ordinal", "extract_number",
+             "numbers_to_digits", "is_ordinal", "is_fractional")
+#: column headings of the printed table
+_LABELS = ("number", "ordinal", "extract", "to_digits", "is_ord", "is_frac")
+
+#: cardinals to speak, and whose spoken forms the text inputs are made of
+NUMBERS = (0, 7, 13, 21, 99, 105, 342, 1000, 2023, 12345, 10 ** 6, -8, 3.5)
+#: ordinals to speak and to recognise
+ORDINALS = (1, 2, 3, 10, 21, 100)
+#: denominators of the fraction words to recognise
+DENOMINATORS = (2, 3, 4, 10)
+
+
+def _quietly(fn, *args):
+    try:
+        return fn(*args)
+    except Exception:
+        return None
+
+
+def _works(fn, args) -> bool:
+    try:
+        fn(*args)
+    except Exception:
+        return False
+    return True
+
+
+def inputs(lang):
+    """The argument tuples each function is timed on in ``lang``; a function
+    with nothing to time there gets none."""
+    spoken = [s for s in (_quietly(onp.pronounce_number, n, lang)
+                          for n in NUMBERS) if isinstance(s, str)]
+    ordinals = [s for s in (_quietly(onp.pronounce_ordinal, n, lang)
+                            for n in ORDINALS) if isinstance(s, str)]
+    fractions = [s for s in (_quietly(onp._pronounce_unsigned_fraction, 1, d,
+                                      lang) for d in DENOMINATORS)
+                 if isinstance(s, str)]
+    sentences = [" ".join(spoken[i:i + 3]) for i in range(0, len(spoken), 3)]
+    return {
+        "pronounce_number": [(n, lang) for n in NUMBERS],
+        "pronounce_ordinal": [(n, lang) for n in ORDINALS],
+        "extract_number": [(s, lang) for s in spoken + ordinals],
+        "numbers_to_digits": [(s, lang) for s in sentences],
+        "is_ordinal": [(s, lang) for s in ordinals + spoken[:3]],
+        "is_fractional": [(s, lang) for s in fractions + spoken[:3]],
+    }
+
+
+def time_calls(fn, calls, repeat, budget=0.02):
+    """Best time per call, in microseconds, of running every argument tuple
+    of ``calls`` through ``fn``. Each round loops often enough to last about
+    ``budget`` seconds."""
+    # leave out the calls that raise, so an error is not what gets timed
+    calls = [args for args in calls if _works(fn, args)]
+    if not calls:
+        return None
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            for args in calls:
+                fn(*args)
+        elapsed = time.perf_counter() - t0
+        if elapsed >= budget or loops >= 1 << 20:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            for args in calls:
+                fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best / (loops * len(calls)) * 1e6
+
+
+def run(langs, repeat):
+    results = {}
+    for lang in langs:
+        onp.warmup([lang])
+        table = inputs(lang)
+        results[lang] = {name: time_calls(getattr(onp, name), table[name],
+                                          repeat)
+                         for name in FUNCTIONS}
+        line = "  ".join(f"{'-' if us is None else f'{us:.1f}':>9}"
+                         for us in results[lang].values())
+        print(f"{lang:<6} {line}", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance, floor):
+    """(lang, function, baseline us, now us) for every timing more than
+    ``tolerance`` and more than ``floor`` microseconds slower than
+    ``baseline``."""
+    slower = []
+    for lang, timings in results.items():
+        for name, now in timings.items():
+            before = baseline.get(lang, {}).get(name)
+            if before is None or now is None:
+                continue
+            if now > before * (1 + tolerance) and now - before > floor:
+                slower.append((lang, name, before, now))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("langs", nargs="*",
+                        help="language codes; every language by default")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="FILE",
+                        help="write the results to FILE")
+    parser.add_argument("--save", metavar="FILE",
+                        help="same as --json, for a baseline")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="compare with results saved earlier")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="slowdown allowed before a regression is "
+                             "reported, as a fraction (default 0.2)")
+    parser.add_argument("--floor", type=float, default=1.0,
+                        help="slowdown in microseconds that is never "
+                             "reported, however large a fraction it is "
+                             "(default 1.0)")
+    args = parser.parse_args(argv)
+
+    langs = args.langs or list(onp._WARMUP_LANGS)
+    print(f"{'us/call':<6} " + "  ".join(f"{label:>9}" for label in _LABELS))
+    results = run(langs, args.repeat)
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "unit": "us/call",
+        "results": results,
+    }
+    for path in filter(None, (args.json, args.save)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        slower = compare(results, baseline, args.tolerance, args.floor)
+        for lang, name, before, now in slower:
+            print(f"REGRESSION {lang} {name}: {before:.1f} -> {now:.1f} us "
+                  f"(+{(now / before - 1) * 100:.0f}%)")
+        if slower:
+            return 1
+        print(f"no regressions beyond {args.tolerance:.0%} against "
+              f"{args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""How ``numbers_to_digits`` and ``extract_number`` grow with the input.
+
+For every language and every corpus shape (see ``corpus.py``) the script
+times both functions on corpora of growing length. It then fits the scaling
+exponent: the slope of log(time) against log(tokens). A linear scanner
+scores about 1 and a quadratic one about 2. Any exponent above
+``--threshold`` (1.2 by default) is flagged, and the exit status is then 1.
+A scanner that restarts from the first token for every number it finds, or
+that looks ahead to the end of every chain of joiners, shows up here long
+before anyone feeds it a real transcript.
+
+The sizes run from 10 to 100k tokens by default. The fit uses the sizes from
+``--fit-from`` tokens up (1000 by default), because at the small sizes the
+fixed cost of a call hides how it grows. A series stops before a size that
+would take longer than ``--max-seconds`` even if it grew linearly, so a slow
+series ends early instead of running for minutes. Each series runs in its
+own interpreter, so a size that takes far longer than that is killed once it
+has had ``--max-seconds`` per repeat, and flagged as a timeout.
+
+    python benchmarks/scaling.py                          # every language
+    python benchmarks/scaling.py en pt --shapes joiners run
+    python benchmarks/scaling.py de --sizes 10 100 1000 --max-seconds 1
+"""
+import argparse
+import json
+import math
+import os
+import queue
+import subprocess
+import sys
+import threading
+
+# corpus.py sits next to this script, also under ``python -m benchmarks.scaling``
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import SHAPES, languages  # noqa: E402
+
+FUNCTIONS = ("numbers_to_digits", "extract_number")
+
+#: one series, in a fresh interpreter: a JSON line per size, as it is timed
+_SERIES_PROBE = """
+import json, sys, time
+sys.path.insert(0, {here!r})
+from corpus import corpus
+import ovos_number_parser as onp
+lang, shape, name = sys.argv[1:4]
+density, repeat, max_seconds = map(float, sys.argv[4:7])
+fn = getattr(onp, name)
+onp.warmup([lang])
+last = None
+for size in map(int, sys.argv[7:]):
+    text = corpus(lang, size, shape, density)
+    tokens = len(text.split())
+    if last and last[1] * tokens / last[0] > max_seconds:
+        # even linear growth would take longer than that
+        break
+    best = float("inf")
+    try:
+        for _ in range(int(repeat)):
+            t0 = time.perf_counter()
+            fn(text, lang)
+            best = min(best, time.perf_counter() - t0)
+            if best > max_seconds:
+                break
+    except Exception as e:
+        print(json.dumps({{"error": type(e).__name__, "tokens": size}}),
+              flush=True)
+        break
+    print(json.dumps({{"tokens": tokens, "seconds": best}}), flush=True)
+    last = tokens, best
+"""
+
+
+def exponent(points):
+    """The least-squares slope of log(seconds) against log(tokens)."""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(max(seconds, 1e-9)) for _, seconds in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+
+def series(lang, shape, name, sizes, density, repeat, max_seconds):
+    """((tokens, seconds) for each size in turn, and how the series ended
+    early: ``None``, ``"timeout"`` or the name of the exception raised)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    probe = _SERIES_PROBE.format(here=here)
+    proc = subprocess.Popen(
+        [sys.executable, "-c", probe, lang, shape, name, str(density),
+         str(repeat), str(max_seconds)] + [str(size) for size in sizes],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    lines = queue.Queue()
+    threading.Thread(target=lambda: [lines.put(line) for line in proc.stdout]
+                     + [lines.put(None)], daemon=True).start()
+    points, ended = [], None
+    # the first size also pays for the interpreter start and the warmup
+    wait = max_seconds * repeat + 30
+    while True:
+        try:
+            line = lines.get(timeout=wait)
+        except queue.Empty:
+            proc.kill()
+            ended = "timeout"
+            break
+        if line is None:
+            break
+        found = json.loads(line)
+        if "error" in found:
+            ended = found["error"]
+            break
+        points.append((found["tokens"], found["seconds"]))
+        wait = max_seconds * repeat + 5
+    proc.wait()
+    return points, ended
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("langs", nargs="*",
+                        help="language codes; every language by default")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10, 100, 1000, 10000, 100000],
+                        help="corpus lengths in tokens "
+                             "(default 10 100 1000 10000 100000)")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES,
+                        default=list(SHAPES))
+    parser.add_argument("--density", type=float, default=0.2,
+                        help="fraction of number words in the mixed corpora "
+                             "(default 0.2)")
+    parser.add_argument("--fit-from", type=int, default=1000,
+                        help="smallest size the fit uses (default 1000)")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="exponent above which a series is flagged "
+                             "(default 1.2)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=5.0,
+                        help="stop growing a series before a size that "
+                             "would take this long at linear growth "
+                             "(default 5)")
+    args = parser.parse_args(argv)
+
+    langs = args.langs or languages()
+    sizes = sorted(args.sizes)
+    columns = [(shape, name) for shape in args.shapes for name in FUNCTIONS]
+    print(f"scaling exponent from {args.fit_from} tokens up "
+          f"(1 = linear, 2 = quadratic); * above {args.threshold}")
+    print(f"{'lang':<6}" + "".join(f"{shape[:7] + ' ' + name[:7]:>17}"
+                                   for shape, name in columns))
+    flagged, errors = [], []
+    for lang in langs:
+        cells = []
+        for shape, name in columns:
+            points, ended = series(lang, shape, name, sizes, args.density,
+                                   args.repeat, args.max_seconds)
+            if ended == "timeout":
+                tokens = points[-1][0] if points else 0
+                flagged.append(f"{lang} {name} on {shape}: no result within "
+                               f"{args.max_seconds * args.repeat:.0f} s past "
+                               f"{tokens} tokens")
+                cells.append("timeout*")
+                continue
+            if ended:
+                errors.append(f"{lang} {name} on {shape}: {ended} before "
+                              f"{sizes[len(points)]} tokens")
+            fitted = [p for p in points if p[0] >= args.fit_from]
+            if len(fitted) < 2:
+                fitted = points[-2:]
+            if len(fitted) < 2:
+                cells.append("err" if ended else "-")
+                continue
+            slope = exponent(fitted)
+            flag = "*" if slope > args.threshold else ""
+            if flag:
+                tokens, seconds = points[-1]
+                flagged.append(f"{lang} {name} on {shape}: exponent "
+                               f"{slope:.2f}, {seconds:.2f} s at {tokens} "
+                               f"tokens")
+            cells.append(f"{slope:.2f}{flag}")
+        print(f"{lang:<6}" + "".join(f"{cell:>17}" for cell in cells),
+              flush=True)
+
+    if errors:
+        print()
+        for line in errors:
+            print(f"ERROR {line}")
+    if flagged:
+        print()
+        for line in flagged:
+            print(f"SUPERLINEAR {line}")
+        return 1
+    print(f"\nno exponent above {args.threshold}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Every public function, called from a growing number of threads.
+
+A server hands requests to a thread pool, and on a free-threaded CPython
+(3.13t and later) those threads parse in parallel. The script runs a mixed
+workload (all the public functions, in several languages) from 1, 2, 4, ...
+threads, checks every result against a single-threaded run, and prints the
+throughput per thread count, with the speedup over the first count. On a
+regular build the GIL keeps the total flat; on a free-threaded build it
+should grow with the threads.
+
+    python benchmarks/thread_scaling.py              # 1, 2, 4, 8 threads
+    python benchmarks/thread_scaling.py 1 4 16 --seconds 3
+    python benchmarks/thread_scaling.py --cold       # race to build the tables
+
+With ``--cold`` the lazily built tables are emptied before each thread
+count, so the threads' first calls race to build them; a wrong result there
+means a table was seen half-built.
+"""
+import argparse
+import importlib
+import sys
+import threading
+import time
+
+import ovos_number_parser as onp
+
+_WORKLOAD = [
+    (onp.pronounce_number, (1234.5, "en")),
+    (onp.pronounce_number, (21, "pt")),
+    (onp.pronounce_number, (10 ** 6, "hu")),
+    (onp.pronounce_ordinal, (21, "fr")),
+    (onp.pronounce_fraction, ("3/4", "pt")),
+    (onp.extract_number, ("set a timer for twenty one minutes", "en")),
+    (onp.extract_number, ("einundzwanzig Katzen", "de")),
+    (onp.extract_numbers, ("vinte e um gatos e três cães", "pt")),
+    (onp.numbers_to_digits, ("dos mil veintitrés personas", "es")),
+    (onp.numbers_to_digits, ("было триста сорок два кота", "ru")),
+    (onp.is_ordinal, ("huszonegyedik", "hu")),
+    (onp.is_ordinal, ("kahdeskymmenesensimmäinen", "fi")),
+    (onp.is_ordinal, ("kahekümne esimene", "et")),
+    (onp.is_ordinal, ("enaindvajseti", "sl")),
+    (onp.is_ordinal, ("vingt-et-unième", "fr")),
+    (onp.is_fractional, ("quarter", "en")),
+    (onp.classify_tokens, (["three", "hundred", "and", "five"], "en")),
+    (lambda text, lang: "".join(onp.normalize_for_tts(text, lang)),
+     ("It was the 21st of 1.234 days.", "en")),
+]
+
+
+def _empty_lazy_tables():
+    onp._ORDINAL_REVERSE_CACHE.clear()
+    for code in ("hu", "fi", "et", "sl"):
+        module = importlib.import_module(f"ovos_number_parser.numbers_{code}")
+        getattr(module, f"_ordinal_reverse_{code}").cache_clear()
+    onp._token_index.cache_clear()
+    onp._tts_scanner.cache_clear()
+
+
+def _expected():
+    return [fn(*args) for fn, args in _WORKLOAD]
+
+
+def run(threads: int, seconds: float, expected) -> tuple:
+    """Call the workload round and round from ``threads`` threads for
+    ``seconds``; returns (calls, wrong results)."""
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    counts = [0] * threads
+    wrong = [0] * threads
+
+    def worker(slot):
+        barrier.wait()
+        calls = bad = 0
+        while not stop.is_set():
+            for (fn, args), want in zip(_WORKLOAD, expected):
+                if fn(*args) != want:
+                    bad += 1
+            calls += len(_WORKLOAD)
+        counts[slot] = calls
+        wrong[slot] = bad
+
+    pool = [threading.Thread(target=worker, args=(i,))
+            for i in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    time.sleep(seconds)
+    stop.set()
+    for t in pool:
+        t.join()
+    return sum(counts), sum(wrong)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("threads", type=int, nargs="*", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--cold", action="store_true",
+                        help="empty the lazy tables before each thread count")
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}")
+    expected = _expected()
+    if not args.cold:
+        onp.warmup(sorted({call[1] for _, call in _WORKLOAD}))
+
+    print(f"{'threads':>8} {'calls/s':>12} {'per thread':>12} "
+          f"{'speedup':>8} {'wrong':>6}")
+    base = None
+    for threads in args.threads:
+        if args.cold:
+            _empty_lazy_tables()
+        calls, wrong = run(threads, args.seconds, expected)
+        rate = calls / args.seconds
+        base = base or rate
+        print(f"{threads:>8} {rate:>12.0f} {rate / threads:>12.0f} "
+              f"{rate / base:>7.2f}x {wrong:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""``numbers_to_digits`` on long English transcripts.
+
+Meeting and dictation ASR output runs to tens of thousands of tokens with
+numbers scattered through it. The script builds two kinds of synthetic
+transcript of growing length: spoken-style sentences, and dictated digits
+and phone numbers, one number word after another with nothing between them.
+It times ``numbers_to_digits`` on each and reports the time per token. With
+a linear scanner the per-token cost stays flat as the transcript grows, and
+the fitted log-log slope stays close to 1 (2 would be quadratic). A slope
+above 1.2 on either kind is flagged, and the exit status is then 1.
+
+    python benchmarks/transcript_scaling.py                  # up to 20k tokens
+    python benchmarks/transcript_scaling.py 1000 10000 40000
+"""
+import math
+import random
+import sys
+import time
+
+from ovos_number_parser import numbers_to_digits
+
+_SENTENCES = [
+    "okay so let's start with the budget for the third quarter",
+    "we spent two hundred and forty five thousand dollars on hosting",
+    "that is up twelve percent from last year",
+    "the team closed ninety nine tickets in the last sprint",
+    "I think we need another five servers before the launch",
+    "can everyone make it at half past nine on the twenty first",
+    "the contract runs for three years with a one month notice period",
+    "my number is five five five one two three four",
+    "we hired seven people and two of them start next week",
+    "the report has one hundred and twelve pages so skim it",
+    "latency went down to forty milliseconds after the fix",
+    "let's take a quick break and come back in ten minutes",
+    "about one point five million users signed up in march",
+    "there were no questions so that wraps it up",
+]
+
+#: what a dictated phone number or account number is made of
+_DIGITS = ["zero", "one", "two", "three", "four", "five", "six", "seven",
+           "eight", "nine"]
+
+#: fitted exponent above which a kind of transcript is flagged
+THRESHOLD = 1.2
+
+
+def transcript(tokens, seed=0):
+    """A transcript of at least ``tokens`` words, made of random sentences."""
+    rnd = random.Random(seed)
+    words = []
+    while len(words) < tokens:
+        words.extend(rnd.choice(_SENTENCES).split())
+    return " ".join(words)
+
+
+def dictation(tokens, seed=0):
+    """``tokens`` number words back to back, as digits are dictated."""
+    rnd = random.Random(seed)
+    return " ".join(rnd.choice(_DIGITS) for _ in range(tokens))
+
+
+def measure(text, repeat=3):
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        numbers_to_digits(text, "en")
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(sizes):
+    numbers_to_digits("warm up with twenty one", "en")
+    flagged = []
+    for name, build in (("sentences", transcript), ("dictation", dictation)):
+        points = []
+        print(f"\n{name}\n{'tokens':>8} {'ms':>10} {'us/token':>10}")
+        for size in sizes:
+            text = build(size)
+            n = len(text.split())
+            seconds = measure(text)
+            points.append((n, seconds))
+            print(f"{n:>8} {seconds * 1000:>10.1f} {seconds / n * 1e6:>10.2f}")
+        if len(points) > 1:
+            (n0, t0), (n1, t1) = points[0], points[-1]
+            slope = math.log(t1 / t0) / math.log(n1 / n0)
+            print(f"scaling exponent: {slope:.2f} (1 = linear, 2 = quadratic)")
+            if slope > THRESHOLD:
+                flagged.append(f"{name}: exponent {slope:.2f}")
+    for line in flagged:
+        print(f"SUPERLINEAR {line}")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main([int(a) for a in sys.argv[1:]]
+                  or [1000, 2500, 5000, 10000, 20000]))
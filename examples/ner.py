@@ -1,47 +1,40 @@
 """NER: pull numeric entities out of free text.
 
-`extract_number` finds a number in a span of text; `is_fractional` and
-`is_ordinal` classify single tokens. Combine them with a tokenizer to tag the
+`extract_numbers` finds every number in a text, with its span;
+`classify_tokens` tags single tokens. Combine them with a tokenizer to tag the
 numeric mentions in a document -- no ML model, no OVOS stack required:
 
     pip install ovos-number-parser
     python ner.py
 """
-from ovos_number_parser import extract_number, is_fractional, is_ordinal
+from ovos_number_parser import TokenKind, classify_tokens, extract_numbers
 
 TEXT = (
     "The order shipped in three boxes weighing twelve kilos, "
     "the second box was late, and a quarter of the items were damaged."
 )
 
-# --- Sliding window: tag the numeric mention in each clause ----------------
-print("Per-clause numeric entities:")
-for clause in TEXT.split(","):
-    clause = clause.strip()
-    value = extract_number(clause, "en")
-    if value is not False:
-        print(f"  NUM  {value!s:6} <- {clause!r}")
+# --- One pass: tag every numeric mention with its character span ----------
+print("Numeric entities:")
+for number in extract_numbers(TEXT, "en", ordinals=True):
+    print(f"  NUM  {number.value!s:6} <- {number.text!r} "
+          f"[{number.char_start}:{number.char_end}]")
 
 # --- Token-level classification -------------------------------------------
 print("\nToken classification:")
-for token in ["three", "second", "quarter", "twelve", "damaged"]:
-    frac = is_fractional(token, "en")
-    ordn = is_ordinal(token, "en")
-    card = extract_number(token, "en")
-    if ordn is not False:
-        print(f"  {token:10} ORDINAL   -> {ordn}")
-    elif frac is not False:
-        print(f"  {token:10} FRACTION  -> {frac}")
-    elif card is not False:
-        print(f"  {token:10} CARDINAL  -> {card}")
-    else:
+tokens = ["three", "second", "quarter", "twelve", "damaged"]
+for token, kind, value in classify_tokens(tokens, "en"):
+    if kind is TokenKind.NONE:
         print(f"  {token:10} (not numeric)")
+    else:
+        print(f"  {token:10} {kind.name:9} -> {value}")
 
 # Expected output (verified):
-# Per-clause numeric entities (extract_number reads cardinals; "second" is an
-# ordinal, so that clause is classified at the token level below instead):
-#   NUM  3      <- 'The order shipped in three boxes weighing twelve kilos'
-#   NUM  0.25   <- 'and a quarter of the items were damaged.'
+# Numeric entities:
+#   NUM  3      <- 'three' [21:26]
+#   NUM  12     <- 'twelve' [42:48]
+#   NUM  2      <- 'second' [60:66]
+#   NUM  0.25   <- 'quarter' [87:94]
 #
 # Token classification:
 #   three      CARDINAL  -> 3
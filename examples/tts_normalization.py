@@ -9,29 +9,25 @@ Pure Python, no OVOS assistant stack required:
     pip install ovos-number-parser
     python tts_normalization.py
 
-`pronounce_number` handles cardinals, decimals, negatives and scientific
-notation. `pronounce_ordinal` (and `pronounce_number(..., ordinals=True)`)
+`normalize_for_tts` spells out every number of a text, a sentence at a time,
+reading decimals, thousands and ordinals ("21st", "2ª") the way the language
+writes them. `pronounce_number` handles cardinals, decimals, negatives and
+scientific notation. `pronounce_ordinal` (and `pronounce_number(..., ordinals=True)`)
 handle "1st, 2nd, 3rd". `pronounce_fraction` speaks fraction strings.
 """
-import re
-from ovos_number_parser import pronounce_number, pronounce_ordinal
-
-# --- Expand every standalone integer/decimal in a sentence ----------------
-def expand_numbers(text: str, lang: str = "en") -> str:
-    def repl(match):
-        raw = match.group(0)
-        value = float(raw) if "." in raw else int(raw)
-        return pronounce_number(value, lang)
-    return re.sub(r"-?\d+(?:\.\d+)?", repl, text)
-
-
-SENTENCES = [
-    "the invoice total is 1234.56 dollars",
-    "water boils at 100 degrees",
-    "the temperature dropped to -3.5 tonight",
-]
-for s in SENTENCES:
-    print(f"{s!r}\n   -> {expand_numbers(s)!r}\n")
+from ovos_number_parser import (normalize_for_tts, pronounce_number,
+                                pronounce_ordinal)
+
+# --- Expand every number in a text, sentence by sentence ------------------
+ARTICLE = ("The invoice total is 1,234.56 dollars. Water boils at 100 degrees. "
+           "It was the 21st night the temperature dropped to -3.5.")
+for sentence in normalize_for_tts(ARTICLE, "en"):
+    print(repr(sentence))
+print()
+
+# decimal comma and grouping point, as German writes them
+print("".join(normalize_for_tts("Die Rechnung beträgt 1.234,5 Euro.", "de")))
+print()
 
 # --- Cardinals, decimals, ordinals ----------------------------------------
 print("3.5            ->", pronounce_number(3.5, "en"))
@@ -40,14 +36,11 @@ print("ordinal 21     ->", pronounce_ordinal(21, "en"))
 print("5 (ordinal)    ->", pronounce_number(5, "en", ordinals=True))
 
 # Expected output (verified):
-# 'the invoice total is 1234.56 dollars'
-#    -> 'the invoice total is one thousand, two hundred and thirty four point five six dollars'
-#
-# 'water boils at 100 degrees'
-#    -> 'water boils at one hundred degrees'
+# 'The invoice total is one thousand, two hundred and thirty four point five six dollars. '
+# 'Water boils at one hundred degrees. '
+# 'It was the twenty-first night the temperature dropped to minus three point five.'
 #
-# 'the temperature dropped to -3.5 tonight'
-#    -> 'the temperature dropped to minus three point five tonight'
+# Die Rechnung beträgt eintausendzweihundertvierunddreißig Komma fünf Euro.
 #
 # 3.5            -> three point five
 # 2023           -> two thousand, twenty three
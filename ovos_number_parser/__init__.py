@@ -1,105 +1,222 @@
+import gc
+import importlib
 import math
+import os
 import re
+import threading
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable, Iterable, Iterator, List, Optional
 from typing import Union
 
-from unicode_rbnf import RbnfEngine, FormatPurpose
-
-from ovos_number_parser.numbers_ast import AST
-from ovos_number_parser.numbers_an import AN
-from ovos_number_parser.numbers_ar import pronounce_number_ar, pronounce_ordinal_ar, extract_number_ar, \
-    numbers_to_digits_ar, \
-    is_fractional_ar, is_ordinal_ar, nice_number_ar, resolve_ar_lang
-from ovos_number_parser.numbers_az import numbers_to_digits_az, extract_number_az, is_fractional_az, pronounce_number_az
-from ovos_number_parser.numbers_bg import numbers_to_digits_bg, pronounce_number_bg, extract_number_bg, \
-    is_fractional_bg, nice_number_bg
-from ovos_number_parser.numbers_ca import (numbers_to_digits_ca, pronounce_number_ca,
-    is_fractional_ca, extract_number_ca, CA)
-from ovos_number_parser.numbers_cs import numbers_to_digits_cs, pronounce_number_cs, is_fractional_cs, \
-    extract_number_cs, pronounce_ordinal_cs
-from ovos_number_parser.numbers_da import numbers_to_digits_da, pronounce_number_da, is_fractional_da, is_ordinal_da, \
-    pronounce_ordinal_da, extract_number_da
-from ovos_number_parser.numbers_de import numbers_to_digits_de, pronounce_number_de, pronounce_ordinal_de, \
-    is_ordinal_de, is_fractional_de, extract_number_de
-from ovos_number_parser.numbers_en import numbers_to_digits_en, is_ordinal_en, pronounce_number_en, extract_number_en, \
-    is_fractional_en
-from ovos_number_parser.numbers_el import pronounce_number_el, pronounce_ordinal_el, \
-    extract_number_el, is_fractional_el, is_ordinal_el
-from ovos_number_parser.numbers_es import (numbers_to_digits_es, pronounce_number_es, extract_number_es,
-                                           is_fractional_es, ES)
-from ovos_number_parser.numbers_eu import pronounce_number_eu, extract_number_eu, is_fractional_eu, \
-    pronounce_ordinal_eu, is_ordinal_eu
-from ovos_number_parser.numbers_et import pronounce_number_et, pronounce_ordinal_et, extract_number_et, \
-    is_fractional_et, is_ordinal_et, nice_number_et
-from ovos_number_parser.numbers_fa import pronounce_number_fa, extract_number_fa, is_fractional_fa, \
-    pronounce_ordinal_fa
-from ovos_number_parser.numbers_fi import pronounce_number_fi, pronounce_ordinal_fi, extract_number_fi, \
-    is_fractional_fi, is_ordinal_fi, nice_number_fi
-from ovos_number_parser.numbers_fr import (extract_number_fr, is_fractional_fr, FR)
-from ovos_number_parser.numbers_fy import numbers_to_digits_fy, pronounce_number_fy, pronounce_ordinal_fy, \
-    extract_number_fy, is_fractional_fy, nice_number_fy
-from ovos_number_parser.numbers_gl import GL, pronounce_number_gl, extract_number_gl, is_fractional_gl, \
-    numbers_to_digits_gl, pronounce_ordinal_gl, is_ordinal_gl, pronounce_fraction_gl
-from ovos_number_parser.numbers_hr import pronounce_number_hr, pronounce_ordinal_hr, extract_number_hr, \
-    is_fractional_hr, nice_number_hr, numbers_to_digits_hr
-from ovos_number_parser.numbers_he import pronounce_number_he, pronounce_ordinal_he, \
-    extract_number_he, is_fractional_he, is_ordinal_he, nice_number_he
-from ovos_number_parser.numbers_hu import pronounce_number_hu, pronounce_ordinal_hu, extract_number_hu, \
-    is_fractional_hu, is_ordinal_hu, nice_number_hu
-from ovos_number_parser.numbers_id import (pronounce_number_id, pronounce_number_ms,
-                                           pronounce_ordinal_id, pronounce_ordinal_ms,
-                                           extract_number_id, extract_number_ms,
-                                           is_fractional_id, is_fractional_ms,
-                                           nice_number_id, nice_number_ms,
-                                           numbers_to_digits_id, numbers_to_digits_ms)
-from ovos_number_parser.numbers_it import (extract_number_it, pronounce_number_it, is_fractional_it, IT)
-from ovos_number_parser.numbers_kab import (pronounce_number_kab, pronounce_ordinal_kab, extract_number_kab,
-                                             is_fractional_kab, is_ordinal_kab, numbers_to_digits_kab)
-from ovos_number_parser.numbers_mwl import MWL
-from ovos_number_parser.numbers_oc import OC
-from ovos_number_parser.numbers_nb import (nice_number_nb, pronounce_number_nb,
-                                           pronounce_ordinal_nb, is_ordinal_nb,
-                                           is_fractional_nb, extract_number_nb,
-                                           numbers_to_digits_nb)
-from ovos_number_parser.numbers_nn import (nice_number_nn, pronounce_number_nn,
-                                           pronounce_ordinal_nn, is_ordinal_nn,
-                                           is_fractional_nn, extract_number_nn,
-                                           numbers_to_digits_nn)
-from ovos_number_parser.numbers_nl import numbers_to_digits_nl, pronounce_number_nl, pronounce_ordinal_nl, \
-    extract_number_nl, is_fractional_nl
-from ovos_number_parser.numbers_pl import numbers_to_digits_pl, pronounce_number_pl, extract_number_pl, \
-    is_fractional_pl, pronounce_ordinal_pl
-from ovos_number_parser.numbers_pt import PortugueseVariant, PT_PT, PT_BR
-from ovos_number_parser.numbers_ro import RO
-from ovos_number_parser.numbers_ru import numbers_to_digits_ru, pronounce_number_ru, extract_number_ru, is_fractional_ru
-from ovos_number_parser.numbers_sk import numbers_to_digits_sk, pronounce_number_sk, is_fractional_sk, \
-    extract_number_sk, pronounce_ordinal_sk, nice_number_sk
-from ovos_number_parser.numbers_sl import pronounce_number_sl, extract_number_sl, is_fractional_sl, \
-    is_ordinal_sl, nice_number_sl
-from ovos_number_parser.numbers_sv import pronounce_number_sv, pronounce_ordinal_sv, extract_number_sv, \
-    is_fractional_sv
-from ovos_number_parser.numbers_tr import numbers_to_digits_tr, pronounce_number_tr, \
-    pronounce_ordinal_tr, extract_number_tr, is_fractional_tr, nice_number_tr
-from ovos_number_parser.numbers_uk import numbers_to_digits_uk, pronounce_number_uk, extract_number_uk, \
-    is_fractional_uk, pronounce_ordinal_uk
-from ovos_number_parser.numbers_az import nice_number_az
-from ovos_number_parser.numbers_ca import nice_number_ca
-from ovos_number_parser.numbers_cs import nice_number_cs
-from ovos_number_parser.numbers_da import nice_number_da
-from ovos_number_parser.numbers_de import nice_number_de
-from ovos_number_parser.numbers_el import nice_number_el
-from ovos_number_parser.numbers_es import nice_number_es
-from ovos_number_parser.numbers_eu import nice_number_eu
-from ovos_number_parser.numbers_fa import nice_number_fa
-from ovos_number_parser.numbers_fr import nice_number_fr
-from ovos_number_parser.numbers_it import nice_number_it
-from ovos_number_parser.numbers_nl import nice_number_nl
-from ovos_number_parser.numbers_pl import nice_number_pl
-from ovos_number_parser.numbers_ru import nice_number_ru
-from ovos_number_parser.numbers_sv import nice_number_sv
-from ovos_number_parser.numbers_uk import nice_number_uk
-from ovos_number_parser.util import Scale, GrammaticalGender, DigitPronunciation
+from ovos_number_parser.util import Scale, GrammaticalGender, DigitPronunciation, \
+    ClassifiedToken, ExtractedNumber, Token, TokenKind, tokenize
+
+
+# --- lazy per-language exports ---------------------------------------------
+#
+# The per-language modules build their lookup tables at import time, and a
+# process usually serves one or two languages, so none of them is imported
+# here. Their public names stay importable from the top-level package
+# (``from ovos_number_parser import pronounce_number_de``): the module that
+# defines a name is only imported the first time the name is looked up, via
+# the module-level ``__getattr__`` (PEP 562). unicode-rbnf is only needed by
+# the fallback for languages without a native backend and is deferred the
+# same way.
+_LAZY_MODULES = {
+    "numbers_an": ("AN",),
+    "numbers_ar": ("pronounce_number_ar", "pronounce_ordinal_ar",
+                   "extract_number_ar", "numbers_to_digits_ar",
+                   "is_fractional_ar", "is_ordinal_ar", "nice_number_ar",
+                   "resolve_ar_lang"),
+    "numbers_ast": ("AST",),
+    "numbers_az": ("numbers_to_digits_az", "extract_number_az",
+                   "is_fractional_az", "pronounce_number_az",
+                   "nice_number_az"),
+    "numbers_bg": ("numbers_to_digits_bg", "pronounce_number_bg",
+                   "extract_number_bg", "is_fractional_bg", "nice_number_bg"),
+    "numbers_ca": ("numbers_to_digits_ca", "pronounce_number_ca",
+                   "is_fractional_ca", "extract_number_ca", "CA",
+                   "nice_number_ca"),
+    "numbers_cs": ("numbers_to_digits_cs", "pronounce_number_cs",
+                   "is_fractional_cs", "extract_number_cs",
+                   "pronounce_ordinal_cs", "nice_number_cs"),
+    "numbers_da": ("numbers_to_digits_da", "pronounce_number_da",
+                   "is_fractional_da", "is_ordinal_da", "pronounce_ordinal_da",
+                   "extract_number_da", "nice_number_da"),
+    "numbers_de": ("numbers_to_digits_de", "pronounce_number_de",
+                   "pronounce_ordinal_de", "is_ordinal_de", "is_fractional_de",
+                   "extract_number_de", "nice_number_de"),
+    "numbers_el": ("pronounce_number_el", "pronounce_ordinal_el",
+                   "extract_number_el", "is_fractional_el", "is_ordinal_el",
+                   "nice_number_el"),
+    "numbers_en": ("numbers_to_digits_en", "is_ordinal_en",
+                   "pronounce_number_en", "extract_number_en",
+                   "is_fractional_en"),
+    "numbers_es": ("numbers_to_digits_es", "pronounce_number_es",
+                   "extract_number_es", "is_fractional_es", "ES",
+                   "nice_number_es"),
+    "numbers_et": ("pronounce_number_et", "pronounce_ordinal_et",
+                   "extract_number_et", "is_fractional_et", "is_ordinal_et",
+                   "nice_number_et"),
+    "numbers_eu": ("pronounce_number_eu", "extract_number_eu",
+                   "is_fractional_eu", "pronounce_ordinal_eu", "is_ordinal_eu",
+                   "nice_number_eu"),
+    "numbers_fa": ("pronounce_number_fa", "extract_number_fa",
+                   "is_fractional_fa", "pronounce_ordinal_fa",
+                   "nice_number_fa"),
+    "numbers_fi": ("pronounce_number_fi", "pronounce_ordinal_fi",
+                   "extract_number_fi", "is_fractional_fi", "is_ordinal_fi",
+                   "nice_number_fi"),
+    "numbers_fr": ("extract_number_fr", "is_fractional_fr", "FR",
+                   "nice_number_fr"),
+    "numbers_fy": ("numbers_to_digits_fy", "pronounce_number_fy",
+                   "pronounce_ordinal_fy", "extract_number_fy",
+                   "is_fractional_fy", "nice_number_fy"),
+    "numbers_gl": ("GL", "pronounce_number_gl", "extract_number_gl",
+                   "is_fractional_gl", "numbers_to_digits_gl",
+                   "pronounce_ordinal_gl", "is_ordinal_gl",
+                   "pronounce_fraction_gl"),
+    "numbers_he": ("pronounce_number_he", "pronounce_ordinal_he",
+                   "extract_number_he", "is_fractional_he", "is_ordinal_he",
+                   "nice_number_he"),
+    "numbers_hr": ("pronounce_number_hr", "pronounce_ordinal_hr",
+                   "extract_number_hr", "is_fractional_hr", "nice_number_hr",
+                   "numbers_to_digits_hr"),
+    "numbers_hu": ("pronounce_number_hu", "pronounce_ordinal_hu",
+                   "extract_number_hu", "is_fractional_hu", "is_ordinal_hu",
+                   "nice_number_hu"),
+    "numbers_id": ("pronounce_number_id", "pronounce_number_ms",
+                   "pronounce_ordinal_id", "pronounce_ordinal_ms",
+                   "extract_number_id", "extract_number_ms",
+                   "is_fractional_id", "is_fractional_ms", "nice_number_id",
+                   "nice_number_ms", "numbers_to_digits_id",
+                   "numbers_to_digits_ms"),
+    "numbers_it": ("extract_number_it", "pronounce_number_it",
+                   "is_fractional_it", "IT", "nice_number_it"),
+    "numbers_kab": ("pronounce_number_kab", "pronounce_ordinal_kab",
+                    "extract_number_kab", "is_fractional_kab",
+                    "is_ordinal_kab", "numbers_to_digits_kab"),
+    "numbers_mwl": ("MWL",),
+    "numbers_nb": ("nice_number_nb", "pronounce_number_nb",
+                   "pronounce_ordinal_nb", "is_ordinal_nb", "is_fractional_nb",
+                   "extract_number_nb", "numbers_to_digits_nb"),
+    "numbers_nl": ("numbers_to_digits_nl", "pronounce_number_nl",
+                   "pronounce_ordinal_nl", "extract_number_nl",
+                   "is_fractional_nl", "nice_number_nl"),
+    "numbers_nn": ("nice_number_nn", "pronounce_number_nn",
+                   "pronounce_ordinal_nn", "is_ordinal_nn", "is_fractional_nn",
+                   "extract_number_nn", "numbers_to_digits_nn"),
+    "numbers_oc": ("OC",),
+    "numbers_pl": ("numbers_to_digits_pl", "pronounce_number_pl",
+                   "extract_number_pl", "is_fractional_pl",
+                   "pronounce_ordinal_pl", "nice_number_pl"),
+    "numbers_pt": ("PortugueseVariant", "PT_PT", "PT_BR"),
+    "numbers_ro": ("RO",),
+    "numbers_ru": ("numbers_to_digits_ru", "pronounce_number_ru",
+                   "extract_number_ru", "is_fractional_ru", "nice_number_ru"),
+    "numbers_sk": ("numbers_to_digits_sk", "pronounce_number_sk",
+                   "is_fractional_sk", "extract_number_sk",
+                   "pronounce_ordinal_sk", "nice_number_sk"),
+    "numbers_sl": ("pronounce_number_sl", "extract_number_sl",
+                   "is_fractional_sl", "is_ordinal_sl", "nice_number_sl"),
+    "numbers_sv": ("pronounce_number_sv", "pronounce_ordinal_sv",
+                   "extract_number_sv", "is_fractional_sv", "nice_number_sv"),
+    "numbers_tr": ("numbers_to_digits_tr", "pronounce_number_tr",
+                   "pronounce_ordinal_tr", "extract_number_tr",
+                   "is_fractional_tr", "nice_number_tr"),
+    "numbers_uk": ("numbers_to_digits_uk", "pronounce_number_uk",
+                   "extract_number_uk", "is_fractional_uk",
+                   "pronounce_ordinal_uk", "nice_number_uk"),
+    "unicode_rbnf": ("RbnfEngine", "FormatPurpose"),
+}
+_LAZY_ATTRS = {name: module for module, names in _LAZY_MODULES.items()
+               for name in names}
+
+
+def _load(name: str):
+    """Resolve a lazily exported name, importing its module on first use."""
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    module = _LAZY_ATTRS[name]
+    if module.startswith("numbers_"):
+        module = f"{__name__}.{module}"
+    value = getattr(importlib.import_module(module), name)
+    # cache it as a real module attribute so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# --- language registry ------------------------------------------------------
+#
+# Every dispatcher used to walk its own chain of ``lang.startswith(...)``
+# checks, which costs up to one string comparison per supported language on
+# every call. A tag is now resolved once to the backend that serves it and the
+# answer is cached, so each dispatcher does a single table lookup instead.
+
+#: prefixes that select a native backend, matched against the lower-cased tag
+#: the same way the old ``lang.startswith`` chains did. None is a prefix of
+#: another, so the match does not depend on order.
+_BACKEND_PREFIXES = (
+    "an", "ast", "az", "bg", "ca", "cs", "da", "de", "el", "en", "es", "et",
+    "eu", "fa", "fi", "fr", "fy", "gl", "he", "hr", "hu", "id", "it", "kab",
+    "ms", "mwl", "nb", "nl", "nn", "no", "oc", "pl", "pt", "ro", "ru", "sk",
+    "sl", "sv", "tr", "uk",
+)
+
+
+@dataclass(frozen=True)
+class _Language:
+    """The backend a language tag resolves to."""
+    #: backend key the dispatch tables are indexed by: the language prefix,
+    #: "pt-br" for Brazilian Portuguese, "nb" for the "no" alias and "ar" for
+    #: every Arabic lect
+    code: str
+    #: default pronunciation register of an Arabic lect, None elsewhere
+    ar_case: Optional[str] = None
+
+
+@lru_cache(maxsize=512)
+def _resolve_lang(lang: str) -> Optional[_Language]:
+    """Resolve a BCP-47 tag to its backend, or None if no native backend
+    serves it."""
+    tag = lang.lower()
+    for prefix in _BACKEND_PREFIXES:
+        if tag.startswith(prefix):
+            if prefix == "no":
+                return _Language("nb")
+            if prefix == "pt" and "br" in tag:
+                return _Language("pt-br")
+            return _Language(prefix)
+    # Arabic lects are matched on the whole primary subtag, not a prefix
+    # (see numbers_ar.resolve_ar_lang); no Arabic code starts with one of the
+    # prefixes above, so checking them last changes nothing
+    ar_case = _load("resolve_ar_lang")(lang)
+    if ar_case is not None:
+        return _Language("ar", ar_case)
+    return None
+
+
+def _backend_code(lang: str) -> Optional[str]:
+    """Backend key for ``lang``, or None when only a fallback can serve it."""
+    info = _resolve_lang(lang)
+    return info.code if info is not None else None
 
 
 # --- canonical short/long scale convention per language --------------------
@@ -158,20 +275,13 @@ def _resolve_scale(lang: str,
 
 # --- generic language fallbacks -------------------------------------------
 
+#: nice_number formatter per language, by name so the fallback below only
+#: imports the language it is asked about
 _NICE_NUMBER_FNS = {
-    "ar": nice_number_ar, "az": nice_number_az, "bg": nice_number_bg,
-    "ca": nice_number_ca, "cs": nice_number_cs,
-    "da": nice_number_da, "de": nice_number_de, "el": nice_number_el,
-    "es": nice_number_es,
-    "et": nice_number_et, "eu": nice_number_eu, "fa": nice_number_fa,
-    "fi": nice_number_fi, "fr": nice_number_fr, "fy": nice_number_fy,
-    "he": nice_number_he, "hr": nice_number_hr,
-    "hu": nice_number_hu, "id": nice_number_id, "it": nice_number_it,
-    "ms": nice_number_ms, "nb": nice_number_nb, "nl": nice_number_nl,
-    "nn": nice_number_nn,
-    "pl": nice_number_pl, "ru": nice_number_ru, "sk": nice_number_sk, "sl": nice_number_sl,
-    "sv": nice_number_sv, "tr": nice_number_tr,
-    "uk": nice_number_uk,
+    lang: f"nice_number_{lang}" for lang in (
+        "ar", "az", "bg", "ca", "cs", "da", "de", "el", "es", "et", "eu",
+        "fa", "fi", "fr", "fy", "he", "hr", "hu", "id", "it", "ms", "nb",
+        "nl", "nn", "pl", "ru", "sk", "sl", "sv", "tr", "uk")
 }
 
 # fraction nouns take feminine numerals in the Slavic languages and the
@@ -189,17 +299,23 @@ _FRACTION_NUMERATOR_OVERRIDES = {
 
 # words that may join two spoken numbers ("vingt et un", "sto in ena")
 _NUMBER_CONNECTORS = {
-    "ar": {"و"}, "bg": {"и"}, "ca": {"i"}, "da": {"og"}, "en": {"and"}, "es": {"y"}, "eu": {"eta"},
+    "ar": {"و"}, "bg": {"и"}, "ca": {"i"}, "da": {"og"}, "de": {"und"}, "en": {"and"},
+    "es": {"y"}, "eu": {"eta"},
     # standard Italian cardinals carry no conjunction ("venticinque", not
     # "venti e cinque"), so "e" separates two numbers rather than joining them
-    "fr": {"et"}, "fy": {"en"}, "it": set(), "nl": {"en"}, "sv": {"och"},
+    "fr": {"et"}, "fy": {"en"}, "it": set(), "nb": {"og"}, "nl": {"en"},
+    "nn": {"og"}, "sv": {"och"},
     "fa": {"و"}, "hr": {"i"}, "sl": {"in"}, "hu": set(), "fi": set(),
     "et": set(), "kab": {"u", "d", "ed"},
 }
 
 
+@lru_cache(maxsize=128)
 def _minus_word(lang: str) -> str:
-    """The language's spoken minus sign, derived from pronounce_number."""
+    """The language's spoken minus sign, derived from pronounce_number.
+
+    Cached: it costs a full pronounce_number call and never changes.
+    """
     spoken = pronounce_number(-1, lang)
     return spoken.split()[0] if " " in spoken else ""
 
@@ -218,8 +334,32 @@ def _pronounce_fraction_generic(fraction_word: str, lang: str) -> str:
         raise ZeroDivisionError(f"denominator is zero: {fraction_word}")
     negative = (n1 < 0) ^ (n2 < 0)
     n1, n2 = abs(n1), abs(n2)
-    lang2 = lang.lower().split("-")[0]
+    result = None
+    if _PRONOUNCE_TABLES.enabled and 1 <= n1 < n2 <= _TABLE_FRACTION_LIMIT:
+        width = _TABLE_FRACTION_LIMIT + 1
+        result = _PRONOUNCE_TABLES.lookup(
+            ("fraction", lang), n2 * width + n1, width * width,
+            lambda i: _fraction_table_entry(i, lang)) or None
+    if result is None:
+        result = _pronounce_unsigned_fraction(n1, n2, lang)
+    if negative:
+        minus = _minus_word(lang)
+        result = f"{minus} {result}" if minus else f"-{result}"
+    return result
 
+
+def _fraction_table_entry(i: int, lang: str) -> str:
+    """Entry ``i`` of a fraction table: n1/n2 sits at ``n2 * 21 + n1``, and
+    only proper fractions are tabled."""
+    n2, n1 = divmod(i, _TABLE_FRACTION_LIMIT + 1)
+    if not 1 <= n1 < n2:
+        return ""
+    return _pronounce_unsigned_fraction(n1, n2, lang)
+
+
+def _pronounce_unsigned_fraction(n1: int, n2: int, lang: str) -> str:
+    """The reading of ``n1/n2`` for non-negative ``n1`` and positive ``n2``."""
+    lang2 = lang.lower().split("-")[0]
     result = None
     if lang2 == "en":
         if n2 == 2:
@@ -232,9 +372,10 @@ def _pronounce_fraction_generic(fraction_word: str, lang: str) -> str:
                 denom += "s"
         result = f"{pronounce_number(n1, lang)} {denom}"
     else:
-        nice_fn = _NICE_NUMBER_FNS.get(lang2) or \
-            (nice_number_ar if _is_ar(lang) else None)
-        if nice_fn and 2 <= n2 <= 20:
+        nice_name = _NICE_NUMBER_FNS.get(lang2) or \
+            ("nice_number_ar" if _is_ar(lang) else None)
+        if nice_name and 2 <= n2 <= 20:
+            nice_fn = _load(nice_name)
             spoken = nice_fn(n1 / n2, speech=True, denominators=[n2])
             tokens = spoken.split()
             if "/" not in spoken and \
@@ -248,9 +389,6 @@ def _pronounce_fraction_generic(fraction_word: str, lang: str) -> str:
     if result is None:
         # approximate: cardinal numerator + ordinal denominator
         result = f"{pronounce_number(n1, lang)} {pronounce_ordinal(n2, lang)}"
-    if negative:
-        minus = _minus_word(lang)
-        result = f"{minus} {result}" if minus else f"-{result}"
     return result
 
 
@@ -276,6 +414,8 @@ def _is_ordinal_generic(input_str: str, lang: str):
                 table.setdefault(word[:-1] + "o", n)
             elif word.endswith("o"):
                 table.setdefault(word[:-1] + "a", n)
+        # published whole, so a concurrent caller finds no table or a
+        # complete one, never a half-built one
         _ORDINAL_REVERSE_CACHE[lang2] = table
     return _ORDINAL_REVERSE_CACHE[lang2].get(input_str.lower().strip(), False)
 
@@ -296,26 +436,80 @@ def _is_digit_run(token: str) -> bool:
     return bool(token) and all(c in _DIGIT_CHARS for c in token)
 
 
+# ASCII plus Arabic comma, semicolon and question mark, so a number glued
+# to punctuation ("٢٠٢٤،", "25.") is still recognised and the mark is
+# carried over onto the digits instead of being dropped
+_SPAN_PUNCT = ".,!?;:؟،؛"
+
+
 def _numbers_to_digits_generic(utterance: str, lang: str) -> str:
     """Fallback that replaces spoken number spans with digits using
     extract_number over maximal runs of number words."""
+    tokens = utterance.split()
+    out = []
+    i = 0
+    for start, end, val in _generic_number_spans(tokens, lang):
+        out.extend(tokens[i:start])
+        last = tokens[end - 1]
+        stripped = last.rstrip(_SPAN_PUNCT)
+        trail = last[len(stripped):]
+        core = tokens[start].strip(_SPAN_PUNCT)
+        if end - start == 1 and _is_digit_run(core):
+            # Already digits ("007", "٠٥٥٣١٧٥٨١٧"): keep every character.
+            # Re-reading through extract_number would go via int() and strip
+            # leading zeros — corrupting phone numbers, OTP codes and other
+            # zero-padded identifiers. Digit runs are only re-read when they
+            # combine with neighbouring number words ("355 ألف" → 355000),
+            # which reaches the else branch as a longer span.
+            out.append(core.translate(_TO_WESTERN_DIGITS) + trail)
+        else:
+            out.append(f"{val}{trail}")
+        i = end
+    out.extend(tokens[i:])
+    return " ".join(out)
+
+
+def _generic_number_spans(tokens: List[str], lang: str,
+                          ordinals: bool = False,
+                          scale: Optional[Scale] = None,
+                          read_through: bool = False):
+    """Yield ``(start, end, value)`` for every maximal run of number words in
+    ``tokens[start:end]``, read with extract_number.
+
+    With ``read_through``, a span may also take in a word that is no number
+    by itself when the longer reading is a larger number ("dua puluh" = 20),
+    and a decimal marker between two numerals ("tres coma cinco" = 3.5).
+
+    A span is grown one word (or connector and word) at a time, and only the
+    grown span is read again: the value of the span so far is carried along,
+    and every word or text is read at most once per call."""
     lang2 = lang.lower().split("-")[0]
     connectors = _NUMBER_CONNECTORS.get("ar" if _is_ar(lang) else lang2, set())
-    tokens = utterance.split()
-    # ASCII plus Arabic comma, semicolon and question mark, so a number glued
-    # to punctuation ("٢٠٢٤،", "25.") is still recognised and the mark is
-    # carried over onto the digits instead of being dropped
-    punct = ".,!?;:؟،؛"
+    punct = _SPAN_PUNCT
+    values = {}
+    numerals = {}
 
     def _clean(t):
         return t.strip(punct).lower()
 
+    def _value(text):
+        """extract_number(text, lang), read once per call."""
+        if text not in values:
+            values[text] = extract_number(text, lang, ordinals=ordinals,
+                                          scale=scale)
+        return values[text]
+
     def _is_num(t):
         c = _clean(t)
+        if c not in numerals:
+            numerals[c] = _is_numeral(c)
+        return numerals[c]
+
+    def _is_numeral(c):
         if not c:
             return False
         try:
-            if extract_number(c, lang) is False:
+            if _value(c) is False or _value(c) is None:
                 return False
         except NotImplementedError:
             return False
@@ -328,77 +522,115 @@ def _numbers_to_digits_generic(utterance: str, lang: str) -> str:
                 if not part or part in connectors:
                     continue
                 try:
-                    if extract_number(part, lang) is False:
+                    if _value(part) is False or _value(part) is None:
                         return False
                 except NotImplementedError:
                     return False
         return True
 
-    out = []
     i = 0
     while i < len(tokens):
         if not _is_num(tokens[i]):
-            out.append(tokens[i])
             i += 1
             continue
         j = i
+        current = _clean(tokens[i])
+        current_val = _value(current)
 
-        def _continues(next_j, via_connector=False):
+        def _extend(next_j, via_connector=False):
             """The span only grows if the combined words form one larger
             number ("vingt et un" = 21) rather than two separate numbers
-            ("due e tre")."""
-            extended = " ".join(_clean(t) for t in tokens[i:next_j + 1])
-            current = " ".join(_clean(t) for t in tokens[i:j + 1])
-            extended_val = extract_number(extended, lang)
+            ("due e tre"). Returns the grown span and its value, or None."""
+            extended = " ".join([current] + [_clean(t)
+                                             for t in tokens[j + 1:next_j + 1]])
+            extended_val = _value(extended)
             if extended_val is False or extended_val is None:
-                return False
-            current_val = extract_number(current, lang)
-            next_val = extract_number(_clean(tokens[next_j]), lang)
+                return None
+            next_val = _value(_clean(tokens[next_j]))
             if current_val is False or current_val is None:
-                return False
+                return None
             if extended_val == current_val \
                     or abs(extended_val) <= abs(current_val):
-                return False
+                return None
             if extended_val != next_val:
-                return True
+                return extended, extended_val
             # "one hundred": multiplying a scale word by one leaves the value
             # unchanged, so the value comparison above cannot tell that the
             # multiplier is grammatically required. Directly adjacent to a
             # scale word it is, so the span must keep growing; behind a
             # connector ("one and three") it is a separate number and must
             # not be absorbed.
-            return not via_connector and abs(current_val) == 1 \
-                and next_val is not False and next_val is not None \
-                and abs(next_val) >= 100
+            if not via_connector and abs(current_val) == 1 \
+                    and next_val is not False and next_val is not None \
+                    and abs(next_val) >= 100:
+                return extended, extended_val
+            return None
 
         while j + 1 < len(tokens):
-            if _is_num(tokens[j + 1]) and _continues(j + 1):
-                j += 1
-            elif _clean(tokens[j + 1]) in connectors and j + 2 < len(tokens) \
-                    and _is_num(tokens[j + 2]) \
-                    and _continues(j + 2, via_connector=True):
-                j += 2
-            else:
+            grown = None
+            step = 1
+            if _is_num(tokens[j + 1]):
+                grown = _extend(j + 1)
+            elif read_through and _clean(tokens[j + 1]) not in connectors:
+                # a word that is no number by itself may still be part of
+                # one ("dua puluh" = 20, "tiga belas" = 13)
+                grown = _extend(j + 1)
+            if grown is None and _clean(tokens[j + 1]) in connectors \
+                    and j + 2 < len(tokens) and _is_num(tokens[j + 2]):
+                grown = _extend(j + 2, via_connector=True)
+                step = 2
+            elif grown is None and read_through and j + 2 < len(tokens) \
+                    and not _is_num(tokens[j + 1]) and _is_num(tokens[j + 2]):
+                # a decimal marker ("tres coma cinco" = 3.5) is the one
+                # other word that may sit between two numerals
+                grown = _extend(j + 2, via_connector=True)
+                if grown is not None and float(grown[1]).is_integer():
+                    grown = None
+                step = 2
+            if grown is None:
                 break
-        stripped = tokens[j].rstrip(punct)
-        trail = tokens[j][len(stripped):]
-        single_token = i == j
-        if single_token and _is_digit_run(_clean(tokens[i])):
-            # Already digits ("007", "٠٥٥٣١٧٥٨١٧"): keep every character.
-            # Re-reading through extract_number would go via int() and strip
-            # leading zeros — corrupting phone numbers, OTP codes and other
-            # zero-padded identifiers. Digit runs are only re-read when they
-            # combine with neighbouring number words ("355 ألف" → 355000),
-            # which is the multi-token branch below.
-            out.append(_clean(tokens[i]).translate(_TO_WESTERN_DIGITS) + trail)
-        else:
-            span = " ".join(_clean(t) for t in tokens[i:j + 1])
-            val = extract_number(span, lang)
-            if isinstance(val, float) and val.is_integer():
-                val = int(val)
-            out.append(f"{val}{trail}")
+            current, current_val = grown
+            j += step
+        val = current_val
+        if isinstance(val, float) and val.is_integer():
+            val = int(val)
+        yield i, j + 1, val
         i = j + 1
-    return " ".join(out)
+
+
+def _numbers_to_digits_plain(name):
+    """``numbers_to_digits_<code>(utterance)``"""
+    return lambda utterance, lang, scale: _load(name)(utterance)
+
+
+def _numbers_to_digits_with_engine(engine, with_scale=True):
+    """``<ENGINE>.numbers_to_digits(utterance[, scale=scale])``"""
+    if with_scale:
+        return lambda utterance, lang, scale: \
+            _load(engine).numbers_to_digits(utterance, scale=scale)
+    return lambda utterance, lang, scale: \
+        _load(engine).numbers_to_digits(utterance)
+
+
+#: numbers_to_digits backend per language; anything else uses
+#: _numbers_to_digits_generic
+_NUMBERS_TO_DIGITS = {
+    # English has its own converter, which reads compound ordinals
+    # ("the twenty fifth" -> 25) and never mistakes a singular ordinal for a
+    # fraction. The generic fallback did neither.
+    "en": lambda utterance, lang, scale: _load("numbers_to_digits_en")(
+        utterance, short_scale=scale == Scale.SHORT),
+    "ar": lambda utterance, lang, scale: _load("numbers_to_digits_ar")(
+        utterance, lang),
+    "an": _numbers_to_digits_with_engine("AN", with_scale=False),
+    "ast": _numbers_to_digits_with_engine("AST", with_scale=False),
+    **{code: _numbers_to_digits_with_engine(engine) for code, engine in (
+        ("mwl", "MWL"), ("oc", "OC"), ("pt", "PT_PT"), ("pt-br", "PT_PT"),
+        ("ro", "RO"))},
+    **{code: _numbers_to_digits_plain(f"numbers_to_digits_{code}") for code in (
+        "bg", "de", "fy", "gl", "hr", "id", "kab", "ms", "ru", "sk", "tr",
+        "uk")},
+}
 
 
 def numbers_to_digits(utterance: str, lang: str, scale: Optional[Scale] = None) -> str:
@@ -417,50 +649,10 @@ def numbers_to_digits(utterance: str, lang: str, scale: Optional[Scale] = None)
         NotImplementedError: If the specified language is not supported.
     """
     scale = _resolve_scale(lang, scale)
-    if lang.startswith("en"):
-        # English has its own converter, which reads compound ordinals
-        # ("the twenty fifth" -> 25) and never mistakes a singular ordinal for a
-        # fraction. The generic fallback did neither.
-        return numbers_to_digits_en(utterance, short_scale=scale == Scale.SHORT)
-    if lang.startswith("ast"):
-        return AST.numbers_to_digits(utterance)
-    if lang.startswith("oc"):
-        return OC.numbers_to_digits(utterance, scale=scale)
-    if lang.startswith("an"):
-        return AN.numbers_to_digits(utterance)
-    if lang.startswith("fy"):
-        return numbers_to_digits_fy(utterance)
-    if lang.startswith("gl"):
-        return numbers_to_digits_gl(utterance)
-    if lang.startswith("de"):
-        return numbers_to_digits_de(utterance)
-    if lang.startswith("pt"):
-        return PT_PT.numbers_to_digits(utterance, scale=scale)
-    if lang.startswith("mwl"):
-        return MWL.numbers_to_digits(utterance, scale=scale)
-    if lang.startswith("ro"):
-        return RO.numbers_to_digits(utterance, scale=scale)
-    if lang.startswith("bg"):
-        return numbers_to_digits_bg(utterance)
-    if lang.startswith("hr"):
-        return numbers_to_digits_hr(utterance)
-    if lang.startswith("ru"):
-        return numbers_to_digits_ru(utterance)
-    if lang.startswith("sk"):
-        return numbers_to_digits_sk(utterance)
-    if lang.startswith("id"):
-        return numbers_to_digits_id(utterance)
-    if lang.startswith("ms"):
-        return numbers_to_digits_ms(utterance)
-    if lang.startswith("tr"):
-        return numbers_to_digits_tr(utterance)
-    if lang.startswith("uk"):
-        return numbers_to_digits_uk(utterance)
-    if _is_ar(lang):
-        return numbers_to_digits_ar(utterance, lang)
-    if lang.startswith("kab"):
-        return numbers_to_digits_kab(utterance)
-    return _numbers_to_digits_generic(utterance, lang)
+    backend = _NUMBERS_TO_DIGITS.get(_backend_code(lang))
+    if backend is None:
+        return _numbers_to_digits_generic(utterance, lang)
+    return backend(utterance, lang, scale)
 
 
 # Connectives for the a+bi complex form, per language, English as the default.
@@ -600,12 +792,7 @@ def _is_ar(lang: str) -> bool:
     whose code does not happen to start with "ar" (``acw``, ``afb``,
     ``apc``, ``ajp``, ``acm``).
     """
-    return resolve_ar_lang(lang) is not None
-
-
-def _ar_default_case(lang: str) -> str:
-    """Default pronunciation register for an Arabic ``lang`` code."""
-    return resolve_ar_lang(lang) or "nominative"
+    return _backend_code(lang) == "ar"
 
 
 def _pronounce_infinity(number: float, lang: str) -> str:
@@ -623,6 +810,12 @@ _DEFAULT_DIGIT_PRONUNCIATION = {
 }
 
 
+def _default_digits(lang: str) -> DigitPronunciation:
+    """How ``lang`` reads the digits after the decimal marker by default."""
+    return _DEFAULT_DIGIT_PRONUNCIATION.get(_base_lang(lang),
+                                            DigitPronunciation.FULL_NUMBER)
+
+
 #: a run of digits this long in "spoken" output means a backend gave up and
 #: handed back the numeral instead of reading it
 _DIGIT_RUN = re.compile(r"\d{7,}")
@@ -741,7 +934,259 @@ def pronounce_number(number: Union[int, float], lang: str,
         formatting does ``"%E" % nan`` -> ``"NAN"`` and then fails to split off an
         exponent, while cardinal formatting fails converting NaN to ``int``.
     """
-    scale = _resolve_scale(lang, scale, short_scale)
+    return _pronounce_number(number, lang, places, scientific, ordinals,
+                             digits, gender,
+                             _resolve_scale(lang, scale, short_scale), case)
+
+
+# --- opt-in pronounce_number cache ------------------------------------------
+#
+# TTS traffic repeats a small set of values (clock times, temperatures,
+# percentages, list indexes). With the cache enabled, a repeated call skips
+# the rounding, the dispatch and the backend and returns the stored string.
+# It is off by default, so nothing is kept unless the caller asks for it.
+
+#: statistics of the pronounce_number cache, as ``functools.lru_cache``
+#: reports them
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _PronounceCache:
+    """Bounded, thread-safe LRU of spoken forms, shared by pronounce_number
+    and the NumberParser handles. ``maxsize`` 0 means disabled."""
+
+    def __init__(self):
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[str]:
+        with self._lock:
+            spoken = self._entries.get(key)
+            if spoken is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return spoken
+
+    def put(self, key, spoken: str):
+        with self._lock:
+            # the cache may have been disabled while the value was computed
+            if not self.maxsize:
+                return
+            self._entries[key] = spoken
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._entries))
+
+
+_PRONOUNCE_CACHE = _PronounceCache()
+
+
+def enable_pronounce_cache(maxsize: int = 1024):
+    """
+    Cache the results of pronounce_number (and NumberParser.pronounce_number).
+
+    Up to ``maxsize`` spoken forms are kept; the least recently used one is
+    dropped when the cache is full. Calling it again resizes the cache and
+    keeps what fits. The cache is safe to share between threads. Inspect it
+    with ``pronounce_number.cache_info()`` and empty it with
+    ``pronounce_number.cache_clear()``.
+
+    Raises:
+        ValueError: If ``maxsize`` is not a positive integer; use
+            disable_pronounce_cache to turn the cache off.
+    """
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) \
+            or maxsize < 1:
+        raise ValueError(f"maxsize must be a positive integer, got {maxsize!r}")
+    _PRONOUNCE_CACHE.resize(maxsize)
+
+
+def disable_pronounce_cache():
+    """Turn the pronounce_number cache off and drop what it holds."""
+    _PRONOUNCE_CACHE.resize(0)
+    _PRONOUNCE_CACHE.clear()
+
+
+pronounce_number.cache_info = _PRONOUNCE_CACHE.info
+pronounce_number.cache_clear = _PRONOUNCE_CACHE.clear
+
+
+# --- opt-in precomputed tables ---------------------------------------------
+#
+# Most spoken numbers are below 10,000. With the tables enabled, the cardinal
+# and ordinal readings of 0..9999 are computed once per language and setting,
+# by the same backends that answer a plain call, and are then served with
+# one index operation. Common fractions (denominators 2..20) of the generic
+# fraction path are tabled the same way.
+
+#: integers below this are answered from the tables
+_TABLE_LIMIT = 10000
+#: fractions n/d with 1 <= n < d <= this are answered from the tables
+_TABLE_FRACTION_LIMIT = 20
+#: values per table block; blocks are built on first use
+_TABLE_BLOCK = 100
+
+
+class _SpokenTable:
+    """The spoken forms of 0..n-1 as one joined string and an offset array,
+    far smaller than a list of str objects. An empty entry means there is no
+    tabled reading and the backend has to answer."""
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, spoken: List[str]):
+        self.text = "".join(spoken)
+        self.offsets = array("I", [0])
+        end = 0
+        for reading in spoken:
+            end += len(reading)
+            self.offsets.append(end)
+
+    def __getitem__(self, n: int) -> str:
+        return self.text[self.offsets[n]:self.offsets[n + 1]]
+
+
+class _PronounceTables:
+    """Tables of spoken forms, one per language and setting. Each is a list
+    of _SpokenTable blocks of _TABLE_BLOCK values, built on first use, so a
+    first lookup only waits for the block it falls in. Off until
+    enable_pronounce_tables() is called."""
+
+    def __init__(self):
+        self.enabled = False
+        self._tables = {}
+        # reentrant: the fraction table is built from tabled cardinals
+        self._lock = threading.RLock()
+
+    def lookup(self, key, n: int, size: int,
+               speak: Callable[[int], str]) -> str:
+        """Entry ``n`` of the ``size``-entry table for ``key``, building its
+        block with ``speak`` on first use."""
+        blocks = self._tables.get(key)
+        if blocks is None:
+            with self._lock:
+                blocks = self._tables.setdefault(
+                    key, [None] * -(-size // _TABLE_BLOCK))
+        index, offset = divmod(n, _TABLE_BLOCK)
+        block = blocks[index]
+        if block is None:
+            with self._lock:
+                block = blocks[index]
+                if block is None:
+                    start = index * _TABLE_BLOCK
+                    block = blocks[index] = self._build(
+                        range(start, min(start + _TABLE_BLOCK, size)), speak)
+        return block[offset]
+
+    @staticmethod
+    def _build(values: range, speak: Callable[[int], str]) -> _SpokenTable:
+        spoken = []
+        for n in values:
+            try:
+                reading = speak(n)
+            except NotImplementedError:
+                # the language is not served at all: table nothing
+                return _SpokenTable([""] * len(values))
+            except Exception:
+                # no reading: the call for this value goes to the backend
+                # and raises there, exactly as without the tables
+                reading = ""
+            # a few backends hand back something other than a reading
+            # (Estonian answers ordinal 0 with the int 0); leave those to them
+            spoken.append(reading if isinstance(reading, str) else "")
+        return _SpokenTable(spoken)
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+
+_PRONOUNCE_TABLES = _PronounceTables()
+
+
+def enable_pronounce_tables():
+    """
+    Answer small numbers from precomputed tables.
+
+    The cardinal and ordinal readings of 0..9999, and the generic readings
+    of fractions with denominators 2..20, are built in blocks of 100 values
+    the first time a language and setting asks for one of them, and are
+    answered with one lookup after that. Each block is a single string plus
+    an offset array, so keeping tables for every language stays cheap.
+    """
+    _PRONOUNCE_TABLES.enabled = True
+
+
+def disable_pronounce_tables():
+    """Stop using the precomputed tables and drop them."""
+    _PRONOUNCE_TABLES.enabled = False
+    _PRONOUNCE_TABLES.clear()
+
+
+def _pronounce_number(number, lang, places, scientific, ordinals, digits,
+                      gender, scale, case):
+    """Body of pronounce_number once ``scale`` is resolved, shared with the
+    bound NumberParser so a handle skips re-deriving the language defaults."""
+    # How a language conventionally reads the digits after the decimal marker
+    # is a property of the language, not of the caller: Spanish and Catalan
+    # read them one by one ("tres coma uno cuatro") while Portuguese composes
+    # them ("três vírgula catorze"). `digits=None` means "use the language's
+    # convention"; an explicit value always wins.
+    if digits is None:
+        digits = _default_digits(lang)
+    # exactly int: True would otherwise be read as 1
+    if _PRONOUNCE_TABLES.enabled and number.__class__ is int \
+            and 0 <= number < _TABLE_LIMIT and not scientific:
+        spoken = _PRONOUNCE_TABLES.lookup(
+            ("number", lang, ordinals, digits, gender, scale, case), number,
+            _TABLE_LIMIT, lambda n: _pronounce_number_uncached(
+                n, lang, places, False, ordinals, digits, gender, scale,
+                case))
+        if spoken:
+            return spoken
+    cache = _PRONOUNCE_CACHE
+    if not cache.maxsize:
+        return _pronounce_number_uncached(number, lang, places, scientific,
+                                          ordinals, digits, gender, scale,
+                                          case)
+    # Equal numbers are not always spoken alike: 1, 1.0 and True compare and
+    # hash equal, and so do 0.0 and -0.0. The type and repr tell them apart.
+    # ``lang`` is the tag as given: the digit reading and the infinity and
+    # scientific wording look at more of it than the backend it resolves to.
+    key = (number.__class__, repr(number), lang, places, scientific,
+           ordinals, digits, gender, scale, case)
+    spoken = cache.get(key)
+    if spoken is None:
+        spoken = _pronounce_number_uncached(number, lang, places, scientific,
+                                            ordinals, digits, gender, scale,
+                                            case)
+        cache.put(key, spoken)
+    return spoken
+
+
+def _pronounce_number_uncached(number, lang, places, scientific, ordinals,
+                               digits, gender, scale, case):
     short_scale = scale == Scale.SHORT
     if isinstance(number, complex):
         return _pronounce_complex(number, lang, places, scale, digits, gender)
@@ -751,14 +1196,6 @@ def pronounce_number(number: Union[int, float], lang: str,
     # every language so no per-language path has to convert it to an integer.
     if isinstance(number, float) and math.isinf(number):
         return _pronounce_infinity(number, lang)
-    # How a language conventionally reads the digits after the decimal marker
-    # is a property of the language, not of the caller: Spanish and Catalan
-    # read them one by one ("tres coma uno cuatro") while Portuguese composes
-    # them ("três vírgula catorze"). `digits=None` means "use the language's
-    # convention"; an explicit value always wins.
-    if digits is None:
-        digits = _DEFAULT_DIGIT_PRONUNCIATION.get(
-            _base_lang(lang), DigitPronunciation.FULL_NUMBER)
 
     # Round to the spoken precision before dispatch so every backend speaks a
     # rounded value instead of a truncated one (see _round_for_speech).
@@ -773,14 +1210,14 @@ def pronounce_number(number: Union[int, float], lang: str,
         # contract; every other language falls back to a spoken scientific
         # reading rather than crashing. Ordinary-magnitude numbers keep their
         # original error so genuine bugs are not masked.
-        if not lang.startswith("kab") and abs(number) >= 10 ** 15:
+        if _backend_code(lang) != "kab" and abs(number) >= 10 ** 15:
             return _pronounce_bignum_fallback(number, lang, places)
         raise
     # A backend that does not raise past its scale table returns padded or
     # unread output instead (see _is_spoken_reading). Only composed readings
     # of large numbers are checked: a digit-by-digit rendering repeats words
     # legitimately, and Kabyle's finite ceiling is a documented contract.
-    if abs(number) >= 10 ** 15 and not lang.startswith("kab") \
+    if abs(number) >= 10 ** 15 and _backend_code(lang) != "kab" \
             and not scientific and (isinstance(number, int)
                                     or float(number).is_integer()):
         # padded scale words are never a reading, so always replace them
@@ -793,104 +1230,154 @@ def pronounce_number(number: Union[int, float], lang: str,
     return spoken
 
 
+def _pronounce_with_scale_flag(name):
+    """``pronounce_number_<code>(number, places, short_scale, scientific,
+    ordinals)``"""
+    def pronounce(number, places, short_scale, scientific, ordinals,
+                  digits, gender, scale, case):
+        return _load(name)(number, places, short_scale, scientific, ordinals)
+    return pronounce
+
+
+def _pronounce_no_scale(name):
+    """``pronounce_number_<code>(number, places, scientific, ordinals)``"""
+    def pronounce(number, places, short_scale, scientific, ordinals,
+                  digits, gender, scale, case):
+        return _load(name)(number, places, scientific, ordinals)
+    return pronounce
+
+
+def _pronounce_with_engine(engine):
+    """``<ENGINE>.pronounce_number(number, places, scale, ordinals, digits,
+    gender)``"""
+    def pronounce(number, places, short_scale, scientific, ordinals,
+                  digits, gender, scale, case):
+        return _load(engine).pronounce_number(number, places, scale, ordinals,
+                                              digits, gender)
+    return pronounce
+
+
+def _pronounce_ar(number, places, short_scale, scientific, ordinals,
+                  digits, gender, scale, case):
+    return _load("pronounce_number_ar")(number, places, scientific, ordinals,
+                                        case=case)
+
+
+def _pronounce_eu(number, places, short_scale, scientific, ordinals,
+                  digits, gender, scale, case):
+    return _load("pronounce_number_eu")(number, places)
+
+
+def _pronounce_it(number, places, short_scale, scientific, ordinals,
+                  digits, gender, scale, case):
+    # NOT routed through IT: the engine spaces the tens ("venti cinque")
+    # where Italian elides them ("venticinque"). Legacy path until the
+    # engine handles elision, so `digits` stays unused here.
+    return _load("pronounce_number_it")(number, places, short_scale, scientific)
+
+
+def _pronounce_kab(number, places, short_scale, scientific, ordinals,
+                   digits, gender, scale, case):
+    return _load("pronounce_number_kab")(number, places, ordinals, gender)
+
+
+#: pronounce_number backend per language; anything else falls back to
+#: unicode-rbnf
+_PRONOUNCE_NUMBER = {
+    **{code: _pronounce_with_scale_flag(f"pronounce_number_{code}")
+       for code in ("az", "bg", "cs", "da", "de", "en", "et", "fi", "fy",
+                    "hr", "hu", "id", "ms", "nb", "nl", "nn", "pl", "ru",
+                    "sk", "sl", "sv", "tr", "uk")},
+    **{code: _pronounce_no_scale(f"pronounce_number_{code}")
+       for code in ("el", "fa", "he")},
+    **{code: _pronounce_with_engine(engine) for code, engine in (
+        ("an", "AN"), ("ast", "AST"), ("ca", "CA"), ("es", "ES"), ("fr", "FR"),
+        ("gl", "GL"), ("mwl", "MWL"), ("oc", "OC"), ("pt", "PT_PT"),
+        ("pt-br", "PT_BR"), ("ro", "RO"))},
+    "ar": _pronounce_ar,
+    "eu": _pronounce_eu,
+    "it": _pronounce_it,
+    "kab": _pronounce_kab,
+}
+
+
 def _pronounce_number_dispatch(number, lang, places, short_scale, scientific,
                                ordinals, digits, gender, scale, case=None):
-    if lang.startswith("en"):
-        return pronounce_number_en(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("az"):
-        return pronounce_number_az(number, places, short_scale, scientific, ordinals)
-    if _is_ar(lang):
-        return pronounce_number_ar(number, places, scientific, ordinals,
-                                   case=case if case is not None
-                                   else _ar_default_case(lang))
-    if lang.startswith("bg"):
-        return pronounce_number_bg(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("ca"):
-        return CA.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("ast"):
-        return AST.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("oc"):
-        return OC.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("an"):
-        return AN.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("cs"):
-        return pronounce_number_cs(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("da"):
-        return pronounce_number_da(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("de"):
-        return pronounce_number_de(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("gl"):
-        return GL.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("el"):
-        return pronounce_number_el(number, places, scientific, ordinals)
-    if lang.startswith("es"):
-        return ES.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("eu"):
-        return pronounce_number_eu(number, places)
-    if lang.startswith("et"):
-        return pronounce_number_et(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("fa"):
-        return pronounce_number_fa(number, places, scientific, ordinals)
-    if lang.startswith("fi"):
-        return pronounce_number_fi(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("fr"):
-        return FR.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("he"):
-        return pronounce_number_he(number, places, scientific, ordinals)
-    if lang.startswith("hr"):
-        return pronounce_number_hr(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("hu"):
-        return pronounce_number_hu(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("id"):
-        return pronounce_number_id(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("ms"):
-        return pronounce_number_ms(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("tr"):
-        return pronounce_number_tr(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("it"):
-        # NOT routed through IT: the engine spaces the tens ("venti cinque")
-        # where Italian elides them ("venticinque"). Legacy path until the
-        # engine handles elision, so `digits` stays unused here.
-        return pronounce_number_it(number, places, short_scale, scientific)
-    if lang.startswith("kab"):
-        return pronounce_number_kab(number, places, ordinals, gender)
-    if lang.startswith("fy"):
-        return pronounce_number_fy(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("nn"):
-        return pronounce_number_nn(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("nb") or lang.startswith("no"):
-        return pronounce_number_nb(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("nl"):
-        return pronounce_number_nl(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("pl"):
-        return pronounce_number_pl(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("pt"):
-        if "br" in lang.lower():
-            return PT_BR.pronounce_number(number, places, scale, ordinals, digits, gender)
-        return PT_PT.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("mwl"):
-        return MWL.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("ro"):
-        return RO.pronounce_number(number, places, scale, ordinals, digits, gender)
-    if lang.startswith("ru"):
-        return pronounce_number_ru(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("sk"):
-        return pronounce_number_sk(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("sl"):
-        return pronounce_number_sl(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("sv"):
-        return pronounce_number_sv(number, places, short_scale, scientific, ordinals)
-    if lang.startswith("uk"):
-        return pronounce_number_uk(number, places, short_scale, scientific, ordinals)
-    # fallback to unicode RBNF
+    info = _resolve_lang(lang)
+    backend = _PRONOUNCE_NUMBER.get(info.code) if info is not None else None
+    if backend is not None:
+        if case is None and info.ar_case is not None:
+            case = info.ar_case
+        return backend(number, places, short_scale, scientific, ordinals,
+                       digits, gender, scale, case)
+    return _pronounce_rbnf(number, lang, ordinals)
+
+
+@lru_cache(maxsize=512)
+def _rbnf_engine(code: str):
+    """The unicode-rbnf engine for a bare language code, or None if
+    unicode-rbnf has no rules for it.
+
+    Cached either way: building an engine parses the language's whole CLDR
+    rule set, and a language it cannot serve should fail fast on every
+    later call too. The code comes from the caller, so the cache is bounded
+    like _resolve_lang's: a stream of made-up tags cannot grow it without
+    limit. Only the ValueError unicode-rbnf raises for a language
+    without rules counts as that; any other error propagates, uncached, so
+    a broken install or a bug in the rules is not remembered as an
+    unsupported language.
+    """
+    try:
+        return _load("RbnfEngine").for_language(code)
+    except ValueError:
+        return None
+
+
+def preload_rbnf_engines(langs) -> None:
+    """Build the unicode-rbnf engines for ``langs`` now, so the first
+    fallback call in each of them does not pay for parsing the rules.
+    Languages unicode-rbnf cannot serve are remembered as such."""
+    for lang in langs:
+        _rbnf_engine(_base_lang(lang))
+
+
+def _can_pronounce(lang: str) -> bool:
+    """Whether pronounce_number speaks ``lang``: through a native backend,
+    or through the unicode-rbnf rules of its base language."""
+    return _backend_code(lang) in _PRONOUNCE_NUMBER \
+        or _rbnf_engine(_base_lang(lang)) is not None
+
+
+def _pronounce_rbnf(number, lang: str, ordinals: bool) -> str:
+    """unicode-rbnf fallback for languages without a native backend."""
+    engine = _rbnf_engine(_base_lang(lang))
+    if engine is None:
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
     try:
-        engine = RbnfEngine.for_language(lang.split("-")[0])
-        fmt = FormatPurpose.ORDINAL if ordinals else FormatPurpose.CARDINAL
-        return engine.format_number(number, fmt).text
+        fmt = _load("FormatPurpose")
+        return engine.format_number(
+            number, fmt.ORDINAL if ordinals else fmt.CARDINAL).text
     except Exception as err:
         raise NotImplementedError(f"Unsupported language: '{lang}'") from err
 
 
+def _pronounce_fraction_with_engine(engine):
+    """``<ENGINE>.pronounce_fraction(fraction_word, scale=scale)``"""
+    return lambda fraction_word, scale: \
+        _load(engine).pronounce_fraction(fraction_word, scale=scale)
+
+
+#: pronounce_fraction backend per language; anything else uses
+#: _pronounce_fraction_generic
+_PRONOUNCE_FRACTION = {
+    **{code: _pronounce_fraction_with_engine(engine) for code, engine in (
+        ("an", "AN"), ("ast", "AST"), ("ca", "CA"), ("mwl", "MWL"),
+        ("oc", "OC"), ("pt", "PT_PT"), ("pt-br", "PT_BR"), ("ro", "RO"))},
+    "gl": lambda fraction_word, scale: _load("pronounce_fraction_gl")(
+        fraction_word, scale=scale),
+}
+
+
 def pronounce_fraction(fraction_word: str, lang: str, scale: Optional[Scale] = None) -> str:
     """
     Return the spoken form of a fraction string (e.g., "1/2" as "one half") for the specified language and numerical scale.
@@ -905,25 +1392,45 @@ def pronounce_fraction(fraction_word: str, lang: str, scale: Optional[Scale] = N
     Raises:
         NotImplementedError: If the specified language is not supported.
     """
-    if lang.startswith("pt"):
-        return PT_BR.pronounce_fraction(fraction_word, scale=scale) if "br" in lang.lower() \
-            else PT_PT.pronounce_fraction(fraction_word, scale=scale)
-    elif lang.startswith("ast"):
-        return AST.pronounce_fraction(fraction_word, scale=scale)
-    elif lang.startswith("ca"):
-        return CA.pronounce_fraction(fraction_word, scale=scale)
-    elif lang.startswith("oc"):
-        return OC.pronounce_fraction(fraction_word, scale=scale)
-    elif lang.startswith("an"):
-        return AN.pronounce_fraction(fraction_word, scale=scale)
-    elif lang.startswith("mwl"):
-        return MWL.pronounce_fraction(fraction_word, scale=scale)
-    elif lang.startswith("gl"):
-        return pronounce_fraction_gl(fraction_word, scale=scale)
-    elif lang.startswith("ro"):
-        return RO.pronounce_fraction(fraction_word, scale=scale)
-    else:
+    backend = _PRONOUNCE_FRACTION.get(_backend_code(lang))
+    if backend is None:
         return _pronounce_fraction_generic(fraction_word, lang)
+    return backend(fraction_word, scale)
+
+
+def _pronounce_ordinal_plain(name):
+    """``pronounce_ordinal_<code>(number)``"""
+    return lambda number, gender, scale: _load(name)(number)
+
+
+def _pronounce_ordinal_with_engine(engine):
+    """``<ENGINE>.pronounce_ordinal(number, scale=scale, gender=gender)``"""
+    return lambda number, gender, scale: \
+        _load(engine).pronounce_ordinal(number, scale=scale, gender=gender)
+
+
+def _pronounce_ordinal_via_cardinal(name):
+    """``pronounce_number_<code>(number, ordinals=True)``"""
+    return lambda number, gender, scale: _load(name)(number, ordinals=True)
+
+
+#: pronounce_ordinal backend per language; anything else falls back to
+#: unicode-rbnf
+_PRONOUNCE_ORDINAL = {
+    **{code: _pronounce_ordinal_plain(f"pronounce_ordinal_{code}")
+       for code in ("ar", "cs", "da", "de", "el", "et", "eu", "fa", "fi",
+                    "fy", "he", "hr", "hu", "id", "ms", "nb", "nl", "nn",
+                    "pl", "sk", "sv", "tr", "uk")},
+    **{code: _pronounce_ordinal_with_engine(engine) for code, engine in (
+        ("an", "AN"), ("ast", "AST"), ("ca", "CA"), ("mwl", "MWL"),
+        ("oc", "OC"), ("pt", "PT_PT"), ("pt-br", "PT_BR"), ("ro", "RO"))},
+    **{code: _pronounce_ordinal_via_cardinal(f"pronounce_number_{code}")
+       for code in ("bg", "sl")},
+    "gl": lambda number, gender, scale: _load("pronounce_ordinal_gl")(
+        number, gender=gender, scale=scale),
+    "kab": lambda number, gender, scale: _load("pronounce_ordinal_kab")(
+        number, gender),
+}
 
 
 def pronounce_ordinal(number: Union[int, float], lang: str,
@@ -946,83 +1453,28 @@ def pronounce_ordinal(number: Union[int, float], lang: str,
         NotImplementedError: If the language is not supported.
     """
     scale = _resolve_scale(lang, scale, short_scale)
-    short_scale = scale == Scale.SHORT
-    if lang.startswith("pt"):
-        return PT_BR.pronounce_ordinal(number, scale=scale, gender=gender) if "br" in lang.lower() \
-            else PT_PT.pronounce_ordinal(number, scale=scale, gender=gender)
-    if lang.startswith("mwl"):
-        return MWL.pronounce_ordinal(number, scale=scale, gender=gender)
-    if lang.startswith("ro"):
-        return RO.pronounce_ordinal(number, scale=scale, gender=gender)
-    if lang.startswith("ast"):
-        return AST.pronounce_ordinal(number, scale=scale, gender=gender)
-    if lang.startswith("ca"):
-        return CA.pronounce_ordinal(number, scale=scale, gender=gender)
-    if lang.startswith("oc"):
-        return OC.pronounce_ordinal(number, scale=scale, gender=gender)
-    if lang.startswith("an"):
-        return AN.pronounce_ordinal(number, scale=scale, gender=gender)
-    if _is_ar(lang):
-        return pronounce_ordinal_ar(number)
-    if lang.startswith("da"):
-        return pronounce_ordinal_da(number)
-    if lang.startswith("de"):
-        return pronounce_ordinal_de(number)
-    if lang.startswith("et"):
-        return pronounce_ordinal_et(number)
-    if lang.startswith("fi"):
-        return pronounce_ordinal_fi(number)
-    if lang.startswith("hr"):
-        return pronounce_ordinal_hr(number)
-    if lang.startswith("el"):
-        return pronounce_ordinal_el(number)
-    if lang.startswith("he"):
-        return pronounce_ordinal_he(number)
-    if lang.startswith("hu"):
-        return pronounce_ordinal_hu(number)
-    if lang.startswith("id"):
-        return pronounce_ordinal_id(number)
-    if lang.startswith("ms"):
-        return pronounce_ordinal_ms(number)
-    if lang.startswith("tr"):
-        return pronounce_ordinal_tr(number)
-    if lang.startswith("fy"):
-        return pronounce_ordinal_fy(number)
-    if lang.startswith("nn"):
-        return pronounce_ordinal_nn(number)
-    if lang.startswith("nb") or lang.startswith("no"):
-        return pronounce_ordinal_nb(number)
-    if lang.startswith("nl"):
-        return pronounce_ordinal_nl(number)
-    if lang.startswith("sv"):
-        return pronounce_ordinal_sv(number)
-    if lang.startswith("gl"):
-        return pronounce_ordinal_gl(number, gender=gender, scale=scale)
-    if lang.startswith("cs"):
-        return pronounce_ordinal_cs(number)
-    if lang.startswith("sk"):
-        return pronounce_ordinal_sk(number)
-    if lang.startswith("pl"):
-        return pronounce_ordinal_pl(number)
-    if lang.startswith("uk"):
-        return pronounce_ordinal_uk(number)
-    if lang.startswith("eu"):
-        return pronounce_ordinal_eu(number)
-    if lang.startswith("fa"):
-        return pronounce_ordinal_fa(number)
-    if lang.startswith("bg"):
-        return pronounce_number_bg(number, ordinals=True)
-    if lang.startswith("sl"):
-        return pronounce_number_sl(number, ordinals=True)
-    if lang.startswith("kab"):
-        return pronounce_ordinal_kab(number, gender)
-    # fallback to unicode RBNF
-    try:
-        engine = RbnfEngine.for_language(lang.split("-")[0])
-        fmt = FormatPurpose.ORDINAL
-        return engine.format_number(number, fmt).text
-    except Exception as err:
-        raise NotImplementedError(f"Unsupported language: '{lang}'") from err
+    return _pronounce_ordinal(number, lang, gender, scale,
+                              _PRONOUNCE_ORDINAL.get(_backend_code(lang)))
+
+
+def _pronounce_ordinal(number, lang, gender, scale, backend):
+    """Body of pronounce_ordinal once the backend and ``scale`` are
+    resolved, shared with the bound NumberParser."""
+    if _PRONOUNCE_TABLES.enabled and number.__class__ is int \
+            and 0 <= number < _TABLE_LIMIT:
+        spoken = _PRONOUNCE_TABLES.lookup(
+            ("ordinal", lang, gender, scale), number, _TABLE_LIMIT,
+            lambda n: _pronounce_ordinal_uncached(n, lang, gender, scale,
+                                                  backend))
+        if spoken:
+            return spoken
+    return _pronounce_ordinal_uncached(number, lang, gender, scale, backend)
+
+
+def _pronounce_ordinal_uncached(number, lang, gender, scale, backend):
+    if backend is not None:
+        return backend(number, gender, scale)
+    return _pronounce_rbnf(number, lang, ordinals=True)
 
 
 #: a hyphen or underscore sitting between two letters is just a spelling of the
@@ -1047,6 +1499,39 @@ def _unglue_compound_numerals(text: str, lang: str) -> str:
     return _COMPOUND_NUMERAL_JOIN.sub(" ", text)
 
 
+def _extract_with_scale_flag(name):
+    """``extract_number_<code>(text, short_scale, ordinals)``"""
+    return lambda text, short_scale, ordinals, scale: \
+        _load(name)(text, short_scale, ordinals)
+
+
+def _extract_no_scale(name):
+    """``extract_number_<code>(text, ordinals)``"""
+    return lambda text, short_scale, ordinals, scale: \
+        _load(name)(text, ordinals)
+
+
+def _extract_with_engine(engine):
+    """``<ENGINE>.extract_number(text, ordinals=ordinals, scale=scale)``"""
+    return lambda text, short_scale, ordinals, scale: \
+        _load(engine).extract_number(text, ordinals=ordinals, scale=scale)
+
+
+#: extract_number backend per language
+_EXTRACT_NUMBER = {
+    **{code: _extract_with_scale_flag(f"extract_number_{code}")
+       for code in ("az", "bg", "cs", "da", "de", "en", "es", "et", "eu",
+                    "fi", "fr", "fy", "gl", "hr", "hu", "id", "it", "kab",
+                    "ms", "nb", "nl", "nn", "pl", "ru", "sk", "sl", "sv",
+                    "tr", "uk")},
+    **{code: _extract_no_scale(f"extract_number_{code}")
+       for code in ("ar", "el", "fa", "he")},
+    **{code: _extract_with_engine(engine) for code, engine in (
+        ("an", "AN"), ("ast", "AST"), ("ca", "CA"), ("mwl", "MWL"),
+        ("oc", "OC"), ("pt", "PT_PT"), ("pt-br", "PT_BR"), ("ro", "RO"))},
+}
+
+
 def extract_number(text: str, lang: str,
                    short_scale: Optional[bool] = None,  # DEPRECATED
                    ordinals: bool = False,
@@ -1076,88 +1561,243 @@ def extract_number(text: str, lang: str,
     text = _unglue_compound_numerals(text, lang)
     scale = _resolve_scale(lang, scale, short_scale)
     short_scale = scale == Scale.SHORT
-    if lang.startswith("en"):
-        return extract_number_en(text, short_scale, ordinals)
-    if lang.startswith("az"):
-        return extract_number_az(text, short_scale, ordinals)
-    if _is_ar(lang):
-        return extract_number_ar(text, ordinals)
-    if lang.startswith("bg"):
-        return extract_number_bg(text, short_scale, ordinals)
-    if lang.startswith("ca"):
-        return CA.extract_number(text, ordinals=ordinals, scale=scale)
-    if lang.startswith("cs"):
-        return extract_number_cs(text, short_scale, ordinals)
-    if lang.startswith("da"):
-        return extract_number_da(text, short_scale, ordinals)
-    if lang.startswith("de"):
-        return extract_number_de(text, short_scale, ordinals)
-    if lang.startswith("el"):
-        return extract_number_el(text, ordinals)
-    if lang.startswith("es"):
-        return extract_number_es(text, short_scale, ordinals)
-    if lang.startswith("gl"):
-        return extract_number_gl(text, short_scale, ordinals)
-    if lang.startswith("eu"):
-        return extract_number_eu(text, short_scale, ordinals)
-    if lang.startswith("et"):
-        return extract_number_et(text, short_scale, ordinals)
-    if lang.startswith("fa"):
-        return extract_number_fa(text, ordinals)
-    if lang.startswith("fi"):
-        return extract_number_fi(text, short_scale, ordinals)
-    if lang.startswith("fr"):
-        return extract_number_fr(text, short_scale, ordinals)
-    if lang.startswith("id"):
-        return extract_number_id(text, short_scale, ordinals)
-    if lang.startswith("it"):
-        return extract_number_it(text, short_scale, ordinals)
-    if lang.startswith("ms"):
-        return extract_number_ms(text, short_scale, ordinals)
-    if lang.startswith("tr"):
-        return extract_number_tr(text, short_scale, ordinals)
-    if lang.startswith("kab"):
-        return extract_number_kab(text, short_scale, ordinals)
-    if lang.startswith("fy"):
-        return extract_number_fy(text, short_scale, ordinals)
-    if lang.startswith("nn"):
-        return extract_number_nn(text, short_scale, ordinals)
-    if lang.startswith("nb") or lang.startswith("no"):
-        return extract_number_nb(text, short_scale, ordinals)
-    if lang.startswith("nl"):
-        return extract_number_nl(text, short_scale, ordinals)
-    if lang.startswith("pl"):
-        return extract_number_pl(text, short_scale, ordinals)
-    if lang.startswith("pt"):
-        return PT_BR.extract_number(text, scale=scale, ordinals=ordinals) if "br" in lang.lower() \
-            else PT_PT.extract_number(text, scale=scale, ordinals=ordinals)
-    if lang.startswith("mwl"):
-        return MWL.extract_number(text, scale=scale, ordinals=ordinals)
-    if lang.startswith("ro"):
-        return RO.extract_number(text, scale=scale, ordinals=ordinals)
-    if lang.startswith("ast"):
-        return AST.extract_number(text, scale=scale, ordinals=ordinals)
-    if lang.startswith("oc"):
-        return OC.extract_number(text, scale=scale, ordinals=ordinals)
-    if lang.startswith("an"):
-        return AN.extract_number(text, scale=scale, ordinals=ordinals)
-    if lang.startswith("ru"):
-        return extract_number_ru(text, short_scale, ordinals)
-    if lang.startswith("sk"):
-        return extract_number_sk(text, short_scale, ordinals)
-    if lang.startswith("sv"):
-        return extract_number_sv(text, short_scale, ordinals)
-    if lang.startswith("uk"):
-        return extract_number_uk(text, short_scale, ordinals)
-    if lang.startswith("hr"):
-        return extract_number_hr(text, short_scale, ordinals)
-    if lang.startswith("he"):
-        return extract_number_he(text, ordinals)
-    if lang.startswith("hu"):
-        return extract_number_hu(text, short_scale, ordinals)
-    if lang.startswith("sl"):
-        return extract_number_sl(text, short_scale, ordinals)
-    raise NotImplementedError(f"Unsupported language: '{lang}'")
+    backend = _EXTRACT_NUMBER.get(_backend_code(lang))
+    if backend is None:
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
+    return backend(text, short_scale, ordinals, scale)
+
+
+#: languages whose extract_number reads the first of the numbers a
+#: TokenNumberExtractor finds; extract_numbers keeps all of them
+_TOKEN_ENGINE_LANGS = frozenset((
+    "az", "cs", "en", "fy", "hr", "nl", "pl", "ru", "sk", "tr", "uk"))
+
+#: Romance engine per language whose numbers_to_digits spans come from
+#: RomanceNumberExtractor.number_spans
+_ROMANCE_SPAN_ENGINES = {
+    "an": "AN", "ast": "AST", "ca": "CA", "gl": "GL", "mwl": "MWL",
+    "oc": "OC", "pt": "PT_PT", "pt-br": "PT_BR", "ro": "RO",
+}
+
+_WORD = re.compile(r"\S+")
+_WORD_LEAD = "\"'([{«“„¿¡"
+_WORD_TRAIL = ".,!?;:؟،؛\"')]}»”"
+_CLAUSE_MARKS = ".!?;:؟؛"
+_NUMERIC_WORD = re.compile(r"[-+]?\d+(?:\.\d+)?")
+
+
+def _module_attr(code: str, name: str):
+    """A private name of the ``numbers_<code>`` module."""
+    return getattr(importlib.import_module(f"{__name__}.numbers_{code}"), name)
+
+
+def _words(text: str):
+    """The words of ``text`` without their surrounding punctuation, as
+    ``(word, char_start, char_end, punctuation after the word)``."""
+    words = []
+    for match in _WORD.finditer(text):
+        word = match.group()
+        lead = len(word) - len(word.lstrip(_WORD_LEAD))
+        core = word[lead:].rstrip(_WORD_TRAIL)
+        if core:
+            start = match.start() + lead
+            words.append((core, start, start + len(core),
+                          word[lead + len(core):]))
+        elif words:
+            # a lone mark ("twenty - one") belongs to the word before it
+            words[-1] = words[-1][:3] + (words[-1][3] + word,)
+    return words
+
+
+def _token_engine_spans(words: List[str], code: str, short_scale: bool,
+                        ordinals: bool):
+    """``(start, end, value)`` per number a TokenNumberExtractor finds, with
+    every word normalised the way ``extract_number_<code>`` normalises text."""
+    try:
+        normalize = _module_attr(code, f"_normalize_{code}")
+    except AttributeError:
+        def normalize(word, short_scale):
+            return re.sub(r"(?<=[^\W\d]),", " ", word).lower()
+    tokens = []
+    owner = []  # the word every token came from
+    for w, word in enumerate(words):
+        for token in tokenize(normalize(word, short_scale)):
+            tokens.append(Token(token.word, len(tokens)))
+            owner.append(w)
+    if code == "hr":
+        kept = _module_attr("hr", "_drop_connectors_hr")(tokens)
+        # the connectors dropped are a subsequence of the tokens, so the kept
+        # ones are found again in order
+        pos = 0
+        kept_owner = []
+        for token in kept:
+            while tokens[pos].word != token.word:
+                pos += 1
+            kept_owner.append(owner[pos])
+            pos += 1
+        tokens, owner = kept, kept_owner
+    numbers = _module_attr(code, f"_extract_numbers_with_text_{code}")(
+        tokens, short_scale, ordinals)
+    spans = [(owner[number.start_index], owner[number.end_index] + 1,
+              number.value) for number in numbers if number]
+    return _join_split_spans(words, spans, code, short_scale, ordinals)
+
+
+def _join_split_spans(words: List[str], spans, code: str, short_scale: bool,
+                      ordinals: bool):
+    """Join the pieces a number was split into ("триста" + "сорок два").
+
+    Some whole-number readers resume in the middle of a number they have
+    already read, so it comes back as two neighbours. Two spans side by side
+    (or around a connector) are one number when reading them together gives a
+    value that neither reads alone."""
+    extract = _load(f"extract_number_{code}")
+    connectors = _NUMBER_CONNECTORS.get(code, ())
+
+    def read(start, end):
+        return extract(" ".join(words[start:end]), short_scale, ordinals)
+
+    joined = []
+    for start, end, value in sorted(spans, key=lambda span: span[0]):
+        if joined:
+            prev_start, prev_end, prev_value = joined[-1]
+            gap = words[prev_end:start]
+            if not gap or (len(gap) == 1 and gap[0].lower() in connectors):
+                both = read(prev_start, end)
+                if both is not False and isinstance(prev_value, (int, float)) \
+                        and abs(both) > abs(prev_value) \
+                        and both != read(start, end):
+                    joined[-1] = (prev_start, end, both)
+                    continue
+        joined.append((start, end, value))
+    return joined
+
+
+def extract_numbers(text: str, lang: str,
+                    short_scale: Optional[bool] = None,  # DEPRECATED
+                    ordinals: bool = False,
+                    scale: Optional[Scale] = None) -> List[ExtractedNumber]:
+    """Extract every number in a string, with where each one was found.
+
+    Unlike extract_number, which stops at the first number, this reads the
+    whole text once and returns the numbers in order, so a caller never has
+    to split the text and re-read each piece.
+
+    Args:
+        text (str): the string to extract numbers from
+        lang (str): a BCP-47 language code
+        short_scale (bool): DEPRECATED, use the ``scale`` enum instead.
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        scale (Scale): short or long scale, the language's own by default
+    Returns:
+        list of ExtractedNumber: the numbers found, empty if there are none
+    """
+    if not isinstance(text, str):
+        return []
+    code = _backend_code(lang)
+    if code not in _EXTRACT_NUMBER:
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
+    scale = _resolve_scale(lang, scale, short_scale)
+    # ungluing keeps the length of the text, so the offsets still apply to
+    # the original
+    words = _words(_unglue_compound_numerals(text, lang))
+    if code in _TOKEN_ENGINE_LANGS:
+        def find(cores):
+            return _token_engine_spans(cores, code, scale == Scale.SHORT,
+                                       ordinals)
+    elif code in _ROMANCE_SPAN_ENGINES:
+        engine = _load(_ROMANCE_SPAN_ENGINES[code])
+
+        def find(cores):
+            lowered = [word.lower() for word in cores]
+            spans = list(engine.number_spans(lowered, scale))
+            if ordinals:
+                spans += [(i, i + 1, engine.is_ordinal(word, scale))
+                          for i, word in enumerate(lowered)]
+            return spans
+    else:
+        def find(cores):
+            return _generic_number_spans(cores, lang, ordinals, scale,
+                                         read_through=True)
+
+    # a number never runs across the end of a clause ("tres y veinte, mil").
+    # The token engines read spoken commas themselves ("two thousand, twenty
+    # three"), so for them a comma between two number words is kept.
+    spoken_commas = code in _TOKEN_ENGINE_LANGS
+    is_number = {}
+
+    def number_word(i):
+        """Whether word ``i`` is a number by itself, read once per call."""
+        if i not in is_number:
+            is_number[i] = extract_number(words[i][0], lang,
+                                          scale=scale) is not False
+        return is_number[i]
+
+    def ends_clause(i):
+        trail = words[i][3]
+        if any(c in _CLAUSE_MARKS for c in trail):
+            return True
+        if not any(c in ",،" for c in trail):
+            return False
+        return not (spoken_commas and number_word(i) and number_word(i + 1))
+
+    spans = []
+    first = 0
+    for i in range(len(words)):
+        if i == len(words) - 1 or ends_clause(i):
+            cores = [word for word, _, _, _ in words[first:i + 1]]
+            spans.extend((start + first, end + first, value)
+                         for start, end, value in find(cores))
+            first = i + 1
+
+    found = []
+    covered = set()
+    for start, end, value in sorted(spans, key=lambda span: span[0]):
+        if value is None or value is False or covered.intersection(
+                range(start, end)):
+            continue
+        covered.update(range(start, end))
+        found.append((start, end, value))
+    # digits the spans left alone ("7 de maio")
+    for i, (word, _, _, _) in enumerate(words):
+        if i not in covered and _NUMERIC_WORD.fullmatch(word):
+            value = float(word)
+            found.append((i, i + 1, int(value) if value.is_integer() else value))
+    found.sort()
+    return [ExtractedNumber(value, text[words[start][1]:words[end - 1][2]],
+                            start, end, words[start][1], words[end - 1][2])
+            for start, end, value in found]
+
+
+def _is_fractional_with_scale_flag(name):
+    """``is_fractional_<code>(input_str, short_scale)``"""
+    return lambda input_str, short_scale: _load(name)(input_str, short_scale)
+
+
+def _is_fractional_plain(name):
+    """``is_fractional_<code>(input_str)``"""
+    return lambda input_str, short_scale: _load(name)(input_str)
+
+
+def _is_fractional_with_engine(engine):
+    """``<ENGINE>.is_fractional(input_str)``"""
+    return lambda input_str, short_scale: \
+        _load(engine).is_fractional(input_str)
+
+
+#: is_fractional backend per language
+_IS_FRACTIONAL = {
+    **{code: _is_fractional_with_scale_flag(f"is_fractional_{code}")
+       for code in ("ar", "az", "bg", "cs", "da", "de", "el", "en", "es",
+                    "et", "fa", "fi", "fy", "he", "hr", "hu", "id", "it",
+                    "kab", "ms", "nb", "nl", "nn", "pl", "ru", "sk", "sl",
+                    "sv", "tr", "uk")},
+    **{code: _is_fractional_plain(f"is_fractional_{code}")
+       for code in ("eu", "fr", "gl")},
+    **{code: _is_fractional_with_engine(engine) for code, engine in (
+        ("an", "AN"), ("ast", "AST"), ("ca", "CA"), ("mwl", "MWL"),
+        ("oc", "OC"), ("pt", "PT_PT"), ("pt-br", "PT_PT"), ("ro", "RO"))},
+}
 
 
 def is_fractional(input_str: str, lang: str,
@@ -1183,87 +1823,39 @@ def is_fractional(input_str: str, lang: str,
         return False
     scale = _resolve_scale(lang, scale, short_scale)
     short_scale = scale == Scale.SHORT
-    if lang.startswith("en"):
-        return is_fractional_en(input_str, short_scale)
-    if lang.startswith("az"):
-        return is_fractional_az(input_str, short_scale)
-    if _is_ar(lang):
-        return is_fractional_ar(input_str, short_scale)
-    if lang.startswith("bg"):
-        return is_fractional_bg(input_str, short_scale)
-    if lang.startswith("ca"):
-        return CA.is_fractional(input_str)
-    if lang.startswith("cs"):
-        return is_fractional_cs(input_str, short_scale)
-    if lang.startswith("da"):
-        return is_fractional_da(input_str, short_scale)
-    if lang.startswith("de"):
-        return is_fractional_de(input_str, short_scale)
-    if lang.startswith("el"):
-        return is_fractional_el(input_str, short_scale)
-    if lang.startswith("es"):
-        return is_fractional_es(input_str, short_scale)
-    if lang.startswith("gl"):
-        return is_fractional_gl(input_str)
-    if lang.startswith("eu"):
-        return is_fractional_eu(input_str)
-    if lang.startswith("et"):
-        return is_fractional_et(input_str, short_scale)
-    if lang.startswith("fi"):
-        return is_fractional_fi(input_str, short_scale)
-    if lang.startswith("fr"):
-        return is_fractional_fr(input_str)
-    if lang.startswith("id"):
-        return is_fractional_id(input_str, short_scale)
-    if lang.startswith("it"):
-        return is_fractional_it(input_str, short_scale)
-    if lang.startswith("ms"):
-        return is_fractional_ms(input_str, short_scale)
-    if lang.startswith("tr"):
-        return is_fractional_tr(input_str, short_scale)
-    if lang.startswith("kab"):
-        return is_fractional_kab(input_str, short_scale)
-    if lang.startswith("fy"):
-        return is_fractional_fy(input_str, short_scale)
-    if lang.startswith("nn"):
-        return is_fractional_nn(input_str, short_scale)
-    if lang.startswith("nb") or lang.startswith("no"):
-        return is_fractional_nb(input_str, short_scale)
-    if lang.startswith("nl"):
-        return is_fractional_nl(input_str, short_scale)
-    if lang.startswith("pl"):
-        return is_fractional_pl(input_str, short_scale)
-    if lang.startswith("pt"):
-        return PT_PT.is_fractional(input_str)
-    if lang.startswith("mwl"):
-        return MWL.is_fractional(input_str)
-    if lang.startswith("ro"):
-        return RO.is_fractional(input_str)
-    if lang.startswith("ast"):
-        return AST.is_fractional(input_str)
-    if lang.startswith("oc"):
-        return OC.is_fractional(input_str)
-    if lang.startswith("an"):
-        return AN.is_fractional(input_str)
-    if lang.startswith("ru"):
-        return is_fractional_ru(input_str, short_scale)
-    if lang.startswith("sk"):
-        return is_fractional_sk(input_str, short_scale)
-    if lang.startswith("sv"):
-        return is_fractional_sv(input_str, short_scale)
-    if lang.startswith("fa"):
-        return is_fractional_fa(input_str, short_scale)
-    if lang.startswith("hr"):
-        return is_fractional_hr(input_str, short_scale)
-    if lang.startswith("he"):
-        return is_fractional_he(input_str, short_scale)
-    if lang.startswith("hu"):
-        return is_fractional_hu(input_str, short_scale)
-    if lang.startswith("sl"):
-        return is_fractional_sl(input_str, short_scale)
-    if lang.startswith("uk"):
-        return is_fractional_uk(input_str, short_scale)
-    raise NotImplementedError(f"Unsupported language: '{lang}'")
+    backend = _IS_FRACTIONAL.get(_backend_code(lang))
+    if backend is None:
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
+    return backend(input_str, short_scale)
+
+
+def _is_ordinal_plain(name):
+    """``is_ordinal_<code>(input_str)``"""
+    return lambda input_str: _load(name)(input_str)
+
+
+def _is_ordinal_with_engine(engine):
+    """``<ENGINE>.is_ordinal(input_str)``"""
+    return lambda input_str: _load(engine).is_ordinal(input_str)
+
+
+def _is_ordinal_de(input_str):
+    val = _load("is_ordinal_de")(input_str)
+    if isinstance(val, str) and val.endswith("."):
+        return int(val[:-1])
+    return val
+
+
+#: is_ordinal backend per language; anything else uses _is_ordinal_generic
+_IS_ORDINAL = {
+    **{code: _is_ordinal_plain(f"is_ordinal_{code}")
+       for code in ("ar", "da", "el", "en", "et", "eu", "fi", "gl", "he",
+                    "hu", "kab", "nb", "nn", "sl")},
+    **{code: _is_ordinal_with_engine(engine) for code, engine in (
+        ("an", "AN"), ("ast", "AST"), ("ca", "CA"), ("mwl", "MWL"),
+        ("oc", "OC"), ("pt", "PT_PT"), ("pt-br", "PT_PT"), ("ro", "RO"))},
+    "de": _is_ordinal_de,
+}
 
 
 def is_ordinal(input_str: str, lang: str) -> Union[bool, float]:
@@ -1278,51 +1870,816 @@ def is_ordinal(input_str: str, lang: str) -> Union[bool, float]:
         (bool) or (float): False if not an ordinal, otherwise the number
         corresponding to the ordinal
     """
-    if lang.startswith("pt"):
-        return PT_PT.is_ordinal(input_str)
-    if lang.startswith("mwl"):
-        return MWL.is_ordinal(input_str)
-    if lang.startswith("ro"):
-        return RO.is_ordinal(input_str)
-    if lang.startswith("ast"):
-        return AST.is_ordinal(input_str)
-    if lang.startswith("ca"):
-        return CA.is_ordinal(input_str)
-    if lang.startswith("oc"):
-        return OC.is_ordinal(input_str)
-    if lang.startswith("an"):
-        return AN.is_ordinal(input_str)
-    if lang.startswith("en"):
-        return is_ordinal_en(input_str)
-    if _is_ar(lang):
-        return is_ordinal_ar(input_str)
-    if lang.startswith("de"):
-        val = is_ordinal_de(input_str)
-        if isinstance(val, str) and val.endswith("."):
-            return int(val[:-1])
-        return val
-    if lang.startswith("da"):
-        return is_ordinal_da(input_str)
-    if lang.startswith("gl"):
-        return is_ordinal_gl(input_str)
-    if lang.startswith("et"):
-        return is_ordinal_et(input_str)
-    if lang.startswith("fi"):
-        return is_ordinal_fi(input_str)
-    if lang.startswith("el"):
-        return is_ordinal_el(input_str)
-    if lang.startswith("he"):
-        return is_ordinal_he(input_str)
-    if lang.startswith("eu"):
-        return is_ordinal_eu(input_str)
-    if lang.startswith("hu"):
-        return is_ordinal_hu(input_str)
-    if lang.startswith("nn"):
-        return is_ordinal_nn(input_str)
-    if lang.startswith("nb") or lang.startswith("no"):
-        return is_ordinal_nb(input_str)
-    if lang.startswith("kab"):
-        return is_ordinal_kab(input_str)
-    if lang.startswith("sl"):
-        return is_ordinal_sl(input_str)
-    return _is_ordinal_generic(input_str, lang)
+    backend = _IS_ORDINAL.get(_backend_code(lang))
+    if backend is None:
+        return _is_ordinal_generic(input_str, lang)
+    return backend(input_str)
+
+
+#: the numbers whose spoken forms make up a token index: every word a
+#: cardinal or ordinal below a thousand is built from, and the scales
+_TOKEN_INDEX_SAMPLES = (*range(0, 21), *range(30, 101, 10),
+                        *range(200, 1001, 100), 10 ** 6, 10 ** 9, 10 ** 12)
+
+#: the Romance engine per language, whose vocabulary joins the index
+_ROMANCE_ENGINES = {**_ROMANCE_SPAN_ENGINES,
+                    "es": "ES", "fr": "FR", "it": "IT"}
+
+
+def _spoken_words(spoken, lang: str) -> List[str]:
+    if not isinstance(spoken, str):
+        return []
+    return [word.strip(_SPAN_PUNCT).lower()
+            for word in _unglue_compound_numerals(spoken, lang).split()]
+
+
+@lru_cache(maxsize=None)
+def _token_index(code: str) -> dict:
+    """``word -> (TokenKind, value)`` for every word the language's numbers
+    are spoken with.
+
+    The words come from the language's own spoken forms (and, for a Romance
+    engine, its vocabulary) and are classified once, here, with is_ordinal,
+    is_fractional and extract_number, so classify_tokens answers each token
+    with one dict lookup."""
+    lang = code
+    readings = set()
+    for n in _TOKEN_INDEX_SAMPLES:
+        for gender in (GrammaticalGender.MASCULINE,
+                       GrammaticalGender.FEMININE):
+            readings.add(_quietly(pronounce_number, n, lang, gender=gender))
+            readings.add(_quietly(pronounce_ordinal, n, lang, gender=gender))
+    for denominator in range(2, 11):
+        readings.add(_quietly(_pronounce_unsigned_fraction, 1, denominator,
+                              lang))
+    in_readings = {word for spoken in readings
+                   for word in _spoken_words(spoken, lang)}
+    for k in (2, 3, 6, 9):
+        # the scale word inside a compound ("zweitausend", "fünftausend")
+        suffix = os.path.commonprefix([
+            (_quietly(pronounce_number, m * 10 ** k, lang) or "")[::-1]
+            for m in (2, 5, 7)])[::-1]
+        in_readings.update(_spoken_words(suffix, lang)[-1:])
+    negatives = {_quietly(_minus_word, lang)}
+    decimals = {word for word in _spoken_words(
+                _quietly(pronounce_number, 1.5, lang), lang)
+                if _quietly(extract_number, word, lang) in (False, None)}
+    joiners = set(_NUMBER_CONNECTORS.get(code, ()))
+    if code in _ROMANCE_ENGINES:
+        vocab = _load(_ROMANCE_ENGINES[code]).vocab
+        in_readings |= set(vocab.get_number_strings()) | \
+            set(vocab.get_ordinal_strings()) | set(vocab.get_fraction_strings())
+        negatives |= set(vocab.NEGATIVE_SIGN)
+        decimals |= set(vocab.DECIMAL_MARKER)
+        joiners |= set(vocab.JOIN_WORD)
+    one = _quietly(pronounce_number, 1, lang) or ""
+
+    index = {}
+    for word in in_readings | negatives | decimals | joiners:
+        if not word or " " in word or _NUMERIC_WORD.fullmatch(word):
+            continue
+        if word in negatives:
+            index[word] = (TokenKind.NEGATIVE, None)
+        elif word in decimals:
+            index[word] = (TokenKind.DECIMAL_MARKER, None)
+        elif word in joiners:
+            index[word] = (TokenKind.JOINER, None)
+        else:
+            kind = _classify_word(word, lang, one)
+            if kind is not None:
+                index[word] = kind
+    return index
+
+
+def _classify_word(word: str, lang: str, one: str):
+    """The kind and value of one word of a spoken number, in the order the
+    separate checks were run in: ordinal, fraction, then cardinal. None if
+    the word is no number by itself."""
+    ordinal = _quietly(is_ordinal, word, lang)
+    if ordinal is not None and ordinal is not False:
+        return TokenKind.ORDINAL, ordinal
+    fraction = _quietly(is_fractional, word, lang)
+    if fraction is not None and fraction is not False:
+        return TokenKind.FRACTION, fraction
+    value = _quietly(extract_number, word, lang)
+    if value is None or value is False:
+        ordinal = _quietly(extract_number, word, lang, ordinals=True)
+        if ordinal is not None and ordinal is not False:
+            return TokenKind.ORDINAL, ordinal
+        # a multiplier that is never said alone ("puluh" in "dua puluh")
+        value = _quietly(extract_number, f"{one} {word}", lang)
+        if value is None or value is False or not _is_power_of_ten(value):
+            return None
+        return TokenKind.SCALE, int(value)
+    if isinstance(value, float):
+        if not value.is_integer():
+            return TokenKind.FRACTION, value
+        value = int(value)
+    if value >= 100 and _is_power_of_ten(value):
+        return TokenKind.SCALE, value
+    return TokenKind.CARDINAL, value
+
+
+def _is_power_of_ten(value) -> bool:
+    return value >= 10 and value == int(value) and \
+        str(int(value)).rstrip("0") == "1"
+
+
+def classify_tokens(tokens: Iterable[str], lang: str) -> List[ClassifiedToken]:
+    """Classify each token by the role it plays in a spoken number.
+
+    One dict lookup per token replaces separate is_ordinal, is_fractional and
+    extract_number calls. The per-language index behind it is built on first
+    use (or by warmup) and then reused.
+
+    Args:
+        tokens (iterable of str): the words to classify
+        lang (str): a BCP-47 language code
+    Returns:
+        list of ClassifiedToken: ``(token, kind, value)`` per token, where
+        kind is a TokenKind and value the number for cardinal, ordinal,
+        fraction and scale words (None otherwise)
+    """
+    code = _backend_code(lang)
+    if code not in _EXTRACT_NUMBER:
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
+    index = _token_index(code)
+    none = (TokenKind.NONE, None)
+    classified = []
+    append = classified.append
+    for token in tokens:
+        if not isinstance(token, str):
+            append(ClassifiedToken(token, *none))
+            continue
+        kind = index.get(token.lower())
+        if kind is None:
+            kind = none
+            if token[-1:].isdigit() and _NUMERIC_WORD.fullmatch(token):
+                value = float(token)
+                kind = (TokenKind.CARDINAL,
+                        int(value) if value.is_integer() else value)
+        append(ClassifiedToken(token, *kind))
+    return classified
+
+
+class NumberParser:
+    """The public functions bound to one language and its settings.
+
+    Every module-level call re-derives the same things from the ``lang``
+    string: the backend, the canonical scale, the default digit reading and,
+    for Arabic, the default register. A handle resolves them once, so a
+    skill or session that always speaks one language can keep one around
+    instead of paying that setup on each call. Obtain one with
+    :func:`get_parser`.
+
+    Methods take the same arguments as the module-level functions minus
+    ``lang`` and the settings bound here; ``gender`` may still be overridden
+    per call.
+    """
+
+    def __init__(self, lang: str,
+                 scale: Optional[Scale] = None,
+                 gender: GrammaticalGender = GrammaticalGender.MASCULINE,
+                 case: Optional[str] = None):
+        info = _resolve_lang(lang)
+        code = info.code if info is not None else None
+        self.lang = lang
+        self.scale = _resolve_scale(lang, scale)
+        self.gender = gender
+        if case is None and info is not None:
+            case = info.ar_case
+        self.case = case
+        self.digits = _default_digits(lang)
+        self._short_scale = self.scale == Scale.SHORT
+        self._unglue = _base_lang(lang) not in _HYPHENATED_NUMERAL_LANGS
+        self._numbers_to_digits = _NUMBERS_TO_DIGITS.get(code)
+        self._pronounce_fraction = _PRONOUNCE_FRACTION.get(code)
+        self._pronounce_ordinal = _PRONOUNCE_ORDINAL.get(code)
+        self._extract_number = _EXTRACT_NUMBER.get(code)
+        self._is_fractional = _IS_FRACTIONAL.get(code)
+        self._is_ordinal = _IS_ORDINAL.get(code)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}({self.lang!r}, "
+                f"scale={self.scale}, gender={self.gender})")
+
+    def pronounce_number(self, number: Union[int, float],
+                         places: int = 3,
+                         scientific: bool = False,
+                         ordinals: bool = False,
+                         digits: Optional[DigitPronunciation] = None,
+                         gender: Optional[GrammaticalGender] = None) -> str:
+        """See :func:`pronounce_number`."""
+        return _pronounce_number(number, self.lang, places, scientific,
+                                 ordinals, digits or self.digits,
+                                 gender or self.gender, self.scale, self.case)
+
+    def pronounce_ordinal(self, number: Union[int, float],
+                          gender: Optional[GrammaticalGender] = None) -> str:
+        """See :func:`pronounce_ordinal`."""
+        return _pronounce_ordinal(number, self.lang, gender or self.gender,
+                                  self.scale, self._pronounce_ordinal)
+
+    def pronounce_fraction(self, fraction_word: str) -> str:
+        """See :func:`pronounce_fraction`."""
+        if self._pronounce_fraction is None:
+            return _pronounce_fraction_generic(fraction_word, self.lang)
+        return self._pronounce_fraction(fraction_word, self.scale)
+
+    def extract_number(self, text: str,
+                       ordinals: bool = False) -> Union[int, float, bool]:
+        """See :func:`extract_number`."""
+        if not isinstance(text, str):
+            return False
+        if self._extract_number is None:
+            raise NotImplementedError(f"Unsupported language: '{self.lang}'")
+        if self._unglue:
+            text = _COMPOUND_NUMERAL_JOIN.sub(" ", text)
+        return self._extract_number(text, self._short_scale, ordinals,
+                                    self.scale)
+
+    def numbers_to_digits(self, utterance: str) -> str:
+        """See :func:`numbers_to_digits`."""
+        if self._numbers_to_digits is None:
+            return _numbers_to_digits_generic(utterance, self.lang)
+        return self._numbers_to_digits(utterance, self.lang, self.scale)
+
+    def is_fractional(self, input_str: str) -> Union[bool, float]:
+        """See :func:`is_fractional`."""
+        if not isinstance(input_str, str):
+            return False
+        if self._is_fractional is None:
+            raise NotImplementedError(f"Unsupported language: '{self.lang}'")
+        return self._is_fractional(input_str, self._short_scale)
+
+    def is_ordinal(self, input_str: str) -> Union[bool, float]:
+        """See :func:`is_ordinal`."""
+        if self._is_ordinal is None:
+            return _is_ordinal_generic(input_str, self.lang)
+        return self._is_ordinal(input_str)
+
+
+def get_parser(lang: str,
+               scale: Optional[Scale] = None,
+               gender: GrammaticalGender = GrammaticalGender.MASCULINE,
+               case: Optional[str] = None) -> NumberParser:
+    """
+    Return a handle with the public functions bound to ``lang``.
+
+    The backend, scale convention, default digit reading and Arabic register
+    are resolved here once instead of on every call; see :class:`NumberParser`.
+
+    Args:
+        lang (str): BCP-47 language code.
+        scale (Scale, optional): short or long scale; the language's canonical
+            convention when omitted.
+        gender (GrammaticalGender): default grammatical gender for
+            pronunciation, overridable per call.
+        case (str, optional): Arabic register ("nominative" or "oblique");
+            the lect's own default when omitted, ignored elsewhere.
+    Returns:
+        NumberParser: the bound handle.
+
+    Example:
+        >>> en = get_parser("en")
+        >>> en.pronounce_number(21)
+        'twenty one'
+        >>> en.extract_number("twenty one")
+        21
+    """
+    return NumberParser(lang, scale=scale, gender=gender, case=case)
+
+
+# --- batches ----------------------------------------------------------------
+#
+# Offline jobs (corpus normalisation, TTS script generation) make the same
+# call millions of times, mostly on a few distinct values. A batch resolves the
+# language settings once, into one NumberParser, reads each distinct input
+# once, and can spread the work over worker processes. Results come back in
+# input order, as a generator, so a batch never has to fit in memory.
+
+#: distinct inputs a batch remembers the results of; past this the memory is
+#: dropped and starts over
+_BATCH_MEMO_LIMIT = 65536
+
+
+def _batch_key(item):
+    # 1, 1.0 and True are equal but spoken differently (see _pronounce_number)
+    if isinstance(item, str):
+        return item
+    return item.__class__, repr(item)
+
+
+@lru_cache(maxsize=16)
+def _batch_parser(lang: str, scale, gender, case) -> NumberParser:
+    return NumberParser(lang, scale=scale, gender=gender, case=case)
+
+
+def _run_batch(method: str, lang: str, settings: tuple, kwargs: dict,
+               items: list) -> list:
+    """Apply one NumberParser method to ``items``; the unit of work a worker
+    process receives."""
+    call = getattr(_batch_parser(lang, *settings), method)
+    return [call(item, **kwargs) for item in items]
+
+
+def _chunked(items: Iterable, size: int):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _batch_supports(method: str, lang: str) -> bool:
+    """Whether the single call behind a batch ``method`` serves ``lang``:
+    numbers_to_digits always does (the generic fallback), pronounce_number
+    through a backend or unicode-rbnf, extract_number through a backend
+    only."""
+    if method == "pronounce_number":
+        return _can_pronounce(lang)
+    if method == "extract_number":
+        return _backend_code(lang) in _EXTRACT_NUMBER
+    return True
+
+
+def _batch(method: str, items: Iterable, lang: str, settings: tuple,
+           kwargs: dict, workers: Optional[int], chunksize: int):
+    """``NumberParser.<method>(item, **kwargs)`` for every item, in order,
+    reading each distinct item once. Bad arguments raise here rather than at
+    the first ``next()``."""
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if not _batch_supports(method, lang):
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
+    return _batch_results(method, items, lang, settings, kwargs, workers,
+                          chunksize)
+
+
+def _batch_results(method, items, lang, settings, kwargs, workers, chunksize):
+    memo = {}
+
+    def submit(chunk, run):
+        keys = [_batch_key(item) for item in chunk]
+        known = {}
+        todo = {}
+        for key, item in zip(keys, chunk):
+            if key in memo:
+                known[key] = memo[key]
+            elif key not in todo:
+                todo[key] = item
+        return keys, known, list(todo), run(list(todo.values()))
+
+    def collect(keys, known, todo, results):
+        if len(memo) + len(todo) > _BATCH_MEMO_LIMIT:
+            memo.clear()
+        fresh = dict(zip(todo, results))
+        memo.update(fresh)
+        known.update(fresh)
+        return [known[key] for key in keys]
+
+    if not workers or workers <= 1:
+        def run(unique):
+            return _run_batch(method, lang, settings, kwargs, unique)
+        for chunk in _chunked(items, chunksize):
+            yield from collect(*submit(chunk, run))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(max_workers=workers)
+
+    def run(unique):
+        return pool.submit(_run_batch, method, lang, settings, kwargs, unique)
+
+    pending = deque()
+    try:
+        for chunk in _chunked(items, chunksize):
+            pending.append(submit(chunk, run))
+            # a few chunks ahead keep every worker busy without reading the
+            # whole input
+            while len(pending) > 2 * workers:
+                keys, known, todo, future = pending.popleft()
+                yield from collect(keys, known, todo, future.result())
+        while pending:
+            keys, known, todo, future = pending.popleft()
+            yield from collect(keys, known, todo, future.result())
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def pronounce_numbers(numbers: Iterable[Union[int, float]], lang: str,
+                      places: int = 3,
+                      scientific: bool = False,
+                      ordinals: bool = False,
+                      digits: Optional[DigitPronunciation] = None,
+                      gender: GrammaticalGender = GrammaticalGender.MASCULINE,
+                      scale: Optional[Scale] = None,
+                      case: Optional[str] = None,
+                      workers: Optional[int] = None,
+                      chunksize: int = 1000) -> Iterator[str]:
+    """pronounce_number over many numbers.
+
+    Args:
+        numbers (iterable): the numbers to speak
+        lang (str): a BCP-47 language code
+        places, scientific, ordinals, digits, gender, scale, case: as for
+            pronounce_number
+        workers (int, optional): spread the chunks over this many worker
+            processes; in this process when omitted
+        chunksize (int): numbers per chunk of work
+    Returns:
+        generator of str: the spoken forms, in the order of ``numbers``
+    """
+    return _batch("pronounce_number", numbers, lang, (scale, gender, case),
+                  {"places": places, "scientific": scientific,
+                   "ordinals": ordinals, "digits": digits},
+                  workers, chunksize)
+
+
+def extract_number_batch(texts: Iterable[str], lang: str,
+                         ordinals: bool = False,
+                         scale: Optional[Scale] = None,
+                         workers: Optional[int] = None,
+                         chunksize: int = 1000
+                         ) -> Iterator[Union[int, float, bool]]:
+    """extract_number over many texts.
+
+    Args:
+        texts (iterable of str): the strings to extract a number from
+        lang (str): a BCP-47 language code
+        ordinals, scale: as for extract_number
+        workers (int, optional): spread the chunks over this many worker
+            processes; in this process when omitted
+        chunksize (int): texts per chunk of work
+    Returns:
+        generator: the number of each text, or False, in the order of
+        ``texts``
+    """
+    return _batch("extract_number", texts, lang,
+                  (scale, GrammaticalGender.MASCULINE, None),
+                  {"ordinals": ordinals}, workers, chunksize)
+
+
+def numbers_to_digits_batch(utterances: Iterable[str], lang: str,
+                            scale: Optional[Scale] = None,
+                            workers: Optional[int] = None,
+                            chunksize: int = 1000) -> Iterator[str]:
+    """numbers_to_digits over many utterances.
+
+    Args:
+        utterances (iterable of str): the texts to convert
+        lang (str): a BCP-47 language code
+        scale: as for numbers_to_digits
+        workers (int, optional): spread the chunks over this many worker
+            processes; in this process when omitted
+        chunksize (int): utterances per chunk of work
+    Returns:
+        generator of str: the converted texts, in the order of ``utterances``
+    """
+    return _batch("numbers_to_digits", utterances, lang,
+                  (scale, GrammaticalGender.MASCULINE, None), {},
+                  workers, chunksize)
+
+
+# --- streaming --------------------------------------------------------------
+
+#: distinct words a StreamingNumberNormalizer remembers the kind of
+_STREAM_MEMO_LIMIT = 4096
+
+#: words that are no number but may lead from an open number into its
+#: fraction: the articles and fraction markers of "two and a half", "два с
+#: половиной", "twa en in heal"
+_FRACTION_LEAD_INS = {
+    "en": {"a", "an"}, "fy": {"in"}, "ru": {"и", "с"}, "uk": {"і", "та", "з"},
+    "pl": {"i"}, "cs": {"a"}, "sk": {"a"}, "tr": {"ve"}, "az": {"və"},
+    "hr": {"i"},
+}
+
+
+class StreamingNumberNormalizer:
+    """numbers_to_digits for a transcript that arrives a word at a time.
+
+    Words are pushed as the recogniser emits them. A word that can take no
+    part in a number ends whatever number came before it, so from there on
+    the text can no longer change: it is converted and handed back. Only an
+    open number span ("two hundred", which "and five" may still extend) is
+    held back, together with an article or fraction marker that follows it
+    ("two and a", which "half" may still extend). Each word costs one lookup in the classify_tokens index, and
+    each span is converted once, when it closes, instead of the whole
+    hypothesis being read again on every update.
+
+    Example:
+        >>> stream = StreamingNumberNormalizer("en")
+        >>> stream.push("I have two hundred")
+        'I have'
+        >>> stream.push("and five")
+        ''
+        >>> stream.push("apples")
+        '205 apples'
+    """
+
+    def __init__(self, lang: str, scale: Optional[Scale] = None):
+        code = _backend_code(lang)
+        if code not in _EXTRACT_NUMBER:
+            raise NotImplementedError(f"Unsupported language: '{lang}'")
+        self.lang = lang
+        self._parser = NumberParser(lang, scale=scale)
+        self._index = _token_index(code)
+        self._lead_ins = _FRACTION_LEAD_INS.get(code, ())
+        self._numeric = {}
+        self._held: List[str] = []
+
+    @property
+    def pending(self) -> str:
+        """The words held back, as received."""
+        return " ".join(self._held)
+
+    def push(self, words: str) -> str:
+        """Append one or more words and return the text they settled,
+        converted ("" if everything is still open)."""
+        settled = []
+        for word in words.split():
+            self._held.append(word)
+            if self._ends_span(word):
+                settled.append(self._parser.numbers_to_digits(
+                    " ".join(self._held)))
+                self._held = []
+        return " ".join(settled)
+
+    def flush(self) -> str:
+        """Convert and return the words still held back, at the end of an
+        utterance."""
+        if not self._held:
+            return ""
+        text = self._parser.numbers_to_digits(" ".join(self._held))
+        self._held = []
+        return text
+
+    def reset(self):
+        """Drop the words held back, for a new utterance."""
+        self._held = []
+
+    def _ends_span(self, word: str) -> bool:
+        trail = word[len(word.rstrip(_SPAN_PUNCT)):]
+        if any(c in _CLAUSE_MARKS for c in trail):
+            # so does the end of a clause ("two hundred.")
+            return True
+        word = word.strip(_SPAN_PUNCT).lower()
+        if word in self._lead_ins and len(self._held) > 1:
+            # "two and a": the next word tells whether a fraction follows
+            return False
+        return not self._is_numeric(word)
+
+    def _is_numeric(self, word: str) -> bool:
+        if word in self._index or any(c in _DIGIT_CHARS for c in word):
+            return True
+        # numerals the index does not hold ("dreihundertzwanzig")
+        numeric = self._numeric.get(word)
+        if numeric is None:
+            value = self._parser.extract_number(word)
+            numeric = value is not False and value is not None
+            if len(self._numeric) >= _STREAM_MEMO_LIMIT:
+                self._numeric.clear()
+            self._numeric[word] = numeric
+        return numeric
+
+
+# --- TTS normalization ------------------------------------------------------
+#
+# A speech synthesiser reads "1.234,5" or "21st" badly, so the numbers in a
+# text are spoken out before it is handed over. Every language gets one
+# scanner, compiled the first time it is needed, that knows how the language
+# writes decimals, thousands and ordinals; each distinct number a text
+# contains is then spoken once, through one NumberParser.
+
+#: languages that write a decimal comma and group thousands with a point;
+#: the rest write a decimal point and group with a comma, as English,
+#: Japanese, Chinese and Hindi do ("1,000円", "1,000 रुपये")
+_DECIMAL_COMMA_LANGS = frozenset((
+    # with a parser of their own
+    "an", "ast", "az", "bg", "ca", "cs", "da", "de", "el", "es", "et", "eu",
+    "fi", "fr", "fy", "gl", "hr", "hu", "id", "it", "kab", "mwl", "nb", "nl",
+    "nn", "oc", "pl", "pt", "pt-br", "ro", "ru", "sk", "sl", "sv", "tr", "uk",
+    # read through unicode-rbnf
+    "be", "bs", "fo", "hy", "is", "ka", "kk", "ky", "lb", "lt", "lv", "mk",
+    "sq", "sr", "uz", "vi"))
+
+#: decimal and grouping marks of the languages that have their own
+_NUMBER_MARKS = {
+    "ar": ("." "٫", "," "٬"),
+    "fa": ("." "٫" "/", "," "٬"),
+}
+
+#: no-break spaces, which group thousands in every language ("1 234 567")
+_GROUPING_SPACES = "\u00a0\u202f"
+
+_ROMANCE_ORDINAL_MARKS = {
+    "º": GrammaticalGender.MASCULINE, ".º": GrammaticalGender.MASCULINE,
+    "ª": GrammaticalGender.FEMININE, ".ª": GrammaticalGender.FEMININE,
+}
+
+#: written ordinal suffixes ("21st", "2ª", "3e") and the gender they mark;
+#: languages that mark an ordinal with a bare point ("21.") are left out, as
+#: that cannot be told apart from the end of a sentence
+_ORDINAL_SUFFIXES = {
+    "en": dict.fromkeys(("st", "nd", "rd", "th"),
+                        GrammaticalGender.MASCULINE),
+    "fr": {"er": GrammaticalGender.MASCULINE,
+           "re": GrammaticalGender.FEMININE,
+           "ère": GrammaticalGender.FEMININE,
+           "e": GrammaticalGender.MASCULINE,
+           "ème": GrammaticalGender.MASCULINE,
+           "eme": GrammaticalGender.MASCULINE,
+           "nd": GrammaticalGender.MASCULINE,
+           "nde": GrammaticalGender.FEMININE},
+    "nl": dict.fromkeys(("e", "ste", "de"), GrammaticalGender.MASCULINE),
+    "sv": dict.fromkeys((":a", ":e"), GrammaticalGender.MASCULINE),
+    **dict.fromkeys(("an", "ast", "ca", "es", "gl", "it", "mwl", "oc", "pt",
+                     "pt-br"), _ROMANCE_ORDINAL_MARKS),
+}
+
+#: one sentence and the whitespace after it; a point inside a number
+#: ("1.5") is not followed by a space and does not end one
+_SENTENCE = re.compile(r".*?(?:[.!?…。؟]+(?=\s)\s*|\Z)", re.DOTALL)
+
+#: distinct numbers normalize_for_tts remembers the reading of
+_TTS_MEMO_LIMIT = 4096
+
+
+@lru_cache(maxsize=None)
+def _tts_scanner(code: str) -> "re.Pattern":
+    """The pattern that finds the written numbers of ``code``: an optional
+    sign, the integer part (plain or grouped), then a decimal part or an
+    ordinal suffix."""
+    if code in _NUMBER_MARKS:
+        decimal, grouping = _NUMBER_MARKS[code]
+    elif code in _DECIMAL_COMMA_LANGS:
+        decimal, grouping = ",", "."
+    else:
+        decimal, grouping = ".", ","
+    grouping += _GROUPING_SPACES
+    fraction = rf"[{re.escape(decimal)}](?P<fraction>\d+)"
+    if decimal == ",":
+        # "3.5" is still a decimal where "3.500" would be three thousand
+        # five hundred
+        fraction += r"|\.(?P<point>\d{1,2}|\d{4,})(?!\d)"
+    suffixes = sorted(_ORDINAL_SUFFIXES.get(code, ()), key=len, reverse=True)
+    if suffixes:
+        fraction += "|(?P<ordinal>{})(?!\\w)".format(
+            "|".join(map(re.escape, suffixes)))
+    return re.compile(
+        rf"(?<!\w)(?P<sign>[-−](?=\d))?"
+        rf"(?P<integer>\d{{1,3}}(?:[{re.escape(grouping)}]\d{{3}})+(?!\d)"
+        rf"|\d+)(?:{fraction})?",
+        re.IGNORECASE)
+
+
+def _tts_reading(match, parser: NumberParser, code: str) -> str:
+    found = match.groupdict()
+    integer = re.sub(r"\D", "", found["integer"])
+    if found.get("ordinal") is not None:
+        gender = _ORDINAL_SUFFIXES[code][found["ordinal"].lower()]
+        spoken = parser.pronounce_ordinal(int(integer), gender=gender)
+        return (found["sign"] or "") + spoken
+    fraction = found["fraction"] or found.get("point")
+    number = int(integer) if fraction is None \
+        else float(f"{integer}.{fraction}")
+    if found["sign"]:
+        number = -number
+    return parser.pronounce_number(number, places=len(fraction or ""))
+
+
+def normalize_for_tts(text: str, lang: str,
+                      scale: Optional[Scale] = None,
+                      gender: GrammaticalGender = GrammaticalGender.MASCULINE
+                      ) -> Iterator[str]:
+    """
+    Spell out the written numbers of ``text``, a sentence at a time.
+
+    Integers, decimals and negatives are read with the language's own
+    decimal and grouping marks ("1.234,5" in German, "1,234.5" in English);
+    written ordinals ("21st", "2ª", "3e") are read as ordinals. Each sentence
+    is yielded with the whitespace that follows it, so joining the results
+    with "" gives back the whole text.
+
+    Args:
+        text (str): the text to normalise, as long as an article
+        lang (str): a BCP-47 language code
+        scale (Scale, optional): short or long scale; the language's own
+            convention when omitted
+        gender (GrammaticalGender): the gender cardinals are read in
+    Returns:
+        generator of str: the sentences of ``text`` with numbers spelled out
+    Raises:
+        NotImplementedError: raised at the call when pronounce_number cannot
+            speak ``lang``, because it has no native backend and unicode-rbnf
+            has no rules for it
+
+    Example:
+        >>> "".join(normalize_for_tts("Er zahlte 1.234,5 Euro.", "de"))
+        'Er zahlte eintausendzweihundertvierunddreißig Komma fünf Euro.'
+    """
+    if not _can_pronounce(lang):
+        raise NotImplementedError(f"Unsupported language: '{lang}'")
+    # a language read through unicode-rbnf has no backend code
+    code = _backend_code(lang) or _base_lang(lang)
+    return _normalized_sentences(text, code, _tts_scanner(code),
+                                 NumberParser(lang, scale=scale, gender=gender))
+
+
+def _normalized_sentences(text, code, scanner, parser):
+    memo = {}
+
+    def speak(match):
+        written = match.group(0)
+        spoken = memo.get(written)
+        if spoken is None:
+            if len(memo) >= _TTS_MEMO_LIMIT:
+                memo.clear()
+            spoken = memo[written] = _tts_reading(match, parser, code)
+        return spoken
+
+    for sentence in _SENTENCE.finditer(text or ""):
+        if sentence.group(0):
+            yield scanner.sub(speak, sentence.group(0))
+
+
+# --- warmup -----------------------------------------------------------------
+
+#: one tag per backend, the languages warmup() prepares by default
+_WARMUP_LANGS = tuple(code for code in _BACKEND_PREFIXES if code != "no") \
+    + ("pt-br", "ar")
+
+
+def warmup(langs: Optional[Iterable[str]] = None, freeze: bool = False) -> None:
+    """
+    Build the lazily built state of ``langs`` now rather than on first use.
+
+    Language modules, compiled lexicons, token indexes, TTS scanners,
+    ordinal reverse tables, unicode-rbnf engines and the spoken minus sign
+    are all built on the first call that needs them, which puts hundreds of
+    milliseconds on the first request in each language. warmup() imports and
+    builds them up front by running every public function once per language
+    and scale.
+    With enable_pronounce_tables() on, it also fills the default cardinal,
+    ordinal and fraction tables, which can take a few seconds per language.
+
+    Args:
+        langs: BCP-47 language codes; every supported language by default.
+        freeze (bool): collect garbage and then ``gc.freeze()`` everything
+            that is left. In a pre-fork server, call ``warmup(freeze=True)``
+            in the parent before forking: the garbage collector then leaves
+            the warmed objects alone, so forked workers keep sharing their
+            memory pages copy-on-write instead of each touching a copy.
+    """
+    for lang in (_WARMUP_LANGS if langs is None else langs):
+        _warm(lang)
+    gc.collect()
+    if freeze:
+        gc.freeze()
+
+
+def _warm(lang: str):
+    preload_rbnf_engines([lang])
+    spoken = _quietly(pronounce_number, 21, lang)
+    ordinal = _quietly(pronounce_ordinal, 3, lang)
+    text = f"{spoken or ''} {ordinal or ''}"
+    for scale in Scale:
+        _quietly(pronounce_number, -2.5, lang, scale=scale)
+        _quietly(pronounce_ordinal, 3, lang, scale=scale)
+        _quietly(pronounce_fraction, "-1/2", lang, scale=scale)
+        _quietly(extract_number, text, lang, scale=scale)
+        _quietly(extract_number, text, lang, scale=scale, ordinals=True)
+        _quietly(numbers_to_digits, text, lang, scale=scale)
+        _quietly(is_fractional, text, lang, scale=scale)
+    _quietly(is_ordinal, ordinal or "", lang)
+    _quietly(classify_tokens, (), lang)
+    _quietly(normalize_for_tts, "", lang)
+    if _PRONOUNCE_TABLES.enabled:
+        # one lookup per block builds the whole block
+        for n in range(0, _TABLE_LIMIT, _TABLE_BLOCK):
+            _quietly(pronounce_number, n, lang)
+            _quietly(pronounce_ordinal, n, lang)
+        for denominator in range(2, _TABLE_FRACTION_LIMIT + 1):
+            _quietly(pronounce_fraction, f"1/{denominator}", lang)
+
+
+def _quietly(fn, *args, **kwargs):
+    """``fn(*args, **kwargs)``, or None for a function the language does
+    not offer (or a value it cannot read)."""
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        return None
+
+
+# ``from ovos_number_parser import *`` exports what the eager imports used to:
+# the public names defined here, plus every per-language name, each of which
+# is loaded through ``__getattr__`` as the star import asks for it
+__all__ = sorted(
+    {name for name, value in globals().items()
+     if not name.startswith("_") and not isinstance(value, ModuleType)}
+    | set(_LAZY_ATTRS))
@@ -0,0 +1,163 @@
+"""asyncio front end: the public functions as coroutines.
+
+Parsing a long transcript is CPU work, and called from a coroutine it stalls
+the whole event loop. Every coroutine here runs its function in an executor
+instead: a shared thread pool of ``min(4, cpu_count)`` workers by default,
+or any ``concurrent.futures`` executor handed to :func:`configure`. Calls
+that are identical and in flight at the same time are run once and share
+the result, so a burst of the same utterance is parsed once; a list result
+is copied for each caller.
+
+    >>> from ovos_number_parser import aio
+    >>> await aio.extract_number("set a timer for twenty one minutes", "en")
+    21
+
+The coroutines take the same arguments as the functions they are named
+after. The in-flight table and the executor are shared by every event loop
+and thread of the process.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional
+
+import ovos_number_parser
+from ovos_number_parser import _batch_key
+from ovos_number_parser.util import GrammaticalGender, Scale
+
+#: size of the default thread pool
+_DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+_LOCK = threading.Lock()
+_executor: Optional[Executor] = None
+_owns_executor = False
+_max_workers = _DEFAULT_WORKERS
+#: calls submitted and not finished yet, by their arguments
+_in_flight: Dict[Hashable, Future] = {}
+
+
+def configure(max_workers: Optional[int] = None,
+              executor: Optional[Executor] = None) -> None:
+    """
+    Choose where the coroutines run their work, for calls made from now on.
+
+    Args:
+        max_workers (int, optional): threads in the default pool; the pool
+            is started on the next call. ``min(4, cpu_count)`` when omitted.
+        executor (Executor, optional): run the work on this executor
+            instead, e.g. a ProcessPoolExecutor to use more than one core.
+            It stays the caller's to shut down.
+    Raises:
+        ValueError: both arguments were given, or ``max_workers < 1``
+    """
+    global _executor, _owns_executor, _max_workers
+    if max_workers is not None and executor is not None:
+        raise ValueError("pass max_workers or executor, not both")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    with _LOCK:
+        previous = _executor if _owns_executor else None
+        _executor = executor
+        _owns_executor = False
+        _max_workers = max_workers or _DEFAULT_WORKERS
+    if previous is not None:
+        # calls already submitted still finish
+        previous.shutdown(wait=False)
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut the default thread pool down; the next call starts a new one.
+    An executor passed to :func:`configure` is left alone."""
+    global _executor, _owns_executor
+    with _LOCK:
+        previous = _executor if _owns_executor else None
+        if previous is not None:
+            _executor = None
+            _owns_executor = False
+    if previous is not None:
+        previous.shutdown(wait=wait)
+
+
+def _get_executor() -> Executor:
+    # called with _LOCK held
+    global _executor, _owns_executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_max_workers,
+                                       thread_name_prefix="ovos-number-parser")
+        _owns_executor = True
+    return _executor
+
+
+def _submit(fn, args: tuple, kwargs: dict) -> Future:
+    """The running call of ``fn`` with these arguments, or a new one."""
+    key = (fn, tuple(map(_batch_key, args)),
+           tuple((arg, _batch_key(value))
+                 for arg, value in sorted(kwargs.items())))
+    with _LOCK:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        future = _get_executor().submit(fn, *args, **kwargs)
+        _in_flight[key] = future
+    # outside the lock: a call that has already finished runs the callback
+    # right here
+    future.add_done_callback(functools.partial(_landed, key))
+    return future
+
+
+def _landed(key, future: Future):
+    with _LOCK:
+        if _in_flight.get(key) is future:
+            del _in_flight[key]
+
+
+async def _offload(fn, args: tuple, kwargs: dict):
+    # shielded, so a caller that is cancelled does not cancel the call for
+    # the others waiting on it
+    result = await asyncio.shield(asyncio.wrap_future(
+        _submit(fn, args, kwargs)))
+    # callers that shared the call each get their own list: what is in one
+    # (numbers, strings, named tuples) cannot be changed, the list can
+    return list(result) if isinstance(result, list) else result
+
+
+def _coroutine(name: str):
+    fn = getattr(ovos_number_parser, name)
+
+    @functools.wraps(fn, updated=())
+    async def call(*args, **kwargs):
+        # looked up per call, so a patched function is the one that runs
+        return await _offload(getattr(ovos_number_parser, name), args,
+                              kwargs)
+
+    call.__doc__ = (f"Awaitable :func:`ovos_number_parser.{name}`, run in "
+                    f"the executor.")
+    return call
+
+
+pronounce_number = _coroutine("pronounce_number")
+pronounce_ordinal = _coroutine("pronounce_ordinal")
+pronounce_fraction = _coroutine("pronounce_fraction")
+extract_number = _coroutine("extract_number")
+extract_numbers = _coroutine("extract_numbers")
+numbers_to_digits = _coroutine("numbers_to_digits")
+is_fractional = _coroutine("is_fractional")
+is_ordinal = _coroutine("is_ordinal")
+classify_tokens = _coroutine("classify_tokens")
+
+
+def _tts_sentences(text: str, lang: str, scale: Optional[Scale],
+                   gender: GrammaticalGender) -> List[str]:
+    return list(ovos_number_parser.normalize_for_tts(text, lang, scale=scale,
+                                                     gender=gender))
+
+
+async def normalize_for_tts(text: str, lang: str,
+                            scale: Optional[Scale] = None,
+                            gender: GrammaticalGender =
+                            GrammaticalGender.MASCULINE) -> List[str]:
+    """Awaitable :func:`ovos_number_parser.normalize_for_tts`, run in the
+    executor; returns the list of sentences rather than a generator."""
+    return await _offload(_tts_sentences, (text, lang, scale, gender), {})
@@ -17,10 +17,14 @@
 import math
 import re
 from collections import OrderedDict
+from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
 
 from ovos_number_parser.util import (invert_dict, convert_to_mixed_fraction, tokenize, look_for_fractions,
-                                     partition_list, is_numeric, Token, ReplaceableNumber)
+                                     is_numeric, Token, TokenNumberExtractor)
 
 _ARTICLES_EN = {'a', 'an', 'the'}
 
@@ -638,6 +642,7 @@ _COMPOUND_JOIN_RE_EN = re.compile(r"(?<=[^\W\d_])[-_](?=[^\W\d_])", re.UNICODE)
 #: A comma between two number words is spoken punctuation inside one numeral
 #: ("two thousand, five hundred"), not a separator.
 _SPOKEN_COMMA_RE_EN = re.compile(r"\b(\w+),(\s+)(?=\w)", re.UNICODE)
+_WORD_RE_EN = re.compile(r"\w+", re.UNICODE)
 
 
 def _numeral_separators_en(text):
@@ -659,8 +664,9 @@ def _numeral_separators_en(text):
 
     def _drop(match):
         before = match.group(1)
-        after = text[match.end():].split(maxsplit=1)[0] if text[match.end():].split() else ""
-        after = re.split(r"\W", after, maxsplit=1)[0]
+        # the word the comma leads to, read in place: slicing off the rest of
+        # the text for every comma made long transcripts quadratic
+        after = _WORD_RE_EN.match(text, match.end()).group(0)
         if _is_number_word(before) and _is_number_word(after):
             return f"{before}{match.group(2)}"
         return match.group(0)
@@ -731,26 +737,8 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return _ENGINE_EN.extract_numbers(tokens, short_scale, ordinals,
+                                      fractional_numbers)
 
 
 def _extract_number_with_text_en(tokens, short_scale=True,
@@ -768,161 +756,13 @@ def _extract_number_with_text_en(tokens, short_scale=True,
         ReplaceableNumber
 
     """
-    number, tokens = \
-        _extract_number_with_text_en_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    while tokens and tokens[0].word in _ARTICLES_EN:
-        tokens.pop(0)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_en_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_en.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_en(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_en(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_en(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_en(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string.
-
-    This function handles text such as '2 and 3/4'. Note that "one half" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER_EN:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_en(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_en(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                       num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_en(tokens, short_scale, ordinals):
-    """
-    Extract decimal numbers from a string.
-
-    This function handles text such as '2 point 5'.
-
-    Notes:
-        While this is a helper for extractnumber_en, it also depends on
-        extractnumber_en, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
+    return _ENGINE_EN.extract_number(tokens, short_scale, ordinals,
+                                     fractional_numbers)
 
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
 
-    """
-    for c in _DECIMAL_MARKER_EN:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_en(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_en(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-            # concatenate consecutive single digits after the marker
-            # ("point one four" -> .14)
-            _digits = ""
-            _digit_tokens = []
-            _prev_end = None
-            for _num in numbers2:
-                _v = _num.value
-                if _v is None or _v is False or float(_v) != int(_v) \
-                        or not 0 <= _v <= 9:
-                    break
-                if _prev_end is not None and _num.start_index != _prev_end + 1:
-                    break
-                _digits += str(int(_v))
-                _digit_tokens.extend(_num.tokens)
-                _prev_end = _num.end_index
-            if len(_digits) > 1:
-                _frac = float("0." + _digits)
-                return (number.value - _frac if (number.value < 0 or any(_t.word.lower() in _NEGATIVES_EN for _t in number.tokens))
-                        else number.value + _frac), \
-                    number.tokens + partitions[1] + _digit_tokens
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                _frac2 = float('0.' + str(decimal.value))
-                return (number.value - _frac2 if (number.value < 0 or any(_t.word.lower() in _NEGATIVES_EN for _t in number.tokens))
-                        else number.value + _frac2), \
-                       number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
+def _extract_whole_number_with_text_en(tokens, short_scale, ordinals,
+                                       start=0, scale_after=None,
+                                       starts=None):
     """
     Handle numbers not handled by the decimal or fraction functions. This is
     generally whole numbers. Note that phrases such as "one half" will be
@@ -933,14 +773,24 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
         tokens [Token]:
         short_scale boolean:
         ordinals boolean:
+        start int: position to start reading at; reading from there must be
+            the same as reading from the first token
+        scale_after [number]: scale word lookahead table for ``tokens``
+            (TokenNumberExtractor.scale_after), computed here when not given
+        starts [int]: when given, the position of every number begun
+            after another one was read is appended to it
 
     Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
+        int or float, [Tokens], int
+        The value parsed, the tokens it corresponds to, and the last position
+        reached with nothing read yet: a later read of the same tokens can
+        start there.
 
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data_en(short_scale, speech=ordinals is not None)
+    if scale_after is None:
+        scale_after = _ENGINE_EN.scale_after(tokens, short_scale)
 
     number_words = []  # type: [Token]
     val = False
@@ -948,7 +798,11 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     next_val = None
     negative = False
     to_sum = []
-    for idx, token in enumerate(tokens):
+    fresh = start
+    for idx in range(start, len(tokens)):
+        token = tokens[idx]
+        if val is False and not number_words:
+            fresh = idx
         current_val = None
         if next_val:
             next_val = None
@@ -1011,9 +865,13 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 and not (ordinals and prev_word in string_num_ordinal) \
                 and prev_word not in _NEGATIVES_EN \
                 and prev_word not in _ARTICLES_EN:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
 
         elif prev_word in _SUMS_EN and word in _SUMS_EN:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         elif ordinals is None and \
                 (word in string_num_ordinal or word in _SPOKEN_EXTRA_NUM_EN):
@@ -1048,8 +906,11 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
 
         # is the prev word a number and should we sum it?
         # twenty two, fifty six
+        # (a scale word after a larger one multiplies below, it is not added
+        # first: "million hundred" would otherwise square the million)
         if (prev_word in _SUMS_EN and val and val < 10) or all([prev_word in
                                                                 multiplies,
+                                                                word not in multiplies,
                                                                 val < prev_val if prev_val else False]):
             val = prev_val + val
 
@@ -1162,15 +1023,8 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 # >>> extract_number(foo)
                 # 9907657
 
-                time_to_sum = True
-                for other_token in tokens[idx + 1:]:
-                    if other_token.word.lower() in multiplies:
-                        if string_num_scale[other_token.word.lower()] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
+                later = scale_after[idx + 1]
+                time_to_sum = later is None or not later >= current_val
                 if time_to_sum:
                     to_sum.append(val)
                     val = 0
@@ -1182,14 +1036,69 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     if negative and val:
         val = -val
 
-    return val, number_words
+    return val, number_words, fresh
+
+
+@dataclass(frozen=True)
+class _LexiconEN:
+    """Word tables for one scale and speech setting, built once by
+    ``_lexicon_en`` and shared by every extraction and classification call.
+
+    Attributes:
+        multiplies: scale words ("hundred", "millions", "googol")
+        string_num_ordinal: ordinal word -> value
+        string_num_scale: scale word (and, with speech, "half"/"couple")
+            -> value
+        fractions: fraction word, singular -> denominator
+        ordinal_words: singular ordinal names that double as denominators
+            ("third", "fifth")
+    """
+    multiplies: FrozenSet[str]
+    string_num_ordinal: Mapping[str, int]
+    string_num_scale: Mapping[str, float]
+    fractions: Mapping[str, int]
+    ordinal_words: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def _lexicon_en(short_scale=True, speech=True):
+    """The compiled ``_LexiconEN`` for a scale and speech setting."""
+    short_scale = bool(short_scale)
+    ordinal_names = _SHORT_ORDINAL_EN if short_scale else _LONG_ORDINAL_EN
+
+    string_num_scale = invert_dict(_SHORT_SCALE_EN if short_scale
+                                   else _LONG_SCALE_EN)
+    string_num_scale.update(_generate_plurals_en(string_num_scale))
+    # "googol" is a named power of ten (10^100), not part of the -illion series;
+    # accept it as a scale word so "one googol" reads as 1e100. "googolplex"
+    # (10^(10^100)) overflows a float and is intentionally not recognised.
+    string_num_scale["googol"] = 1e100
+    if speech:
+        string_num_scale.update(_SPOKEN_EXTRA_NUM_EN)
+
+    fractions = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    fractions.update((name, num) for num, name in ordinal_names.items()
+                     if num > 2)
+
+    return _LexiconEN(
+        multiplies=frozenset(_MULTIPLIES_SHORT_SCALE_EN if short_scale
+                             else _MULTIPLIES_LONG_SCALE_EN) | {"googol"},
+        string_num_ordinal=MappingProxyType(
+            _STRING_SHORT_ORDINAL_EN if short_scale
+            else _STRING_LONG_ORDINAL_EN),
+        string_num_scale=MappingProxyType(string_num_scale),
+        fractions=MappingProxyType(fractions),
+        ordinal_words=frozenset(name for num, name in ordinal_names.items()
+                                if num > 2))
 
 
 def _initialize_number_data_en(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
 
-    This is a helper function for _extract_whole_number.
+    This is a helper function for _extract_whole_number. The tables are
+    compiled once per (short_scale, speech) by ``_lexicon_en`` and returned
+    read-only.
 
     Args:
         short_scale (bool):
@@ -1200,25 +1109,24 @@ def _initialize_number_data_en(short_scale, speech=True):
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
-        else _MULTIPLIES_LONG_SCALE_EN
+    lexicon = _lexicon_en(bool(short_scale), bool(speech))
+    return lexicon.multiplies, lexicon.string_num_ordinal, \
+        lexicon.string_num_scale
 
-    string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
-        else _STRING_LONG_ORDINAL_EN
 
-    string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
-    string_num_scale_en = invert_dict(string_num_scale_en)
-    string_num_scale_en.update(_generate_plurals_en(string_num_scale_en))
+def _scale_words_en(short_scale):
+    multiplies, _, string_num_scale = _initialize_number_data_en(short_scale)
+    return multiplies, string_num_scale
 
-    # "googol" is a named power of ten (10^100), not part of the -illion series;
-    # accept it as a scale word so "one googol" reads as 1e100. "googolplex"
-    # (10^(10^100)) overflows a float and is intentionally not recognised.
-    multiplies = multiplies | {"googol"}
-    string_num_scale_en["googol"] = 1e100
 
-    if speech:
-        string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+_ENGINE_EN = TokenNumberExtractor(
+    _extract_whole_number_with_text_en,
+    fraction_markers=_FRACTION_MARKER_EN,
+    decimal_markers=_DECIMAL_MARKER_EN,
+    scale_words=_scale_words_en,
+    lowercase=True,
+    negatives=_NEGATIVES_EN,
+    articles=_ARTICLES_EN)
 
 
 def extract_number_en(text, short_scale=True, ordinals=False):
@@ -1237,13 +1145,17 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                    was found
 
     """
+    return _extract_number_with_text_en(tokenize(_normalize_en(text)),
+                                        short_scale, ordinals).value
+
+
+def _normalize_en(text, short_scale=True):
+    """Lowercase ``text`` and drop the commas that do not separate numbers:
+    digit grouping ("1,000,000") and spoken-style commas ("two thousand,
+    twenty three")."""
     text = text.lower()
-    # digit grouping ("1,000,000") and spoken-style commas
-    # ("two thousand, twenty three")
     text = re.sub(r"(?<=\d),(?=\d{3}\b)", "", text)
-    text = re.sub(r"(?<=[a-z]),", "", text)
-    return _extract_number_with_text_en(tokenize(text),
-                                        short_scale, ordinals).value
+    return re.sub(r"(?<=[a-z]),", "", text)
 
 
 def _is_ordinal_word_en(input_str, short_scale=True):
@@ -1252,8 +1164,7 @@ def _is_ordinal_word_en(input_str, short_scale=True):
     The plural ("thirds", "fifths") is excluded: that is unambiguously a
     fraction denominator, while the singular is the ordinal.
     """
-    table = _SHORT_ORDINAL_EN if short_scale else _LONG_ORDINAL_EN
-    return input_str.lower() in {name for num, name in table.items() if num > 2}
+    return input_str.lower() in _lexicon_en(bool(short_scale)).ordinal_words
 
 
 def _fraction_value_en(input_str, short_scale=True, spoken=True, ordinals=True):
@@ -1284,19 +1195,12 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
         (bool) or (float): False if not a fraction, otherwise the fraction
 
     """
+    if not spoken:
+        return False
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
-    if input_str.lower() in fracts and spoken:
-        return 1.0 / fracts[input_str.lower()]
-    return False
+    den = _lexicon_en(bool(short_scale)).fractions.get(input_str.lower())
+    if den is None:
+        return False
+    return 1.0 / den
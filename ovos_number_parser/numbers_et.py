@@ -13,6 +13,7 @@ References:
     * https://et.wikipedia.org/wiki/Arvs%C3%B5na
     * https://en.wiktionary.org/wiki/Appendix:Estonian_numbers
 """
+from functools import lru_cache
 from math import floor, isfinite
 
 from ovos_number_parser.util import convert_to_mixed_fraction
@@ -344,7 +345,12 @@ def _parse_number_word_et(word):
     return None
 
 
-_ORDINAL_REVERSE_ET = {}
+@lru_cache(maxsize=None)
+def _ordinal_reverse_et() -> dict:
+    """``ordinal -> number`` for is_ordinal_et, built whole on first use."""
+    candidates = list(range(1, 101)) + \
+        [n * 100 for n in range(1, 11)] + [1000, 10 ** 6]
+    return {pronounce_ordinal_et(n): n for n in candidates}
 
 
 def is_ordinal_et(input_str):
@@ -356,12 +362,7 @@ def is_ordinal_et(input_str):
     Returns:
         (bool) or (int): False if not an ordinal, otherwise the number
     """
-    if not _ORDINAL_REVERSE_ET:
-        candidates = list(range(1, 101)) + \
-            [n * 100 for n in range(1, 11)] + [1000, 10 ** 6]
-        for n in candidates:
-            _ORDINAL_REVERSE_ET[pronounce_ordinal_et(n)] = n
-    return _ORDINAL_REVERSE_ET.get(input_str.lower().strip(), False)
+    return _ordinal_reverse_et().get(input_str.lower().strip(), False)
 
 
 def is_fractional_et(input_str, short_scale=True):
@@ -14,6 +14,7 @@ References:
     * https://fi.wikipedia.org/wiki/Numeraali
     * https://en.wiktionary.org/wiki/Appendix:Finnish_numbers
 """
+from functools import lru_cache
 from math import floor, isfinite
 
 from ovos_number_parser.util import convert_to_mixed_fraction
@@ -395,7 +396,12 @@ def _parse_number_word_fi(word):
     return None
 
 
-_ORDINAL_REVERSE_FI = {}
+@lru_cache(maxsize=None)
+def _ordinal_reverse_fi() -> dict:
+    """``ordinal -> number`` for is_ordinal_fi, built whole on first use."""
+    candidates = list(range(0, 101)) + \
+        [n * 100 for n in range(1, 11)] + [1000, 10 ** 6]
+    return {pronounce_ordinal_fi(n): n for n in candidates}
 
 
 def is_ordinal_fi(input_str):
@@ -407,12 +413,7 @@ def is_ordinal_fi(input_str):
     Returns:
         (bool) or (int): False if not an ordinal, otherwise the number
     """
-    if not _ORDINAL_REVERSE_FI:
-        candidates = list(range(0, 101)) + \
-            [n * 100 for n in range(1, 11)] + [1000, 10 ** 6]
-        for n in candidates:
-            _ORDINAL_REVERSE_FI[pronounce_ordinal_fi(n)] = n
-    return _ORDINAL_REVERSE_FI.get(input_str.lower().strip(), False)
+    return _ordinal_reverse_fi().get(input_str.lower().strip(), False)
 
 
 def is_fractional_fi(input_str, short_scale=True):
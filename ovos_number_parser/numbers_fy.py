@@ -1,8 +1,10 @@
 from collections import OrderedDict
+from functools import lru_cache
 from math import floor
+from types import MappingProxyType
 
-from ovos_number_parser.util import convert_to_mixed_fraction, is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, invert_dict
+from ovos_number_parser.util import convert_to_mixed_fraction, is_numeric, look_for_fractions, \
+    tokenize, invert_dict, TokenNumberExtractor
 
 _ARTICLES_FY = {'de', 'it'}
 
@@ -398,26 +400,8 @@ def _extract_numbers_with_text_fy(tokens, short_scale=True,
         [ReplaceableNumber]: A list of tuples, each containing a number and a
                          string.
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_fy(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return _ENGINE_FY.extract_numbers(tokens, short_scale, ordinals,
+                                      fractional_numbers)
 
 
 def _extract_number_with_text_fy(tokens, short_scale=True,
@@ -433,154 +417,13 @@ def _extract_number_with_text_fy(tokens, short_scale=True,
     Returns:
         ReplaceableNumber
     """
-    number, tokens = \
-        _extract_number_with_text_fy_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    while tokens and tokens[0].word in _ARTICLES_FY:
-        tokens.pop(0)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_fy_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """Helper for _extract_number_with_text_fy.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_fy(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_fy(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_fy(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_fy(tokens, short_scale, ordinals):
-    """Extract fraction numbers from a string.
-
-    This function handles text such as '2 en 3/4'. Note that "ien heal" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-    """
-    for c in _FRACTION_MARKER_FY:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_fy(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_fy(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                       num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_fy(tokens, short_scale, ordinals):
-    """Extract decimal numbers from a string.
-
-    This function handles text such as '2 komma 5'.
-
-    Notes:
-        While this is a helper for extract_number_fy, it also depends on
-        extract_number_fy, to parse out the components of the decimal.
+    return _ENGINE_FY.extract_number(tokens, short_scale, ordinals,
+                                     fractional_numbers)
 
-        This does not currently handle things like:
-            number dot number number number
 
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-    """
-    for c in _DECIMAL_MARKER_FY:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_fy(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_fy(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-            # concatenate consecutive single digits after the marker
-            # ("komma ien fjouwer" -> .14)
-            _digits = ""
-            _digit_tokens = []
-            _prev_end = None
-            for _num in numbers2:
-                _v = _num.value
-                if _v is None or _v is False or float(_v) != int(_v) \
-                        or not 0 <= _v <= 9:
-                    break
-                if _prev_end is not None and _num.start_index != _prev_end + 1:
-                    break
-                _digits += str(int(_v))
-                _digit_tokens.extend(_num.tokens)
-                _prev_end = _num.end_index
-            if len(_digits) > 1:
-                _frac = float("0." + _digits)
-                return (number.value - _frac if (number.value < 0 or any(_t.word.lower() in _NEGATIVES_FY for _t in number.tokens))
-                        else number.value + _frac), \
-                    number.tokens + partitions[1] + _digit_tokens
-
-            if "." not in str(decimal.text):
-                _frac2 = float('0.' + str(decimal.value))
-                return (number.value - _frac2 if (number.value < 0 or any(_t.word.lower() in _NEGATIVES_FY for _t in number.tokens))
-                        else number.value + _frac2), \
-                       number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_fy(tokens, short_scale, ordinals):
+def _extract_whole_number_with_text_fy(tokens, short_scale, ordinals,
+                                       start=0, scale_after=None,
+                                       starts=None):
     """Handle numbers not handled by the decimal or fraction functions.
 
     This is generally whole numbers. Note that phrases such as "ien heal" will
@@ -591,10 +434,17 @@ def _extract_whole_number_with_text_fy(tokens, short_scale, ordinals):
         tokens [Token]:
         short_scale boolean:
         ordinals boolean:
+        start int: position to start reading at; reading from there must be
+            the same as reading from the first token
+        scale_after: unused, there is no scale word lookahead
+        starts [int]: when given, the position of every number begun
+            after another one was read is appended to it
 
     Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
+        int or float, [Tokens], int
+        The value parsed, the tokens it corresponds to, and the last position
+        reached with nothing read yet: a later read of the same tokens can
+        start there.
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data_fy(short_scale)
@@ -604,7 +454,12 @@ def _extract_whole_number_with_text_fy(tokens, short_scale, ordinals):
     prev_val = None
     next_val = None
     to_sum = []
-    for idx, token in enumerate(tokens):
+    fresh = start
+    for idx in range(start, len(tokens)):
+        token = tokens[idx]
+        if val is False and not number_words and \
+                not to_sum and prev_val is None and not next_val:
+            fresh = idx
         current_val = None
         if next_val:
             next_val = None
@@ -639,8 +494,12 @@ def _extract_whole_number_with_text_fy(tokens, short_scale, ordinals):
                 and not (ordinals and prev_word in string_num_ordinal) \
                 and prev_word not in _NEGATIVES_FY \
                 and prev_word not in _ARTICLES_FY:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         elif prev_word in _SUMS_FY and word in _SUMS_FY:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         else:
             number_words.append(token)
@@ -731,9 +590,10 @@ def _extract_whole_number_with_text_fy(tokens, short_scale, ordinals):
         else:
             val += sum(to_sum)
 
-    return val, number_words
+    return val, number_words, fresh
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data_fy(short_scale):
     """Generate dictionaries of words to numbers, based on scale.
 
@@ -755,7 +615,15 @@ def _initialize_number_data_fy(short_scale):
     string_num_scale_fy = _SHORT_SCALE_FY if short_scale else _LONG_SCALE_FY
     string_num_scale_fy = invert_dict(string_num_scale_fy)
 
-    return multiplies, string_num_ordinal_fy, string_num_scale_fy
+    return multiplies, string_num_ordinal_fy, MappingProxyType(string_num_scale_fy)
+
+
+_ENGINE_FY = TokenNumberExtractor(
+    _extract_whole_number_with_text_fy,
+    fraction_markers=_FRACTION_MARKER_FY,
+    decimal_markers=_DECIMAL_MARKER_FY,
+    negatives=_NEGATIVES_FY,
+    articles=_ARTICLES_FY)
 
 
 def _split_compound_number_fy(word):
@@ -842,14 +710,20 @@ def extract_number_fy(text, short_scale=True, ordinals=False):
         (int) or (float) or False: The extracted number or False if no number
                                    was found
     """
+    return _extract_number_with_text_fy(
+        tokenize(_normalize_fy(text, short_scale)), short_scale,
+        ordinals).value
+
+
+def _normalize_fy(text, short_scale=True):
+    """Lowercase ``text``, drop the diacritics and split compound number
+    words, as the extractor reads them."""
     text = text.lower().replace("û", "u").replace("â", "a") \
         .replace("ú", "u").replace("á", "a").replace("ê", "e") \
         .replace("ô", "o").replace("é", "e")
     # normalize the words carrying diacritics to their plain spellings so
     # the compound splitter sees a single canonical form
-    text = _expand_compound_numbers_fy(text, short_scale)
-    return _extract_number_with_text_fy(tokenize(text),
-                                        short_scale, ordinals).value
+    return _expand_compound_numbers_fy(text, short_scale)
 
 
 def is_fractional_fy(input_str, short_scale=True):
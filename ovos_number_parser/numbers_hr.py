@@ -7,9 +7,11 @@ the count: "tisuću" (1000), "dvije tisuće" (2000), "pet tisuća" (5000),
 Croatian uses the long scale (milijun = 1e6, milijarda = 1e9, bilijun = 1e12).
 """
 from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 
 from ovos_number_parser.util import convert_to_mixed_fraction, is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+    invert_dict, tokenize, Token, TokenNumberExtractor
 
 _NUM_STRING_HR = {
     0: 'nula',
@@ -485,26 +487,8 @@ def _extract_numbers_with_text_hr(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_hr(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return _ENGINE_HR.extract_numbers(tokens, short_scale, ordinals,
+                                      fractional_numbers)
 
 
 def _extract_number_with_text_hr(tokens, short_scale=True,
@@ -522,150 +506,13 @@ def _extract_number_with_text_hr(tokens, short_scale=True,
         ReplaceableNumber
 
     """
-    number, tokens = \
-        _extract_number_with_text_hr_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_hr_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_hr.
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_hr(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_hr(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_hr(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_hr(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string ("dva i pol" = 2.5).
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_hr(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_hr(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                       num1.tokens + partitions[1] + num2.tokens
+    return _ENGINE_HR.extract_number(tokens, short_scale, ordinals,
+                                     fractional_numbers)
 
-    return None, None
 
-
-def _extract_decimal_with_text_hr(tokens, short_scale, ordinals):
-    """
-    Extract decimal numbers from a string ("pet zarez dva" = 5.2).
-
-    Notes:
-        While this is a helper for extract_number_hr, it also depends on
-        extract_number_hr, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_hr(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_hr(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-            # concatenate consecutive single digits after the marker
-            # ("zarez jedan četiri" -> .14)
-            _digits = ""
-            _digit_tokens = []
-            _prev_end = None
-            for _num in numbers2:
-                _v = _num.value
-                if _v is None or _v is False or float(_v) != int(_v) \
-                        or not 0 <= _v <= 9:
-                    break
-                if _prev_end is not None and _num.start_index != _prev_end + 1:
-                    break
-                _digits += str(int(_v))
-                _digit_tokens.extend(_num.tokens)
-                _prev_end = _num.end_index
-            if len(_digits) > 1:
-                _frac = float("0." + _digits)
-                return (number.value - _frac if (number.value < 0 or any(_t.word.lower() in _NEGATIVES for _t in number.tokens))
-                        else number.value + _frac), \
-                    number.tokens + partitions[1] + _digit_tokens
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                _frac2 = float('0.' + str(decimal.value))
-                return (number.value - _frac2 if (number.value < 0 or any(_t.word.lower() in _NEGATIVES for _t in number.tokens))
-                        else number.value + _frac2), \
-                       number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals):
+def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals,
+                                       start=0, scale_after=None,
+                                       starts=None):
     """
     Handle numbers not handled by the decimal or fraction functions. This is
     generally whole numbers.
@@ -674,14 +521,25 @@ def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals):
         tokens [Token]:
         short_scale boolean:
         ordinals boolean:
+        start int: position to start reading at; reading from there must be
+            the same as reading from the first token
+        scale_after [number]: scale word lookahead table for ``tokens``
+            (TokenNumberExtractor.scale_after), computed here when not
+            given
+        starts [int]: when given, the position of every number begun
+            after another one was read is appended to it
 
     Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
+        int or float, [Tokens], int
+        The value parsed, the tokens it corresponds to, and the last position
+        reached with nothing read yet: a later read of the same tokens can
+        start there.
 
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data(short_scale)
+    if scale_after is None:
+        scale_after = _ENGINE_HR.scale_after(tokens, short_scale)
 
     number_words = []  # type: [Token]
     val = False
@@ -689,7 +547,12 @@ def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals):
     next_val = None
     negative = False
     to_sum = []
-    for idx, token in enumerate(tokens):
+    fresh = start
+    for idx in range(start, len(tokens)):
+        token = tokens[idx]
+        if val is False and not number_words and not negative and \
+                not to_sum and prev_val is None and not next_val:
+            fresh = idx
         current_val = None
         if next_val:
             next_val = None
@@ -733,8 +596,12 @@ def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals):
                 and prev_word not in _SUMS \
                 and not (ordinals and prev_word in string_num_ordinal) \
                 and prev_word not in _NEGATIVES:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         elif prev_word in _SUMS and word in _SUMS:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         else:
             number_words.append(token)
@@ -834,15 +701,8 @@ def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals):
                 # If all remaining scale words are smaller than the
                 # current one, set the current group aside in to_sum
                 # and start assembling the next group.
-                time_to_sum = True
-                for other_token in tokens[idx + 1:]:
-                    if other_token.word in multiplies:
-                        if string_num_scale[other_token.word] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
+                later = scale_after[idx + 1]
+                time_to_sum = later is None or not later >= current_val
                 if time_to_sum:
                     to_sum.append(val)
                     val = 0
@@ -853,9 +713,10 @@ def _extract_whole_number_with_text_hr(tokens, short_scale, ordinals):
     if negative and val not in (None, False):
         val = -val
 
-    return val, number_words
+    return val, number_words, fresh
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data(short_scale):
     """
     Generate dictionaries of words to numbers.
@@ -872,7 +733,20 @@ def _initialize_number_data(short_scale):
     """
     string_num_scale_hr = invert_dict(_SCALE_HR)
     string_num_scale_hr.update(_SCALE_DECLENSIONS_HR)
-    return _MULTIPLIES_HR, _STRING_SHORT_ORDINAL_HR, string_num_scale_hr
+    return _MULTIPLIES_HR, _STRING_SHORT_ORDINAL_HR, MappingProxyType(string_num_scale_hr)
+
+
+def _scale_words_hr(short_scale):
+    multiplies, _, string_num_scale = _initialize_number_data(short_scale)
+    return multiplies, string_num_scale
+
+
+_ENGINE_HR = TokenNumberExtractor(
+    _extract_whole_number_with_text_hr,
+    fraction_markers=_FRACTION_MARKER,
+    decimal_markers=_DECIMAL_MARKER,
+    scale_words=_scale_words_hr,
+    negatives=_NEGATIVES)
 
 
 def _drop_connectors_hr(tokens):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from ovos_number_parser.util import (convert_to_mixed_fraction)
 from math import floor, isfinite
 _NUM_STRING_HU = {
@@ -377,7 +378,12 @@ def _parse_number_word_hu(word):
     return None
 
 
-_ORDINAL_REVERSE_HU = {}
+@lru_cache(maxsize=None)
+def _ordinal_reverse_hu() -> dict:
+    """``ordinal -> number`` for is_ordinal_hu, built whole on first use."""
+    candidates = list(range(0, 101)) + \
+        [n * 100 for n in range(1, 11)] + [1000, 1000000]
+    return {pronounce_ordinal_hu(n): n for n in candidates}
 
 
 def is_ordinal_hu(input_str):
@@ -389,12 +395,7 @@ def is_ordinal_hu(input_str):
     Returns:
         (bool) or (int): False if not an ordinal, otherwise the number
     """
-    if not _ORDINAL_REVERSE_HU:
-        candidates = list(range(0, 101)) + \
-            [n * 100 for n in range(1, 11)] + [1000, 1000000]
-        for n in candidates:
-            _ORDINAL_REVERSE_HU[pronounce_ordinal_hu(n)] = n
-    return _ORDINAL_REVERSE_HU.get(input_str.lower().strip(), False)
+    return _ordinal_reverse_hu().get(input_str.lower().strip(), False)
 
 
 def is_fractional_hu(input_str, short_scale=True):
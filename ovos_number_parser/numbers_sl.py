@@ -1,3 +1,4 @@
+from functools import lru_cache
 from math import isfinite
 from collections import OrderedDict
 
@@ -583,7 +584,11 @@ def is_fractional_sl(input_str, short_scale=True):
     return False
 
 
-_ORDINAL_REVERSE_SL = {}
+@lru_cache(maxsize=None)
+def _ordinal_reverse_sl() -> dict:
+    """``ordinal -> number`` for is_ordinal_sl, built whole on first use."""
+    candidates = list(range(1, 1000)) + [1000, 1000000]
+    return {pronounce_number_sl(n, ordinals=True): n for n in candidates}
 
 
 def is_ordinal_sl(input_str):
@@ -595,11 +600,7 @@ def is_ordinal_sl(input_str):
     Returns:
         (bool) or (int): False if not an ordinal, otherwise the number
     """
-    if not _ORDINAL_REVERSE_SL:
-        candidates = list(range(1, 1000)) + [1000, 1000000]
-        for n in candidates:
-            _ORDINAL_REVERSE_SL[pronounce_number_sl(n, ordinals=True)] = n
-    return _ORDINAL_REVERSE_SL.get(input_str.lower().strip(), False)
+    return _ordinal_reverse_sl().get(input_str.lower().strip(), False)
 
 
 def extract_number_sl(text, short_scale=True, ordinals=False):
@@ -24,9 +24,11 @@ number: "bir buçuk" = 1.5) and "çeyrek" (a quarter).
 """
 import re
 from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 
 from ovos_number_parser.util import (invert_dict, convert_to_mixed_fraction, tokenize, look_for_fractions,
-                                     partition_list, is_numeric, Token, ReplaceableNumber)
+                                     is_numeric, TokenNumberExtractor)
 
 _NUM_STRING_TR = {
     0: 'sıfır',
@@ -505,25 +507,8 @@ def _extract_numbers_with_text_tr(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_tr(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return _ENGINE_TR.extract_numbers(tokens, short_scale, ordinals,
+                                      fractional_numbers)
 
 
 def _extract_number_with_text_tr(tokens, short_scale=True,
@@ -541,158 +526,13 @@ def _extract_number_with_text_tr(tokens, short_scale=True,
         ReplaceableNumber
 
     """
-    number, tokens = \
-        _extract_number_with_text_tr_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_tr_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_tr.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
+    return _ENGINE_TR.extract_number(tokens, short_scale, ordinals,
+                                     fractional_numbers)
 
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_tr(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_tr(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_tr(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_tr(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string.
-
-    This function handles text such as '2 ve dörtte üç'. Note that "yarım" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
 
-    """
-    for c in _FRACTION_MARKER_TR:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_tr(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_tr(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                       num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_tr(tokens, short_scale, ordinals):
-    """
-    Extract decimal numbers from a string.
-
-    This function handles text such as '2 virgül 5'.
-
-    Notes:
-        While this is a helper for extract_number_tr, it also depends on
-        extract_number_tr, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER_TR:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_tr(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_tr(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-            # concatenate consecutive single digits after the marker
-            # ("virgül bir dört" -> .14)
-            _digits = ""
-            _digit_tokens = []
-            _prev_end = None
-            for _num in numbers2:
-                _v = _num.value
-                if _v is None or _v is False or float(_v) != int(_v) \
-                        or not 0 <= _v <= 9:
-                    break
-                if _prev_end is not None and _num.start_index != _prev_end + 1:
-                    break
-                _digits += str(int(_v))
-                _digit_tokens.extend(_num.tokens)
-                _prev_end = _num.end_index
-            if len(_digits) > 1:
-                _frac = float("0." + _digits)
-                return (number.value - _frac if number.value < 0
-                        else number.value + _frac), \
-                    number.tokens + partitions[1] + _digit_tokens
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                _frac2 = float('0.' + str(decimal.value))
-                return (number.value - _frac2 if number.value < 0
-                        else number.value + _frac2), \
-                       number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals):
+def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals,
+                                       start=0, scale_after=None,
+                                       starts=None):
     """
     Handle numbers not handled by the decimal or fraction functions. This is
     generally whole numbers. Note that phrases such as "yarım" will be
@@ -702,14 +542,25 @@ def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals):
         tokens [Token]:
         short_scale boolean:
         ordinals boolean:
+        start int: position to start reading at; reading from there must be
+            the same as reading from the first token
+        scale_after [number]: scale word lookahead table for ``tokens``
+            (TokenNumberExtractor.scale_after), computed here when not
+            given
+        starts [int]: when given, the position of every number begun
+            after another one was read is appended to it
 
     Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
+        int or float, [Tokens], int
+        The value parsed, the tokens it corresponds to, and the last position
+        reached with nothing read yet: a later read of the same tokens can
+        start there.
 
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data_tr(short_scale, speech=ordinals is not None)
+    if scale_after is None:
+        scale_after = _ENGINE_TR.scale_after(tokens, short_scale)
 
     number_words = []  # type: List[Token]
     val = False
@@ -717,7 +568,12 @@ def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals):
     next_val = None
     negative = False
     to_sum = []
-    for idx, token in enumerate(tokens):
+    fresh = start
+    for idx in range(start, len(tokens)):
+        token = tokens[idx]
+        if val is False and not number_words and not negative and \
+                not to_sum and prev_val is None and not next_val:
+            fresh = idx
         current_val = None
         if next_val:
             next_val = None
@@ -753,8 +609,12 @@ def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals):
                 and prev_word not in _SUMS_TR \
                 and not (ordinals and prev_word in string_num_ordinal) \
                 and prev_word not in _NEGATIVES_TR:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         elif prev_word in _SUMS_TR and word in _SUMS_TR:
+            if starts is not None and number_words:
+                starts.append(idx)
             number_words = [token]
         elif ordinals is None and \
                 (word in string_num_ordinal or word in _SPOKEN_EXTRA_NUM_TR):
@@ -861,15 +721,8 @@ def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals):
                 # current one, the current group is complete and is set
                 # aside in to_sum (see the English parser for the full
                 # walkthrough of this logic)
-                time_to_sum = True
-                for other_token in tokens[idx + 1:]:
-                    if other_token.word.lower() in multiplies:
-                        if string_num_scale[other_token.word.lower()] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
+                later = scale_after[idx + 1]
+                time_to_sum = later is None or not later >= current_val
                 if time_to_sum:
                     to_sum.append(val)
                     val = 0
@@ -879,9 +732,10 @@ def _extract_whole_number_with_text_tr(tokens, short_scale, ordinals):
         val += sum(to_sum)
     if negative and val not in (None, False):
         val = -val
-    return val, number_words
+    return val, number_words, fresh
 
 
+@lru_cache(maxsize=None)
 def _initialize_number_data_tr(short_scale, speech=True):
     """
     Generate dictionaries of words to numbers, based on scale.
@@ -906,7 +760,20 @@ def _initialize_number_data_tr(short_scale, speech=True):
     string_num_scale_tr = _SHORT_SCALE_TR if short_scale else _LONG_SCALE_TR
     string_num_scale_tr = invert_dict(string_num_scale_tr)
 
-    return multiplies, string_num_ordinal_tr, string_num_scale_tr
+    return multiplies, string_num_ordinal_tr, MappingProxyType(string_num_scale_tr)
+
+
+def _scale_words_tr(short_scale):
+    multiplies, _, string_num_scale = _initialize_number_data_tr(short_scale)
+    return multiplies, string_num_scale
+
+
+_ENGINE_TR = TokenNumberExtractor(
+    _extract_whole_number_with_text_tr,
+    fraction_markers=_FRACTION_MARKER_TR,
+    decimal_markers=_DECIMAL_MARKER_TR,
+    scale_words=_scale_words_tr,
+    lowercase=True)
 
 
 def is_fractional_tr(input_str, short_scale=True, spoken=True):
@@ -2,7 +2,8 @@ import math
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import List, Dict, Union, Any, Tuple, Optional, Callable
+from types import MappingProxyType
+from typing import List, Dict, Union, Any, Tuple, Optional, Callable, Mapping, Iterator, NamedTuple
 import re
 
 
@@ -61,6 +62,20 @@ class DigitPronunciation(str, Enum):
     FULL_NUMBER = "number"
 
 
+class TokenKind(str, Enum):
+    """
+    The role a single word plays in a spoken number.
+    """
+    CARDINAL = "cardinal"
+    ORDINAL = "ordinal"
+    FRACTION = "fraction"
+    SCALE = "scale"  # a power-of-ten multiplier: hundred, thousand, million
+    JOINER = "joiner"  # joins two parts of one number: "and", "e", "y"
+    NEGATIVE = "negative"
+    DECIMAL_MARKER = "decimal_marker"
+    NONE = "none"
+
+
 @dataclass
 class ReplaceableNumber:
     """
@@ -114,6 +129,32 @@ class ReplaceableNumber:
                                       t=self.tokens)
 
 
+@dataclass(frozen=True)
+class ExtractedNumber:
+    """
+    One number found by ``extract_numbers``, with where it sits in the text.
+
+    ``start``/``end`` index the words of the text (a hyphenated numeral
+    counts one word per part) and ``char_start``/``char_end`` its characters,
+    both end-exclusive, so ``text == original[char_start:char_end]``.
+    Punctuation around the first and last word is not part of the span.
+    """
+    value: Union[int, float]
+    text: str
+    start: int
+    end: int
+    char_start: int
+    char_end: int
+
+
+class ClassifiedToken(NamedTuple):
+    """One token as ``classify_tokens`` sees it; ``value`` is None for the
+    kinds that carry no number."""
+    token: str
+    kind: TokenKind
+    value: Optional[Union[int, float]] = None
+
+
 def word_tokenize(utterance: str) -> List[str]:
     """
     Splits a Portuguese text string into a list of tokens, separating words and punctuation.
@@ -180,6 +221,25 @@ def partition_list(items: List[Any], split_on: Any) -> List[List[Any]]:
     return list(filter(lambda x: len(x) != 0, splits))
 
 
+def partition_count(positions: Tuple[int, ...], length: int) -> int:
+    """
+    Number of parts partition_list would split a list into, without
+    building them.
+
+    Args:
+        positions: sorted positions of the items the list is split on
+        length: length of the list
+
+    Returns:
+        int
+    """
+    if not positions:
+        return 1 if length else 0
+    bounds = (-1,) + tuple(positions) + (length,)
+    gaps = sum(1 for a, b in zip(bounds, bounds[1:]) if b - a > 1)
+    return len(positions) + gaps
+
+
 def invert_dict(original: Dict[Any, Any]) -> Dict[Any, Any]:
     """
     Produce a dictionary with the keys and values
@@ -271,6 +331,330 @@ def convert_to_mixed_fraction(number: Union[int, float], denominators=range(1, 2
     return int_number, int(round(numerator)), denominator
 
 
+class TokenNumberExtractor:
+    """
+    Token pipeline shared by the parsers descended from the English one
+    (en, ru, uk, pl, cs, tr, az, nl, fy, hr, sk).
+
+    Each language keeps its own whole-number reader; this class runs the
+    parts they used to carry a copy of: the "2 and a half" fraction pass,
+    the "2 point 5" decimal pass and the loop that takes every number out of
+    an utterance.
+
+    The whole-number reader is called as
+    ``whole_number(tokens, short_scale, ordinals, start, scale_after, starts)``
+    and returns ``(value, tokens, fresh)``: it reads from position ``start``,
+    answers its "is a bigger scale word still coming?" lookahead from the
+    ``scale_after`` table, and reports the last position it reached with
+    nothing read yet, where the next search may resume. The reader returns
+    the last of several numbers spoken back to back; it appends to
+    ``starts`` the position where each of them begins, so the others need
+    no second search.
+    """
+
+    def __init__(self,
+                 whole_number: Callable,
+                 fraction_markers: Any = (),
+                 decimal_markers: Any = (),
+                 scale_words: Optional[Callable[[bool], Tuple[Any, Mapping[str, Any]]]] = None,
+                 lowercase: bool = False,
+                 negatives: Any = (),
+                 articles: Any = (),
+                 resolve_scale: Optional[Callable[[List[Token], bool], bool]] = None):
+        """
+        Args:
+            whole_number: the language's whole-number reader, see above
+            fraction_markers: words joining a number and a fraction ("and")
+            decimal_markers: words between the integer and decimal part
+            scale_words: ``short_scale -> (multiplies, string_num_scale)``
+                used for the lookahead table; None if the reader has no
+                lookahead
+            lowercase: compare words lower-cased in the lookahead
+            negatives: signs the decimal pass carries over to the decimal
+                part ("minus zero point five")
+            articles: words trimmed from the front of a number ("a", "the")
+            resolve_scale: ``(tokens, short_scale) -> short_scale`` for a
+                language that picks the scale from the words of the utterance
+        """
+        self.whole_number = whole_number
+        self.fraction_markers = fraction_markers
+        self.decimal_markers = decimal_markers
+        self.scale_words = scale_words
+        self.lowercase = lowercase
+        self.negatives = negatives
+        self.articles = articles
+        self.resolve_scale = resolve_scale
+
+    def scale_after(self, tokens: List[Token], short_scale: bool,
+                    after: Optional[List[Any]] = None, low: int = 0,
+                    high: Optional[int] = None) -> Optional[List[Any]]:
+        """
+        Largest scale word value at or after each position of ``tokens``
+        (None where no scale word follows).
+
+        Given an existing table ``after``, only positions ``low`` to ``high``
+        are recomputed, in place.
+        """
+        if self.scale_words is None:
+            return None
+        multiplies, string_num_scale = self.scale_words(short_scale)
+        if after is None:
+            after = [None] * (len(tokens) + 1)
+        if high is None:
+            high = len(tokens) - 1
+        for idx in range(high, low - 1, -1):
+            after[idx] = after[idx + 1]
+            word = tokens[idx].word
+            if self.lowercase:
+                word = word.lower()
+            if word in multiplies:
+                val = string_num_scale.get(word)
+                if val is not None and (after[idx] is None or val > after[idx]):
+                    after[idx] = val
+        return after
+
+    def _armed(self, markers: Dict[str, set], words: Any, length: int) -> bool:
+        # partition_list makes exactly three parts out of at most three
+        # markers; with more than that a pass cannot match and is skipped
+        return any(len(markers[c]) <= 3 and
+                   partition_count(tuple(sorted(markers[c])), length) == 3
+                   for c in words)
+
+    def _strip_articles(self, number_words: Optional[List[Token]]) -> Optional[List[Token]]:
+        while number_words and number_words[0].word in self.articles:
+            number_words.pop(0)
+        return number_words
+
+    def extract_number(self, tokens: List[Token], short_scale: bool = True,
+                       ordinals: bool = False,
+                       fractional_numbers: bool = True) -> ReplaceableNumber:
+        """
+        The first number in a list of Tokens.
+
+        Returns:
+            ReplaceableNumber
+        """
+        if self.resolve_scale is not None:
+            short_scale = self.resolve_scale(tokens, short_scale)
+        if fractional_numbers:
+            for extract in (self.extract_fraction, self.extract_decimal):
+                value, number_words = extract(tokens, short_scale, ordinals)
+                if value:
+                    return ReplaceableNumber(
+                        value, self._strip_articles(number_words))
+        value, number_words, _ = self.whole_number(
+            tokens, short_scale, ordinals, 0,
+            self.scale_after(tokens, short_scale))
+        return ReplaceableNumber(value, self._strip_articles(number_words))
+
+    def extract_numbers(self, tokens: List[Token], short_scale: bool = True,
+                        ordinals: bool = False,
+                        fractional_numbers: bool = True) -> List[ReplaceableNumber]:
+        """
+        Every number in a list of Tokens, with the words that represent them.
+
+        Numbers are taken out in turn, each hit masked by placeholders
+        before the next search. The whole-number search resumes where the
+        previous one had read nothing yet, and a run of numbers back to
+        back ("one two three") comes out of a single search: each of its
+        numbers is then read on its own, from where the reader saw it
+        begin to where the next one begins. The fraction and decimal
+        passes only run when partition_list could split on their marker,
+        and the scale lookahead reads a table, so an utterance is read in
+        linear time.
+
+        Returns:
+            [ReplaceableNumber], sorted by position
+        """
+        if self.resolve_scale is not None:
+            short_scale = self.resolve_scale(tokens, short_scale)
+        return self._extract_numbers(tokens, short_scale, ordinals,
+                                     fractional_numbers)
+
+    def _extract_numbers(self, tokens: List[Token], short_scale: bool,
+                         ordinals: bool,
+                         fractional_numbers: bool) -> List[ReplaceableNumber]:
+        """extract_numbers, once the scale is settled."""
+        placeholder = "<placeholder>"  # inserted to maintain correct indices
+        # the caller's list is only copied once the first hit is masked: the
+        # first search sees (and may rewrite) the original tokens
+        work = tokens
+        position = {t.index: p for p, t in enumerate(work)}
+        scale_after = self.scale_after(work, short_scale)
+
+        passes = []
+        if fractional_numbers:
+            passes = [(self.extract_fraction, self.fraction_markers),
+                      (self.extract_decimal, self.decimal_markers)]
+        markers = {c: {p for p, t in enumerate(work) if t.word == c}
+                   for _, words in passes for c in words}
+
+        results = []
+        start = 0
+        while True:
+            value = number_words = None
+            rescan = False
+            for extract, words in passes:
+                if not self._armed(markers, words, len(work)):
+                    continue
+                value, number_words = extract(work, short_scale, ordinals)
+                if value:
+                    # these can sit anywhere in the text, not just after the
+                    # previous hit
+                    rescan = True
+                    break
+
+            starts = []
+            if not rescan:
+                value, number_words, start = self.whole_number(
+                    work, short_scale, ordinals, start, scale_after, starts)
+            to_replace = ReplaceableNumber(value,
+                                           self._strip_articles(number_words))
+            if not to_replace:
+                break
+
+            if starts:
+                # a run of numbers back to back: the reader has passed every
+                # one of them, and the whole run is masked at once
+                first = start
+                last = position.get(number_words[-1].index, len(work) - 1)
+                results.extend(self._split_run(
+                    work, [first] + starts + [last + 1], short_scale,
+                    ordinals))
+            else:
+                results.append(to_replace)
+                first = position.get(to_replace.start_index, 0)
+                last = position.get(to_replace.end_index, len(work) - 1)
+
+            if work is tokens:
+                work = list(tokens)
+            for p in range(first, last + 1):
+                t = work[p]
+                if starts or \
+                        to_replace.start_index <= t.index <= to_replace.end_index:
+                    if t.word in markers:
+                        markers[t.word].discard(p)
+                    work[p] = Token(placeholder, t.index)
+            # the lookahead table only has to be right from ``start`` on,
+            # which it is past the masked span
+            top = max(last, start)
+            if rescan:
+                start = min(start, first)
+            if scale_after is not None:
+                self.scale_after(work, short_scale, scale_after, start, top)
+        results.sort(key=lambda n: n.start_index)
+        return results
+
+    def _split_run(self, tokens: List[Token], bounds: List[int],
+                   short_scale: bool, ordinals: bool) -> List[ReplaceableNumber]:
+        """
+        The numbers of a run spoken back to back, each part
+        ``tokens[bounds[i]:bounds[i + 1]]`` read on its own, so none of them
+        carries a sign or a pending sum over from the one before.
+        """
+        hits = []
+        for low, high in zip(bounds, bounds[1:]):
+            hits.extend(self._extract_numbers(tokens[low:high], short_scale,
+                                              ordinals, False))
+        return hits
+
+    def extract_fraction(self, tokens: List[Token], short_scale: bool,
+                         ordinals: bool) -> Tuple[Any, Optional[List[Token]]]:
+        """
+        A whole number followed by a fraction, joined by a fraction marker
+        ("2 and 3/4").
+
+        Note that "one half" or similar will be parsed by the whole number
+        reader.
+
+        Returns:
+            (int or float, [Token])
+            The value found, and the list of relevant tokens.
+            (None, None) if no fraction value is found.
+        """
+        for c in self.fraction_markers:
+            partitions = partition_list(tokens, lambda t: t.word == c)
+
+            if len(partitions) == 3:
+                numbers1 = self.extract_numbers(partitions[0], short_scale,
+                                                ordinals,
+                                                fractional_numbers=False)
+                numbers2 = self.extract_numbers(partitions[2], short_scale,
+                                                ordinals,
+                                                fractional_numbers=True)
+
+                if not numbers1 or not numbers2:
+                    return None, None
+
+                # ensure first is not a fraction and second is a fraction
+                num1 = numbers1[-1]
+                num2 = numbers2[0]
+                if num1.value >= 1 and 0 < num2.value < 1:
+                    return num1.value + num2.value, \
+                        num1.tokens + partitions[1] + num2.tokens
+
+        return None, None
+
+    def extract_decimal(self, tokens: List[Token], short_scale: bool,
+                        ordinals: bool) -> Tuple[Any, Optional[List[Token]]]:
+        """
+        A number read with a decimal marker ("2 point 5", "point one four").
+
+        This does not currently handle things like:
+            number dot number number number
+
+        Returns:
+            (float, [Token])
+            The value found and relevant tokens.
+            (None, None) if no decimal value is found.
+        """
+        for c in self.decimal_markers:
+            partitions = partition_list(tokens, lambda t: t.word == c)
+
+            if len(partitions) == 3:
+                numbers1 = self.extract_numbers(partitions[0], short_scale,
+                                                ordinals,
+                                                fractional_numbers=False)
+                numbers2 = self.extract_numbers(partitions[2], short_scale,
+                                                ordinals,
+                                                fractional_numbers=False)
+
+                if not numbers1 or not numbers2:
+                    return None, None
+
+                number = numbers1[-1]
+                decimal = numbers2[0]
+                negative = number.value < 0 or any(
+                    t.word.lower() in self.negatives for t in number.tokens)
+                # concatenate consecutive single digits after the marker
+                # ("point one four" -> .14)
+                digits = ""
+                digit_tokens = []
+                prev_end = None
+                for num in numbers2:
+                    v = num.value
+                    if v is None or v is False or float(v) != int(v) \
+                            or not 0 <= v <= 9:
+                        break
+                    if prev_end is not None and num.start_index != prev_end + 1:
+                        break
+                    digits += str(int(v))
+                    digit_tokens.extend(num.tokens)
+                    prev_end = num.end_index
+                if len(digits) > 1:
+                    frac = float("0." + digits)
+                    return (number.value - frac if negative
+                            else number.value + frac), \
+                        number.tokens + partitions[1] + digit_tokens
+
+                if "." not in str(decimal.text):
+                    frac = float('0.' + str(decimal.value))
+                    return (number.value - frac if negative
+                            else number.value + frac), \
+                        number.tokens + partitions[1] + decimal.tokens
+        return None, None
+
+
 @dataclass
 class NumberVocabulary:
     LANG: str
@@ -384,8 +768,38 @@ class NumberVocabulary:
     # standalone ordinal ("unulea" vs "primul")
     ORDINAL_COMPOUND_UNITS: Dict[int, str] = field(default_factory=dict)
 
-    def get_number_strings(self, scale: Optional[Scale] = None) -> Dict[str, int]:
+    # the lexicons below are derived from the tables above, so each one is
+    # built on first use and kept, keyed by (kind, scale). A vocabulary is
+    # not modified once defined.
+    _lexicons: Dict[Tuple[str, Optional[Scale]], Mapping[str, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def _lexicon(self, kind: str, scale: Optional[Scale],
+                 build: Callable[[], Dict[str, int]]) -> Mapping[str, int]:
+        key = (kind, scale)
+        try:
+            return self._lexicons[key]
+        except KeyError:
+            lexicon = self._lexicons[key] = MappingProxyType(build())
+            return lexicon
+
+    def get_number_strings(self, scale: Optional[Scale] = None) -> Mapping[str, int]:
+        """Read-only map of every cardinal spelling to its value."""
         scale = scale or self.DEFAULT_SCALE
+        return self._lexicon("numbers", scale,
+                             lambda: self._build_number_strings(scale))
+
+    def get_ordinal_strings(self, scale: Optional[Scale] = None) -> Mapping[str, int]:
+        """Read-only map of every ordinal spelling to its value."""
+        scale = scale or self.DEFAULT_SCALE
+        return self._lexicon("ordinals", scale,
+                             lambda: self._build_ordinal_strings(scale))
+
+    def get_fraction_strings(self) -> Mapping[str, int]:
+        """Read-only map of every fraction noun to its denominator."""
+        return self._lexicon("fractions", None, self._build_fraction_strings)
+
+    def _build_number_strings(self, scale: Scale) -> Dict[str, int]:
         SCALES = self.SHORT_SCALE if scale == Scale.SHORT else self.LONG_SCALE
         male = {
             **self.ALT_SPELLINGS,
@@ -412,8 +826,7 @@ class NumberVocabulary:
             **plural
         }
 
-    def get_ordinal_strings(self, scale: Optional[Scale] = None) -> Dict[str, int]:
-        scale = scale or self.DEFAULT_SCALE
+    def _build_ordinal_strings(self, scale: Scale) -> Dict[str, int]:
         SCALES = self.ORDINAL_SHORT_SCALE if scale == Scale.SHORT else self.ORDINAL_LONG_SCALE
         male = {
             **{v: k for k, v in self.ORDINAL_COMPOUND_UNITS.items()},
@@ -435,7 +848,7 @@ class NumberVocabulary:
             **plural
         }
 
-    def get_fraction_strings(self) -> Dict[str, int]:
+    def _build_fraction_strings(self) -> Dict[str, int]:
         male = {v: k for k, v in self.FRACTION.items()}
         female = {v: k for k, v in self.FRACTION_FEMALE.items()}
         plural = {self.pluralize(k): v for k, v in male.items()}
@@ -446,11 +859,133 @@ class NumberVocabulary:
         }
 
 
+@dataclass(frozen=True)
+class _RomanceToken:
+    """Every role one word can play in a Romance vocabulary.
+
+    A word may carry several ("quinto" is both an ordinal and a fraction), so
+    the extractor still decides between them in its own order of precedence;
+    the point is that one dict probe answers all of the questions.
+    """
+    cardinal: Optional[int] = None
+    ordinal: Optional[int] = None
+    fraction: Optional[float] = None  # 1/denominator
+    plural_fraction: bool = False  # "cuartos": multiplies what precedes it
+    joiner: bool = False
+    multiplicative_joiner: bool = False
+    decimal_marker: bool = False
+    negative: bool = False
+
+
+_NO_ROLE = _RomanceToken()
+
+
+@dataclass
+class _RomanceReading:
+    """How far extract_number has read a list of tokens, and the sums so
+    far."""
+    result: Union[int, float] = 0
+    current: Union[int, float] = 0
+    saw_number: bool = False
+    is_negative: bool = False
+    stopped: bool = False  # the number ended before the last token
+    i: int = 0  # next token to read
+    seen: int = -1  # last token looked at, lookahead included
+
+
+class _RomanceSpan:
+    """extract_number of a phrase that grows one word at a time.
+
+    Words are appended as they are found, and ``value()`` only reads the
+    tokens added since the previous call, plus the few whose meaning still
+    depends on what follows them (a joiner or fraction at the end, a decimal
+    tail). Reading a span of n words this way costs O(n) rather than a full
+    re-read at every joiner.
+    """
+
+    def __init__(self, extractor: "RomanceNumberExtractor", scale: Scale):
+        self.extractor = extractor
+        self.scale = scale
+        self.tokens: List[str] = []
+        self.ends: List[int] = []  # tokens up to and including each word
+        self.reading = _RomanceReading()
+        self.digit: Optional[Tuple[int, Union[int, float]]] = None
+        self.scanned = 0  # tokens checked for a leading digit
+        self.closed = False  # a number word was found before any digit
+
+    def append(self, word: str):
+        self.tokens.extend(word.lower().replace('-', ' ').split())
+        self.ends.append(len(self.tokens))
+
+    def value(self, words: Optional[int] = None) -> Union[int, float, bool]:
+        """extract_number of the first ``words`` words (all by default)."""
+        if words is None:
+            end = len(self.tokens)
+        else:
+            end = self.ends[words - 1] if words else 0
+        extractor = self.extractor
+        if not self.closed and self.digit is None:
+            self.scanned, self.digit, self.closed = extractor._leading_digit(
+                self.tokens, self.scanned, len(self.tokens), self.scale)
+        if self.digit is not None and self.digit[0] < end:
+            return self.digit[1]
+        reading = self.reading
+        if reading.seen >= end:
+            # the phrase was cut back behind what has been read already
+            reading = _RomanceReading()
+        elif reading.i < end and not reading.stopped:
+            reading = self.reading = extractor._read(
+                self.tokens, reading, end, self.scale, settled=True)
+        if reading.i < end and not reading.stopped:
+            reading = extractor._read(self.tokens, reading, end, self.scale)
+        return extractor._finish(reading)
+
+
 class RomanceNumberExtractor:
     """vocabulary based number parser that should work for most romance-like languages"""
 
     def __init__(self, vocab: NumberVocabulary):
         self.vocab = vocab
+        self._ordinal_particles = frozenset(vocab.ORDINAL_PREFIX.values())
+        self._token_indexes: Dict[Scale, Dict[str, _RomanceToken]] = {}
+
+    def _token_index(self, scale: Scale) -> Dict[str, _RomanceToken]:
+        """Classification of every word in the vocabulary, built once per
+        scale."""
+        try:
+            return self._token_indexes[scale]
+        except KeyError:
+            pass
+        vocab = self.vocab
+        numbers_map = vocab.get_number_strings(scale)
+        ordinals_map = vocab.get_ordinal_strings(scale)
+        fractions_map = vocab.get_fraction_strings()
+        # plural fraction words ("cuartos", "terzos") multiply by the
+        # preceding cardinal ("tres cuartos" = 3/4), singular ones add
+        # ("dois e meio" = 2.5)
+        singular_fractions = set(vocab.FRACTION.values()) | \
+            set(vocab.FRACTION_FEMALE.values())
+        plural_fractions = {vocab.pluralize(w) for w in singular_fractions} - \
+            singular_fractions
+        words = set(numbers_map) | set(ordinals_map) | set(fractions_map) | \
+            set(vocab.JOIN_WORD) | set(vocab.DECIMAL_MARKER) | \
+            set(vocab.NEGATIVE_SIGN)
+        index = {}
+        for word in words:
+            den = fractions_map.get(word)
+            index[word] = _RomanceToken(
+                cardinal=numbers_map.get(word),
+                # an ordinal particle ("al", "a") is not an ordinal by itself
+                ordinal=None if word in self._ordinal_particles
+                else ordinals_map.get(word),
+                fraction=1.0 / den if den is not None else None,
+                plural_fraction=word in plural_fractions,
+                joiner=word in vocab.JOIN_WORD,
+                multiplicative_joiner=word in vocab.MULTIPLICATIVE_JOIN_WORD,
+                decimal_marker=word in vocab.DECIMAL_MARKER,
+                negative=word in vocab.NEGATIVE_SIGN)
+        self._token_indexes[scale] = index
+        return index
 
     def is_ordinal(self, input_str: str, scale: Optional[Scale] = None) -> Union[int, bool]:
         """
@@ -461,15 +996,11 @@ class RomanceNumberExtractor:
             recognized as an ordinal, otherwise False.
         """
         scale = scale or self.vocab.DEFAULT_SCALE
-        if self.vocab.ORDINAL_PREFIX:
+        if self._ordinal_particles:
             # drop the ordinal particles ("al doilea" -> "doilea")
-            particles = set(self.vocab.ORDINAL_PREFIX.values())
             input_str = " ".join(w for w in input_str.strip().split()
-                                 if w not in particles)
-        ordinals_map = self.vocab.get_ordinal_strings(scale)
-        if input_str in ordinals_map:
-            return ordinals_map[input_str]
-        return False
+                                 if w not in self._ordinal_particles)
+        return self.vocab.get_ordinal_strings(scale).get(input_str, False)
 
     def is_fractional(self, input_str: str) -> Union[float, bool]:
         """
@@ -478,15 +1009,10 @@ class RomanceNumberExtractor:
         Returns:
             The fractional value as a float if recognized; otherwise, False.
         """
-        fractions_map = self.vocab.get_fraction_strings()
-        input_str = input_str.lower().strip()
-
-        # handle fraction denominator strings
-        for word, den in fractions_map.items():
-            if input_str == word:
-                return 1.0 / den
-
-        return False
+        den = self.vocab.get_fraction_strings().get(input_str.lower().strip())
+        if den is None:
+            return False
+        return 1.0 / den
 
     def extract_number(self,
                        text: str,
@@ -510,9 +1036,6 @@ class RomanceNumberExtractor:
             return False
 
         scale = scale or self.vocab.DEFAULT_SCALE
-        numbers_map = self.vocab.get_number_strings(scale)
-        ordinals_map = self.vocab.get_ordinal_strings(scale)
-        scales_map = self.vocab.SHORT_SCALE if scale == Scale.SHORT else self.vocab.LONG_SCALE
 
         # normalize and tokenize
         clean_text = text.lower().replace('-', ' ')
@@ -521,7 +1044,26 @@ class RomanceNumberExtractor:
         tokens = clean_text.split()
 
         # a digit token wins if it appears before any spoken number word
-        for tok in tokens:
+        _, digit, _ = self._leading_digit(tokens, 0, len(tokens), scale)
+        if digit is not None:
+            return digit[1]
+        return self._finish(self._read(tokens, _RomanceReading(), len(tokens),
+                                       scale, ordinals))
+
+    def _leading_digit(self, tokens: List[str], start: int, end: int,
+                       scale: Scale) -> Tuple[int, Optional[Tuple[int, Union[int, float]]], bool]:
+        """
+        Look for a digit token ahead of the first spoken number word.
+
+        Returns:
+            (position reached, (position, value) of the digit token or None,
+            True if a number word was found first)
+        """
+        index = self._token_index(scale)
+        ordinals_map = self.vocab.get_ordinal_strings(scale)
+        scales_map = self.vocab.SHORT_SCALE if scale == Scale.SHORT else self.vocab.LONG_SCALE
+        for pos in range(start, end):
+            tok = tokens[pos]
             t = tok.strip(".,!?;:").replace(",", ".")
             if t and t.lstrip("-").replace(".", "", 1).isdecimal():
                 val = float(t)
@@ -530,45 +1072,76 @@ class RomanceNumberExtractor:
                 # so skip it rather than return a non-finite value
                 if not math.isfinite(val):
                     continue
-                return int(val) if val.is_integer() else val
-            if tok in numbers_map or tok in ordinals_map or tok in scales_map:
-                break
-
-        # plural fraction words ("cuartos", "terzos") multiply by the preceding
-        # cardinal ("tres cuartos" = 3/4), singular ones add ("dois e meio" = 2.5)
-        singular_fractions = set(self.vocab.FRACTION.values()) | set(self.vocab.FRACTION_FEMALE.values())
-        plural_fractions = {self.vocab.pluralize(w) for w in singular_fractions} - singular_fractions
+                return pos + 1, (pos, int(val) if val.is_integer() else val), False
+            info = index.get(tok)
+            if (info is not None and info.cardinal is not None) \
+                    or tok in ordinals_map or tok in scales_map:
+                return pos + 1, None, True
+        return end, None, False
+
+    @staticmethod
+    def _finish(reading: _RomanceReading) -> Union[int, float, bool]:
+        """The number read so far, False if there is none."""
+        if not reading.saw_number:
+            return False
+        result = reading.result + reading.current
+        if reading.is_negative:
+            result = -result
+        return result
 
-        result = 0
-        current = 0
-        saw_number = False
-        is_negative = False
+    def _read(self, tokens: List[str], reading: _RomanceReading, end: int,
+              scale: Scale, ordinals: bool = False,
+              settled: bool = False) -> _RomanceReading:
+        """
+        Read on from ``reading`` over ``tokens[reading.i:end]`` and return
+        the new reading (``reading`` itself is left as it was).
 
-        i = 0
-        while i < len(tokens):
+        With ``settled``, stop at the first token whose meaning depends on a
+        token at or after ``end`` (a joiner or fraction with nothing after
+        it yet, a decimal marker), so the reading stays valid when more
+        tokens are appended.
+        """
+        index = self._token_index(scale)
+        no_role = _NO_ROLE
+        result = reading.result
+        current = reading.current
+        saw_number = reading.saw_number
+        is_negative = reading.is_negative
+        stopped = reading.stopped
+        seen = reading.seen
+
+        i = reading.i
+        while i < end and not stopped:
             token = tokens[i]
-            if token in self.vocab.NEGATIVE_SIGN:
+            info = index.get(token, no_role)
+            seen = max(seen, i)
+            if info.negative:
                 is_negative = True
                 i += 1
                 continue
 
-            if token in self.vocab.JOIN_WORD:
-                if token in self.vocab.MULTIPLICATIVE_JOIN_WORD:
+            if info.joiner:
+                if info.multiplicative_joiner:
                     i += 1
                     continue
+                if settled and i + 1 >= end:
+                    break
                 # Romance additive joiners are strictly descending: the value
                 # after the joiner is smaller than the one before it
                 # ("vinte e um" = 21, "mil e quinhentos" = 1500). An ascending
                 # pair is not one number but two ("tres y veinte" = "3:20"),
                 # so the number ends here.
-                nxt = numbers_map.get(tokens[i + 1]) if i + 1 < len(tokens) else None
+                nxt = index.get(tokens[i + 1], no_role).cardinal \
+                    if i + 1 < end else None
+                seen = max(seen, min(i + 1, end - 1))
                 pending = current or result
                 if saw_number and nxt is not None and pending and nxt >= pending:
+                    stopped = True
                     break
                 i += 1
                 continue
 
-            val = numbers_map.get(token)
+            val = info.cardinal
             if val is not None:
                 saw_number = True
                 if val >= 1000:
@@ -592,30 +1165,34 @@ class RomanceNumberExtractor:
                 i += 1
                 continue
 
-            if ordinals and self.is_ordinal(token):
+            if ordinals and info.ordinal:
                 saw_number = True
-                current += ordinals_map[token]
+                current += info.ordinal
                 i += 1
                 continue
 
-            fraction = self.is_fractional(token)
-            if fraction is not False:
-                saw_number = True
+            fraction = info.fraction
+            if fraction is not None:
                 # look past a joiner: the scale a fraction multiplies may sit
                 # behind one ("jumătate de milion" = half a million)
                 nxt_i = i + 1
-                while nxt_i < len(tokens) and tokens[nxt_i] in self.vocab.JOIN_WORD:
+                while nxt_i < end and \
+                        index.get(tokens[nxt_i], no_role).joiner:
                     nxt_i += 1
-                next_token = tokens[nxt_i] if nxt_i < len(tokens) else None
-                next_val = numbers_map.get(next_token) if next_token else None
-                if token not in plural_fractions and next_val is not None \
+                if settled and nxt_i >= end:
+                    break
+                seen = max(seen, min(nxt_i, end - 1))
+                saw_number = True
+                next_val = index.get(tokens[nxt_i], no_role).cardinal \
+                    if nxt_i < end else None
+                if not info.plural_fraction and next_val is not None \
                         and next_val >= 1000:
                     # a singular fraction before a scale word multiplies that
                     # scale ("meio milhão" = 500000, "medio millón" = 500000),
                     # so leave it pending for the scale branch to multiply
                     current += fraction
                 else:
-                    if token in plural_fractions or self.vocab.FRACTIONS_ALWAYS_MULTIPLY:
+                    if info.plural_fraction or self.vocab.FRACTIONS_ALWAYS_MULTIPLY:
                         result += (current or 1) * fraction
                     else:
                         result += current + fraction
@@ -623,9 +1200,13 @@ class RomanceNumberExtractor:
                 i += 1
                 continue
 
-            if token in self.vocab.DECIMAL_MARKER:
-                tail = tokens[i + 1:]
-                tail_vals = [numbers_map[t] for t in tail if t in numbers_map]
+            if info.decimal_marker:
+                if settled:
+                    break
+                tail = tokens[i + 1:end]
+                seen = end - 1
+                tail_vals = [v for v in (index.get(t, no_role).cardinal
+                                         for t in tail) if v is not None]
                 if tail_vals and all(
                         0 <= v <= 9 and float(v) == int(v)
                         for v in tail_vals):
@@ -635,7 +1216,7 @@ class RomanceNumberExtractor:
                     # composed reading ("vírgula trinta e quatro" -> .34)
                     zeros = 0
                     for t in tail:
-                        if numbers_map.get(t) == 0:
+                        if index.get(t, no_role).cardinal == 0:
                             zeros += 1
                         else:
                             break
@@ -649,20 +1230,15 @@ class RomanceNumberExtractor:
                     result += current + float(f"0.{decimal_str}")
                     current = 0
                     saw_number = True
+                    stopped = True
                     break
                 i += 1
                 continue
 
             i += 1
 
-        result += current
-
-        if not saw_number:
-            return False
-
-        if is_negative:
-            result = -result
-        return result
+        return _RomanceReading(result, current, saw_number, is_negative,
+                               stopped, i, seen)
 
     def numbers_to_digits(self,
                           utterance: str,
@@ -680,10 +1256,43 @@ class RomanceNumberExtractor:
         Returns:
             str: The input text with written numbers replaced by their digit representations.
         """
-        scale = scale or self.vocab.DEFAULT_SCALE
         words = word_tokenize(utterance)
         output = []
         i = 0
+        # the span values are read with the default scale, as
+        # extract_number(phrase) always read them
+        for start, end, value in self._number_spans(
+                words, scale or self.vocab.DEFAULT_SCALE,
+                self.vocab.DEFAULT_SCALE):
+            output.extend(words[i:start])
+            output.append(str(value))
+            i = end
+        output.extend(words[i:])
+        return " ".join(output)
+
+    def number_spans(self,
+                     words: List[str],
+                     scale: Optional[Scale] = None
+                     ) -> Iterator[Tuple[int, int, Union[int, float]]]:
+        """
+        Find the written numbers in a list of words.
+
+        Parameters:
+            words (List[str]): The words of a text, in order.
+            scale (Scale, optional): Numerical scale (short or long). Defaults to the vocabulary's scale.
+
+        Yields:
+            (start, end, value): one number per maximal span of number words, ``words[start:end]``.
+        """
+        scale = scale or self.vocab.DEFAULT_SCALE
+        return self._number_spans(words, scale, scale)
+
+    def _number_spans(self, words: List[str], scale: Scale,
+                      value_scale: Scale
+                      ) -> Iterator[Tuple[int, int, Union[int, float]]]:
+        """number_spans, with words recognised by ``scale`` and the spans
+        read by ``value_scale``."""
+        i = 0
 
         numbers_map = self.vocab.get_number_strings(scale)
 
@@ -713,6 +1322,8 @@ class RomanceNumberExtractor:
             if starts_span(i):
                 # Start a new span
                 number_span_words = []
+                # the value of the span so far, read incrementally
+                span = _RomanceSpan(self, value_scale)
                 j = i
                 while j < len(words) and continues_span(j):
                     if words[j] in self.vocab.JOIN_WORD and number_span_words \
@@ -722,10 +1333,11 @@ class RomanceNumberExtractor:
                         # An ascending pair is two numbers, not one, and the
                         # span has to end so the tail survives ("tres y veinte").
                         nxt = numbers_map.get(next_word(j))
-                        sofar = self.extract_number(" ".join(number_span_words))
+                        sofar = span.value()
                         if nxt is None or sofar is False or nxt >= sofar:
                             break
                     number_span_words.append(words[j])
+                    span.append(words[j])
                     j += 1
 
                 # a joiner at the end of the span belongs to the surrounding
@@ -734,28 +1346,19 @@ class RomanceNumberExtractor:
                     number_span_words.pop()
                     j -= 1
 
-                # Form the phrase from the span and extract the number value
-                phrase = " ".join(number_span_words)
-                number_val = self.extract_number(phrase)
+                number_val = span.value(len(number_span_words))
 
                 if number_val is not False:
-                    # If a valid number is found, add its digit representation to the output
-                    output.append(str(number_val))
+                    yield i, j, number_val
                     # Advance the main index 'i' past the entire span
                     i = j
                 else:
                     # If the span doesn't form a valid number, treat the first word as non-numeric
                     # and move to the next word. This handles cases like "e" at the beginning of a sentence.
-                    output.append(words[i])
                     i += 1
             else:
-                # If the current word is not a number word, add it to the output
-                # and move to the next word
-                output.append(words[i])
                 i += 1
 
-        return " ".join(output)
-
     def pronounce_number(self,
                          number: Union[int, float],
                          places: int = 5,
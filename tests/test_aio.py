@@ -0,0 +1,118 @@
+"""ovos_number_parser.aio: the public functions as coroutines."""
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import ovos_number_parser
+from ovos_number_parser import aio
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        aio.configure()
+        aio.shutdown()
+
+    async def test_matches_the_sync_functions(self):
+        text = "I have twenty one apples and 3 pears"
+        self.assertEqual(await aio.extract_number(text, "en"),
+                         ovos_number_parser.extract_number(text, "en"))
+        self.assertEqual(await aio.extract_numbers(text, "en"),
+                         ovos_number_parser.extract_numbers(text, "en"))
+        self.assertEqual(await aio.numbers_to_digits(text, "en"),
+                         ovos_number_parser.numbers_to_digits(text, "en"))
+        self.assertEqual(await aio.pronounce_number(21, "pt"),
+                         ovos_number_parser.pronounce_number(21, "pt"))
+        self.assertEqual(await aio.pronounce_ordinal(3, "en"), "third")
+        self.assertEqual(await aio.is_ordinal("third", "en"), 3)
+        self.assertEqual(await aio.normalize_for_tts("It is 21. Go", "en"),
+                         list(ovos_number_parser.normalize_for_tts(
+                             "It is 21. Go", "en")))
+
+    async def test_runs_off_the_event_loop(self):
+        threads = []
+
+        def record(text, lang):
+            threads.append(threading.current_thread())
+            return 1
+
+        with mock.patch.object(ovos_number_parser, "extract_number", record):
+            await aio.extract_number("one", "en")
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    async def test_identical_calls_in_flight_run_once(self):
+        gate = threading.Event()
+        calls = []
+
+        def slow(text, lang):
+            calls.append(text)
+            gate.wait(5)
+            return len(text)
+
+        with mock.patch.object(ovos_number_parser, "extract_number", slow):
+            tasks = [asyncio.ensure_future(aio.extract_number(text, "en"))
+                     for text in ("one", "one", "one", "three")]
+            await asyncio.sleep(0)
+            gate.set()
+            results = await asyncio.gather(*tasks)
+            self.assertEqual(results, [3, 3, 3, 5])
+            self.assertEqual(sorted(calls), ["one", "three"])
+            # once finished, the same call runs again
+            await aio.extract_number("one", "en")
+        self.assertEqual(sorted(calls), ["one", "one", "three"])
+
+    async def test_shared_list_results_are_copied_per_caller(self):
+        gate = threading.Event()
+
+        def slow(text, lang):
+            gate.wait(5)
+            return [1, 2]
+
+        with mock.patch.object(ovos_number_parser, "extract_numbers", slow):
+            tasks = [asyncio.ensure_future(aio.extract_numbers("x", "en"))
+                     for _ in range(2)]
+            await asyncio.sleep(0)
+            gate.set()
+            first, second = await asyncio.gather(*tasks)
+        self.assertIsNot(first, second)
+        first.append(3)
+        self.assertEqual(second, [1, 2])
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        gate = threading.Event()
+
+        def slow(text, lang):
+            gate.wait(5)
+            return 7
+
+        with mock.patch.object(ovos_number_parser, "extract_number", slow):
+            first = asyncio.ensure_future(aio.extract_number("x", "en"))
+            second = asyncio.ensure_future(aio.extract_number("x", "en"))
+            await asyncio.sleep(0)
+            first.cancel()
+            gate.set()
+            self.assertEqual(await second, 7)
+
+    async def test_errors_reach_the_caller(self):
+        with self.assertRaises(NotImplementedError):
+            await aio.extract_number("one", "xx")
+
+    async def test_configured_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        aio.configure(executor=executor)
+        with mock.patch.object(executor, "submit",
+                               wraps=executor.submit) as submit:
+            self.assertEqual(await aio.pronounce_number(2, "en"), "two")
+        submit.assert_called_once()
+
+    def test_configure_arguments(self):
+        with self.assertRaises(ValueError):
+            aio.configure(max_workers=0)
+        with self.assertRaises(ValueError):
+            aio.configure(max_workers=2, executor=ThreadPoolExecutor())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Batch APIs: ordered generators over many inputs, with deduplication."""
+import types
+import unittest
+from unittest import mock
+
+import ovos_number_parser
+from ovos_number_parser import (extract_number, extract_number_batch,
+                                numbers_to_digits, numbers_to_digits_batch,
+                                pronounce_number, pronounce_numbers)
+from ovos_number_parser.util import GrammaticalGender, Scale
+
+
+class TestBatch(unittest.TestCase):
+    def test_matches_single_calls(self):
+        numbers = [0, 7, 21, 1.5, -3, 1000000, 21, 7]
+        result = pronounce_numbers(numbers, "en")
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertEqual(list(result),
+                         [pronounce_number(n, "en") for n in numbers])
+        texts = ["twenty one cats", "no number", "um milhão", "three"]
+        self.assertEqual(list(extract_number_batch(texts, "pt")),
+                         [extract_number(t, "pt") for t in texts])
+        self.assertEqual(list(numbers_to_digits_batch(texts, "en")),
+                         [numbers_to_digits(t, "en") for t in texts])
+
+    def test_settings_are_passed_on(self):
+        self.assertEqual(
+            list(pronounce_numbers([1, 2], "pt",
+                                   gender=GrammaticalGender.FEMININE)),
+            ["uma", "duas"])
+        self.assertEqual(list(pronounce_numbers([3], "en", ordinals=True)),
+                         ["third"])
+        self.assertEqual(
+            list(extract_number_batch(["one billion"], "en",
+                                      scale=Scale.LONG)),
+            [extract_number("one billion", "en", scale=Scale.LONG)])
+
+    def test_equal_values_spoken_differently_are_kept_apart(self):
+        self.assertEqual(list(pronounce_numbers([1, 1.0, True, 1], "en")),
+                         [pronounce_number(n, "en") for n in (1, 1.0, True, 1)])
+
+    def test_repeated_inputs_are_read_once(self):
+        calls = []
+        real = ovos_number_parser._run_batch
+
+        def counting(method, lang, settings, kwargs, items):
+            calls.extend(items)
+            return real(method, lang, settings, kwargs, items)
+
+        with mock.patch.object(ovos_number_parser, "_run_batch", counting):
+            out = list(pronounce_numbers([5, 6, 5, 5, 6, 7] * 3, "en",
+                                         chunksize=4))
+        self.assertEqual(len(out), 18)
+        self.assertEqual(sorted(calls), [5, 6, 7])
+
+    def test_worker_processes(self):
+        numbers = list(range(50)) * 2
+        self.assertEqual(
+            list(pronounce_numbers(numbers, "de", workers=2, chunksize=7)),
+            [pronounce_number(n, "de") for n in numbers])
+
+    def test_languages_served_by_fallbacks(self):
+        # "sw" has no native backend: pronounce_number reads it with
+        # unicode-rbnf and numbers_to_digits with the generic fallback
+        numbers = [2, 21, 2]
+        self.assertEqual(list(pronounce_numbers(numbers, "sw")),
+                         [pronounce_number(n, "sw") for n in numbers])
+        self.assertEqual(list(pronounce_numbers([2], "sw")), ["mbili"])
+        self.assertEqual(list(numbers_to_digits_batch(["mbili paka"], "sw")),
+                         [numbers_to_digits("mbili paka", "sw")])
+        with self.assertRaises(NotImplementedError):
+            extract_number_batch(["mbili"], "sw")
+
+    def test_bad_arguments_raise_at_the_call(self):
+        with self.assertRaises(NotImplementedError):
+            pronounce_numbers([1], "xx")
+        with self.assertRaises(NotImplementedError):
+            extract_number_batch(["one"], "xx")
+        with self.assertRaises(ValueError):
+            extract_number_batch(["one"], "en", chunksize=0)
+
+    def test_empty_input(self):
+        self.assertEqual(list(numbers_to_digits_batch([], "en")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
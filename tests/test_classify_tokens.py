@@ -0,0 +1,71 @@
+"""classify_tokens() tags each word with its role in a spoken number."""
+import unittest
+
+from ovos_number_parser import (ClassifiedToken, TokenKind, _BACKEND_PREFIXES,
+                                classify_tokens, is_fractional, is_ordinal)
+
+
+def _kinds(tokens, lang):
+    return [(c.kind, c.value) for c in classify_tokens(tokens, lang)]
+
+
+class TestClassifyTokens(unittest.TestCase):
+    def test_english(self):
+        tokens = ("three second quarter hundred and minus point "
+                  "damaged 12 2.5").split()
+        self.assertEqual(_kinds(tokens, "en"), [
+            (TokenKind.CARDINAL, 3), (TokenKind.ORDINAL, 2),
+            (TokenKind.FRACTION, 0.25), (TokenKind.SCALE, 100),
+            (TokenKind.JOINER, None), (TokenKind.NEGATIVE, None),
+            (TokenKind.DECIMAL_MARKER, None), (TokenKind.NONE, None),
+            (TokenKind.CARDINAL, 12), (TokenKind.CARDINAL, 2.5)])
+
+    def test_result_type(self):
+        result = classify_tokens(["Twelve"], "en")[0]
+        self.assertIsInstance(result, ClassifiedToken)
+        self.assertEqual(result, ("Twelve", TokenKind.CARDINAL, 12))
+
+    def test_romance_vocabulary(self):
+        tokens = "vinte e um mil menos vírgula terceiro meio duas".split()
+        self.assertEqual(_kinds(tokens, "pt"), [
+            (TokenKind.CARDINAL, 20), (TokenKind.JOINER, None),
+            (TokenKind.CARDINAL, 1), (TokenKind.SCALE, 1000),
+            (TokenKind.NEGATIVE, None), (TokenKind.DECIMAL_MARKER, None),
+            (TokenKind.ORDINAL, 3), (TokenKind.FRACTION, 0.5),
+            (TokenKind.CARDINAL, 2)])
+
+    def test_scale_words_said_inside_compounds(self):
+        self.assertEqual(_kinds(["tausend"], "de"),
+                         [(TokenKind.SCALE, 1000)])
+        self.assertEqual(_kinds(["puluh"], "id"), [(TokenKind.SCALE, 10)])
+
+    def test_agrees_with_the_separate_checks(self):
+        for token in ("second", "third", "quarter", "half", "fifth"):
+            with self.subTest(token=token):
+                kind, value = _kinds([token], "en")[0]
+                ordinal = is_ordinal(token, "en")
+                if ordinal is not False:
+                    self.assertEqual((kind, value),
+                                     (TokenKind.ORDINAL, ordinal))
+                else:
+                    self.assertEqual(
+                        (kind, value),
+                        (TokenKind.FRACTION, is_fractional(token, "en")))
+
+    def test_every_language(self):
+        for lang in _BACKEND_PREFIXES:
+            with self.subTest(lang=lang):
+                kinds = {c.kind for c in classify_tokens(["zzz", "7"], lang)}
+                self.assertEqual(kinds, {TokenKind.NONE, TokenKind.CARDINAL})
+
+    def test_non_string_tokens(self):
+        self.assertEqual(_kinds([None, ""], "en"),
+                         [(TokenKind.NONE, None), (TokenKind.NONE, None)])
+
+    def test_unsupported_language(self):
+        with self.assertRaises(NotImplementedError):
+            classify_tokens(["one"], "xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import unittest
 from ovos_number_parser.numbers_en import (
     pronounce_number_en,
     extract_number_en,
+    numbers_to_digits_en,
 )
 
 # magnitudes spanning the named short-scale range and beyond, including exact
@@ -71,6 +72,26 @@ class TestEnglishLargeNumbers(unittest.TestCase):
         # googolplex overflows a float and is not fabricated
         self.assertFalse(extract_number_en("googolplex"))
 
+    def test_scale_word_after_a_larger_one_multiplies(self):
+        # "hundred" after "million" used to be added to it before the
+        # multiplication: "million hundred" read 1000100000000
+        self.assertEqual(extract_number_en("million hundred"), 1e8)
+        self.assertEqual(extract_number_en("one million hundred"), 1e8)
+        self.assertEqual(numbers_to_digits_en("a million hundred thousand"),
+                         "a 100000000000")
+        # a smaller number between the scales is still added
+        self.assertEqual(extract_number_en("two million five hundred"),
+                         2000500)
+        self.assertEqual(extract_number_en("hundred thousand"), 100000)
+        self.assertEqual(extract_number_en("five hundred thousand million"),
+                         5e11)
+
+    def test_repeated_scale_words_grow_the_value_not_its_size(self):
+        # each repeat used to square the value, so a dozen of them took
+        # minutes on an integer of millions of digits
+        value = extract_number_en("million hundred thousand " * 20)
+        self.assertLess(value, 10 ** 300)
+
 
 if __name__ == "__main__":
     unittest.main()
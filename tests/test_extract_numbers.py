@@ -0,0 +1,119 @@
+"""extract_numbers() returns every number of a text with its span."""
+import unittest
+from collections import Counter
+from unittest import mock
+
+import ovos_number_parser
+from ovos_number_parser import ExtractedNumber, Scale, extract_number, \
+    extract_numbers
+
+
+def _spans(text, lang, **kwargs):
+    return [(n.value, n.text, n.start, n.end)
+            for n in extract_numbers(text, lang, **kwargs)]
+
+
+class TestExtractNumbers(unittest.TestCase):
+    def test_english(self):
+        text = "I have twenty one apples, 3 pears and two hundred and five grapes."
+        found = extract_numbers(text, "en")
+        self.assertEqual([(n.value, n.text) for n in found],
+                         [(21, "twenty one"), (3, "3"),
+                          (205, "two hundred and five")])
+        for number in found:
+            self.assertIsInstance(number, ExtractedNumber)
+            self.assertEqual(text[number.char_start:number.char_end],
+                             number.text)
+
+    def test_word_indexes(self):
+        self.assertEqual(_spans("add twenty one and then five", "en"),
+                         [(21, "twenty one", 1, 3), (5, "five", 5, 6)])
+
+    def test_spoken_commas_stay_inside_an_english_number(self):
+        self.assertEqual(_spans("two thousand, twenty three", "en"),
+                         [(2023, "two thousand, twenty three", 0, 4)])
+
+    def test_words_around_commas_are_read_once_in_the_callers_scale(self):
+        calls = Counter()
+        real = ovos_number_parser.extract_number
+
+        def counting(text, lang, *args, **kwargs):
+            calls[text, kwargs.get("scale")] += 1
+            return real(text, lang, *args, **kwargs)
+
+        with mock.patch.object(ovos_number_parser, "extract_number",
+                               counting):
+            extract_numbers("one, two, three, four", "en", scale=Scale.LONG)
+        self.assertEqual(calls, Counter({(word, Scale.LONG): 1 for word in
+                                         ("one", "two", "three", "four")}))
+
+    def test_ordinals(self):
+        self.assertEqual(
+            _spans("the first and twenty second", "en", ordinals=True),
+            [(1, "first", 1, 2), (22, "twenty second", 3, 5)])
+        self.assertEqual(
+            _spans("o primeiro e o terceiro", "pt", ordinals=True),
+            [(1, "primeiro", 1, 2), (3, "terceiro", 4, 5)])
+
+    def test_romance_joiners(self):
+        self.assertEqual(
+            _spans("tenho vinte e um anos e 3 gatos", "pt"),
+            [(21, "vinte e um", 1, 4), (3, "3", 6, 7)])
+        # an ascending pair is two numbers ("três e vinte" = 3:20)
+        self.assertEqual([n.value for n in
+                          extract_numbers("às três e vinte", "pt")], [3, 20])
+        self.assertEqual([n.value for n in
+                          extract_numbers("vinte e un gatos e tres cans", "gl")],
+                         [21, 3])
+
+    def test_numbers_do_not_cross_clauses(self):
+        self.assertEqual([n.value for n in extract_numbers(
+            "a las tres y veinte, mil y quinientos", "es")], [3, 20, 1500])
+
+    def test_hyphenated_and_compound_words(self):
+        self.assertEqual(
+            _spans("vingt-et-un chats et quatre-vingt-dix chiens", "fr"),
+            [(21, "vingt-et-un", 0, 3), (90, "quatre-vingt-dix", 5, 8)])
+        self.assertEqual(_spans("einundzwanzig Katzen und zwei Hunde", "de"),
+                         [(21, "einundzwanzig", 0, 1), (2, "zwei", 3, 4)])
+        self.assertEqual(_spans("eenentwintig katten en drie honden", "nl"),
+                         [(21, "eenentwintig", 0, 1), (3, "drie", 3, 4)])
+
+    def test_split_readings_are_joined(self):
+        self.assertEqual([n.value for n in extract_numbers(
+            "было триста сорок два кота", "ru")], [342])
+        self.assertEqual([n.value for n in extract_numbers(
+            "dvadeset i jedan pas i tri mačke", "hr")], [21, 3])
+
+    def test_generic_spans(self):
+        self.assertEqual([n.value for n in extract_numbers(
+            "saya punya dua puluh satu kucing", "id")], [21])
+        self.assertEqual([n.value for n in extract_numbers(
+            "tres coma cinco kilos", "es")], [3.5])
+        self.assertEqual([n.value for n in extract_numbers(
+            "tre hundra och fyrtiotvå", "sv")], [342])
+
+    def test_one_number_matches_extract_number(self):
+        for lang, text in (("en", "set a timer for twenty one minutes"),
+                           ("pt", "dois mil e vinte e três"),
+                           ("es", "dos mil veintitrés"),
+                           ("it", "ventuno gatti"),
+                           ("sk", "dvadsaťjeden mačiek"),
+                           ("ar", "عندي خمسة كتب")):
+            with self.subTest(lang=lang):
+                found = extract_numbers(text, lang)
+                self.assertEqual(len(found), 1)
+                self.assertEqual(found[0].value, extract_number(text, lang))
+
+    def test_no_numbers(self):
+        self.assertEqual(extract_numbers("nothing to see here", "en"), [])
+        self.assertEqual(extract_numbers("", "pt"), [])
+        self.assertEqual(extract_numbers(None, "en"), [])
+
+    def test_unsupported_language(self):
+        with self.assertRaises(NotImplementedError):
+            extract_numbers("one", "xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 """Edge-path tests for the generic language fallbacks."""
 import unittest
+from collections import Counter
+from unittest.mock import patch
 
+import ovos_number_parser
 from ovos_number_parser import numbers_to_digits
 
 
@@ -57,5 +60,25 @@ class TestPerLanguageNumbersToDigits(unittest.TestCase):
             "2500 kroner")
 
 
+class TestGenericNumbersToDigitsReads(unittest.TestCase):
+    """Each word and each grown span is read once per call."""
+
+    def test_no_text_is_read_twice(self):
+        utterance = "il a payé deux millions trois cent quarante-cinq " \
+                    "mille six cent soixante-dix-huit euros et deux euros"
+        reads = Counter()
+        extract = ovos_number_parser.extract_number
+
+        def counting(text, lang, *args, **kwargs):
+            reads[text] += 1
+            return extract(text, lang, *args, **kwargs)
+
+        with patch.object(ovos_number_parser, "extract_number", counting):
+            out = ovos_number_parser._numbers_to_digits_generic(utterance,
+                                                                "fr")
+        self.assertEqual(out, "il a payé 2345678 euros et 2 euros")
+        self.assertEqual(max(reads.values()), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,123 @@
+"""Language tags resolve once to a backend, and every dispatcher uses it."""
+import unittest
+from unittest.mock import patch
+
+import ovos_number_parser
+from ovos_number_parser import (_resolve_lang, _rbnf_engine, extract_number,
+                                 is_ordinal, numbers_to_digits,
+                                 preload_rbnf_engines, pronounce_number,
+                                 pronounce_ordinal)
+
+
+class TestResolveLang(unittest.TestCase):
+    def test_prefix_and_region(self):
+        self.assertEqual(_resolve_lang("en").code, "en")
+        self.assertEqual(_resolve_lang("en-US").code, "en")
+        self.assertEqual(_resolve_lang("en_GB").code, "en")
+        self.assertEqual(_resolve_lang("ast-ES").code, "ast")
+
+    def test_case_insensitive(self):
+        self.assertEqual(_resolve_lang("DE-de").code, "de")
+        self.assertEqual(pronounce_number(21, "DE"), "einundzwanzig")
+
+    def test_portuguese_variants(self):
+        self.assertEqual(_resolve_lang("pt-PT").code, "pt")
+        self.assertEqual(_resolve_lang("pt-BR").code, "pt-br")
+        self.assertEqual(_resolve_lang("pt_br").code, "pt-br")
+        self.assertEqual(pronounce_number(16, "pt-BR"), "dezesseis")
+        self.assertEqual(pronounce_number(16, "pt-PT"), "dezasseis")
+
+    def test_norwegian_alias(self):
+        self.assertEqual(_resolve_lang("no").code, "nb")
+        self.assertEqual(_resolve_lang("nb-NO").code, "nb")
+        self.assertEqual(_resolve_lang("nn").code, "nn")
+        self.assertEqual(pronounce_number(3, "no"), pronounce_number(3, "nb"))
+
+    def test_arabic_lects(self):
+        for tag in ("ar", "ar-SA", "arb", "acw", "apc", "ajp"):
+            self.assertEqual(_resolve_lang(tag).code, "ar", tag)
+        self.assertEqual(_resolve_lang("ar").ar_case, "nominative")
+        self.assertEqual(_resolve_lang("arz").ar_case, "oblique")
+
+    def test_unknown_language(self):
+        self.assertIsNone(_resolve_lang("sw"))
+        self.assertIsNone(_resolve_lang("xx-YY"))
+
+    def test_resolution_is_cached(self):
+        self.assertIs(_resolve_lang("fr-CA"), _resolve_lang("fr-CA"))
+
+
+class TestRegistryFallbacks(unittest.TestCase):
+    """Languages without a native backend keep their documented fallbacks."""
+
+    def test_rbnf_pronounce(self):
+        self.assertEqual(pronounce_number(2, "sw"), "mbili")
+
+    def test_rbnf_ordinal_for_language_without_native_ordinals(self):
+        self.assertEqual(pronounce_ordinal(3, "en"), "third")
+
+    def test_generic_is_ordinal(self):
+        self.assertEqual(is_ordinal("troisième", "fr"), 3)
+
+    def test_generic_numbers_to_digits(self):
+        self.assertEqual(numbers_to_digits("vingt et un chats", "fr"),
+                         "21 chats")
+
+    def test_unsupported_extract_raises(self):
+        with self.assertRaises(NotImplementedError):
+            extract_number("mbili", "sw")
+        with self.assertRaises(NotImplementedError):
+            pronounce_number(2, "xx")
+
+
+class TestRbnfEngineCache(unittest.TestCase):
+    """The unicode-rbnf rules of a language are parsed once, and a language
+    unicode-rbnf cannot serve is only looked up once."""
+
+    def setUp(self):
+        _rbnf_engine.cache_clear()
+
+    def tearDown(self):
+        _rbnf_engine.cache_clear()
+
+    def test_engine_is_built_once(self):
+        engine_cls = ovos_number_parser._load("RbnfEngine")
+        with patch.object(engine_cls, "for_language",
+                          wraps=engine_cls.for_language) as for_language:
+            self.assertEqual(pronounce_number(2, "sw"), "mbili")
+            self.assertEqual(pronounce_number(2, "sw-KE"), "mbili")
+            self.assertEqual(pronounce_ordinal(3, "en"), "third")
+            pronounce_ordinal(3, "en")
+            for _ in range(3):
+                with self.assertRaises(NotImplementedError):
+                    pronounce_number(2, "xx")
+        self.assertEqual(sorted(c.args[0] for c in for_language.call_args_list),
+                         ["en", "sw", "xx"])
+
+    def test_other_errors_propagate_and_are_not_cached(self):
+        engine_cls = ovos_number_parser._load("RbnfEngine")
+        with patch.object(engine_cls, "for_language",
+                          side_effect=ImportError("broken install")):
+            with self.assertRaises(ImportError):
+                pronounce_number(2, "sw")
+        self.assertEqual(_rbnf_engine.cache_info().currsize, 0)
+        self.assertEqual(pronounce_number(2, "sw"), "mbili")
+
+    def test_unknown_codes_do_not_grow_the_cache_without_bound(self):
+        engine_cls = ovos_number_parser._load("RbnfEngine")
+        with patch.object(engine_cls, "for_language",
+                          side_effect=ValueError("no rules")):
+            for n in range(600):
+                with self.assertRaises(NotImplementedError):
+                    pronounce_number(2, f"x{n}")
+        self.assertLessEqual(_rbnf_engine.cache_info().currsize, 512)
+
+    def test_preload(self):
+        preload_rbnf_engines(["sw", "en-US", "xx"])
+        self.assertEqual(_rbnf_engine.cache_info().currsize, 3)
+        self.assertIsNone(_rbnf_engine("xx"))
+        self.assertIsNotNone(_rbnf_engine("en"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Per-language modules and unicode-rbnf are imported on first use only."""
+import json
+import subprocess
+import sys
+import unittest
+
+
+def _loaded_after(code):
+    """Modules of interest present in sys.modules after running ``code`` in a
+    fresh interpreter."""
+    probe = code + (
+        "\nimport json, sys\n"
+        "print(json.dumps(sorted(m for m in sys.modules\n"
+        "    if m.startswith('ovos_number_parser.numbers_')\n"
+        "    or m.split('.')[0] == 'unicode_rbnf')))\n")
+    out = subprocess.run([sys.executable, "-c", probe], check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_loads_no_language_module(self):
+        self.assertEqual(_loaded_after("import ovos_number_parser"), [])
+
+    def test_first_call_loads_only_its_language(self):
+        loaded = _loaded_after(
+            "from ovos_number_parser import pronounce_number\n"
+            "pronounce_number(21, 'de')")
+        self.assertIn("ovos_number_parser.numbers_de", loaded)
+        self.assertNotIn("ovos_number_parser.numbers_fr", loaded)
+        self.assertNotIn("unicode_rbnf", loaded)
+
+    def test_rbnf_loaded_by_the_fallback_only(self):
+        loaded = _loaded_after(
+            "from ovos_number_parser import pronounce_number\n"
+            "pronounce_number(21, 'sw')")
+        self.assertIn("unicode_rbnf", loaded)
+
+    def test_per_language_names_still_importable(self):
+        from ovos_number_parser import PT_PT, nice_number_de, \
+            pronounce_number_de
+        self.assertEqual(pronounce_number_de(21), "einundzwanzig")
+        self.assertEqual(nice_number_de(5.5), "5 und ein halb")
+        self.assertEqual(PT_PT.pronounce_number(2), "dois")
+
+    def test_star_import_exports_per_language_names(self):
+        namespace = {}
+        exec("from ovos_number_parser import *", namespace)
+        for name in ("pronounce_number", "extract_number", "PT_PT", "ES",
+                     "pronounce_number_de", "nice_number_de",
+                     "extract_number_en", "RbnfEngine"):
+            self.assertIn(name, namespace)
+        self.assertEqual(namespace["pronounce_number_de"](21),
+                         "einundzwanzig")
+        self.assertNotIn("_load", namespace)
+
+    def test_unknown_attribute_raises(self):
+        import ovos_number_parser
+        with self.assertRaises(AttributeError):
+            ovos_number_parser.pronounce_number_xx
+        self.assertIn("pronounce_number_de", dir(ovos_number_parser))
+
+
+if __name__ == "__main__":
+    unittest.main()
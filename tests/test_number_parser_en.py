@@ -183,5 +183,96 @@ class TestNumberParserEN(unittest.TestCase):
             pronounce_number_en(n, ordinals=True, short_scale=False)
 
 
+class TestLexiconEN(unittest.TestCase):
+    """The English word tables are compiled once per scale and speech
+    setting and shared, read-only, by every lookup."""
+
+    def test_lexicon_is_compiled_once(self):
+        from ovos_number_parser.numbers_en import _lexicon_en
+        self.assertIs(_lexicon_en(True, True), _lexicon_en(True, True))
+        self.assertIsNot(_lexicon_en(True, True), _lexicon_en(False, True))
+        with self.assertRaises(TypeError):
+            _lexicon_en().string_num_scale["hundred"] = 1
+
+    def test_scale_and_speech_tables(self):
+        from ovos_number_parser.numbers_en import _initialize_number_data_en
+        multiplies, _, scale = _initialize_number_data_en(True)
+        self.assertIn("googol", multiplies)
+        self.assertIn("billions", multiplies)
+        self.assertEqual(scale["billion"], 1e9)
+        self.assertEqual(scale["half"], 0.5)
+        _, _, long_scale = _initialize_number_data_en(False, speech=False)
+        self.assertEqual(long_scale["billion"], 1e12)
+        self.assertNotIn("half", long_scale)
+
+    def test_fraction_words(self):
+        self.assertEqual(is_fractional_en("fifths"), 0.2)
+        self.assertEqual(is_fractional_en("Third"), 1 / 3)
+        self.assertFalse(is_fractional_en("half", spoken=False))
+        self.assertEqual(extract_number_en("two fifths"), 0.4)
+
+
+class TestNumbersToDigitsScanEN(unittest.TestCase):
+    """numbers_to_digits_en finds every number of a long text in one pass."""
+
+    def test_several_numbers(self):
+        self.assertEqual(
+            numbers_to_digits_en("two million five hundred thousand and six "
+                                 "hundred sixty six cats and three dogs"),
+            "2500666 cats and 3 dogs")
+        self.assertEqual(
+            numbers_to_digits_en("we hired seven people and two of them"),
+            "we hired 7 people and 2 of them")
+
+    def test_long_transcript(self):
+        sentence = "we spent two hundred forty five thousand dollars on " \
+                   "seven servers"
+        self.assertEqual(numbers_to_digits_en(sentence),
+                         "we spent 245000 dollars on 7 servers")
+        self.assertEqual(numbers_to_digits_en(" ".join([sentence] * 500)),
+                         " ".join(["we spent 245000 dollars on 7 servers"]
+                                  * 500))
+
+    def test_commas_in_a_long_transcript(self):
+        # each comma used to split the whole rest of the text to find the
+        # word after it
+        sentence = "we sold twenty, five cats, two dogs, and one fish"
+        self.assertEqual(numbers_to_digits_en(sentence),
+                         "we sold 25 cats, 2 dogs, and 1 fish")
+        self.assertEqual(numbers_to_digits_en(" ".join([sentence] * 2000)),
+                         " ".join(["we sold 25 cats, 2 dogs, and 1 fish"]
+                                  * 2000))
+
+    def test_numbers_back_to_back(self):
+        self.assertEqual(
+            numbers_to_digits_en("my number is five five five one two"),
+            "my number is 5 5 5 1 2")
+        self.assertEqual(numbers_to_digits_en("one hundred and one two three"),
+                         "101 2 3")
+        # each number of a run is read on its own: none takes over the sign
+        # or the pending million of the one before
+        self.assertEqual(numbers_to_digits_en("two million five three"),
+                         "2000005 3")
+        self.assertEqual(numbers_to_digits_en("minus one two"), "-1 2")
+        digits = "nine one one four " * 1000
+        self.assertEqual(numbers_to_digits_en(digits), "9 1 1 4 " * 999 +
+                         "9 1 1 4")
+
+    def test_run_is_read_in_one_pass(self):
+        from unittest import mock
+        from ovos_number_parser.numbers_en import _ENGINE_EN
+        reader = _ENGINE_EN.whole_number
+        read = []
+
+        def counting(tokens, short_scale, ordinals, start=0, *args):
+            read.append(len(tokens) - start)
+            return reader(tokens, short_scale, ordinals, start, *args)
+
+        with mock.patch.object(_ENGINE_EN, "whole_number", counting):
+            numbers_to_digits_en("five one two " * 400)
+        # the rescans of old read the run again for each of its numbers
+        self.assertLess(sum(read), 5 * 1200)
+
+
 if __name__ == "__main__":
     unittest.main()
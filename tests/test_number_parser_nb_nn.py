@@ -2,9 +2,9 @@
 core, the variant divergences and the two counting traditions."""
 import unittest
 
-from ovos_number_parser import (extract_number, is_fractional, is_ordinal,
-                                numbers_to_digits, pronounce_number,
-                                pronounce_ordinal)
+from ovos_number_parser import (extract_number, extract_numbers,
+                                is_fractional, is_ordinal, numbers_to_digits,
+                                pronounce_number, pronounce_ordinal)
 
 
 class TestBokmaal(unittest.TestCase):
@@ -87,6 +87,19 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(numbers_to_digits('tjueen katter', lang="nb"),
                          '21 katter')
 
+    def test_og_joins_the_parts_of_one_number(self):
+        for lang in ("nb", "nn"):
+            with self.subTest(lang=lang):
+                self.assertEqual(
+                    numbers_to_digits('tre hundre og førtito katter', lang),
+                    '342 katter')
+                self.assertEqual(numbers_to_digits('to tusen og fem', lang),
+                                 '2005')
+                self.assertEqual(numbers_to_digits('katter og hunder', lang),
+                                 'katter og hunder')
+                self.assertEqual([n.value for n in extract_numbers(
+                    'tre hundre og førtito', lang)], [342])
+
     def test_no_number(self):
         for lang in ("nb", "nn"):
             self.assertFalse(extract_number('god morgen', lang=lang))
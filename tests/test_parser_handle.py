@@ -0,0 +1,94 @@
+"""get_parser handles must answer exactly like the module-level functions."""
+import unittest
+
+from ovos_number_parser import (extract_number, get_parser, is_fractional,
+                                 is_ordinal, numbers_to_digits,
+                                 pronounce_fraction, pronounce_number,
+                                 pronounce_ordinal)
+from ovos_number_parser.util import GrammaticalGender, Scale
+
+LANGS = ["an", "ar", "ast", "az", "bg", "ca", "cs", "da", "de", "el", "en",
+         "es", "et", "eu", "fa", "fi", "fr", "fy", "gl", "he", "hr", "hu",
+         "id", "it", "kab", "ms", "mwl", "nb", "nl", "nn", "oc", "pl", "pt",
+         "pt-BR", "ro", "ru", "sk", "sl", "sv", "tr", "uk"]
+
+NUMBERS = [0, 1, 7, 21, 100, 1234, -5, 2.5, 1000000]
+
+
+def outcome(fn, *args):
+    """Result of the call, or the type of the error it raised (Kabyle, for
+    one, rejects negative and decimal numbers)."""
+    try:
+        return fn(*args)
+    except Exception as err:
+        return type(err)
+
+
+class TestHandleParity(unittest.TestCase):
+    def test_pronounce_number(self):
+        for lang in LANGS:
+            parser = get_parser(lang)
+            for n in NUMBERS:
+                self.assertEqual(outcome(parser.pronounce_number, n),
+                                 outcome(pronounce_number, n, lang),
+                                 f"{lang} {n}")
+
+    def test_pronounce_ordinal(self):
+        for lang in LANGS:
+            parser = get_parser(lang)
+            for n in (1, 3, 21):
+                self.assertEqual(parser.pronounce_ordinal(n),
+                                 pronounce_ordinal(n, lang), f"{lang} {n}")
+
+    def test_pronounce_fraction(self):
+        for lang in LANGS:
+            parser = get_parser(lang)
+            for frac in ("1/2", "3/4", "-2/3"):
+                self.assertEqual(outcome(parser.pronounce_fraction, frac),
+                                 outcome(pronounce_fraction, frac, lang),
+                                 f"{lang} {frac}")
+
+    def test_round_trip_helpers(self):
+        for lang in LANGS:
+            parser = get_parser(lang)
+            for n in (3, 21, 1234):
+                spoken = pronounce_number(n, lang)
+                self.assertEqual(parser.extract_number(spoken),
+                                 extract_number(spoken, lang), f"{lang} {n}")
+                self.assertEqual(parser.numbers_to_digits(spoken),
+                                 numbers_to_digits(spoken, lang),
+                                 f"{lang} {n}")
+            ordinal = pronounce_ordinal(3, lang)
+            self.assertEqual(parser.is_ordinal(ordinal),
+                             is_ordinal(ordinal, lang), lang)
+            self.assertEqual(parser.is_fractional(ordinal),
+                             is_fractional(ordinal, lang), lang)
+
+
+class TestHandleSettings(unittest.TestCase):
+    def test_defaults_are_resolved(self):
+        self.assertEqual(get_parser("pt-BR").scale, Scale.SHORT)
+        self.assertEqual(get_parser("pt-PT").scale, Scale.LONG)
+        self.assertEqual(get_parser("arz").case, "oblique")
+        self.assertIsNone(get_parser("en").case)
+
+    def test_explicit_settings(self):
+        parser = get_parser("en", scale=Scale.LONG)
+        self.assertEqual(parser.pronounce_number(10 ** 9),
+                         pronounce_number(10 ** 9, "en", scale=Scale.LONG))
+        fem = get_parser("pt", gender=GrammaticalGender.FEMININE)
+        self.assertEqual(fem.pronounce_number(2), "duas")
+        self.assertEqual(
+            fem.pronounce_number(2, gender=GrammaticalGender.MASCULINE),
+            "dois")
+
+    def test_unsupported_language(self):
+        parser = get_parser("sw")
+        self.assertEqual(parser.pronounce_number(2), "mbili")
+        with self.assertRaises(NotImplementedError):
+            parser.extract_number("mbili")
+        self.assertIs(parser.extract_number(None), False)
+
+
+if __name__ == "__main__":
+    unittest.main()
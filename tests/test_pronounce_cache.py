@@ -0,0 +1,100 @@
+"""The opt-in pronounce_number cache: bounded, shared and never confuses
+numbers that compare equal but are spoken differently."""
+import threading
+import unittest
+from unittest.mock import patch
+
+import ovos_number_parser
+from ovos_number_parser import (disable_pronounce_cache,
+                                 enable_pronounce_cache, get_parser,
+                                 pronounce_number)
+from ovos_number_parser.util import Scale
+
+
+class TestPronounceCache(unittest.TestCase):
+    def setUp(self):
+        enable_pronounce_cache(4)
+        pronounce_number.cache_clear()
+
+    def tearDown(self):
+        disable_pronounce_cache()
+
+    def test_disabled_by_default(self):
+        disable_pronounce_cache()
+        pronounce_number(21, "en")
+        self.assertEqual(pronounce_number.cache_info(), (0, 0, 0, 0))
+
+    def test_hits_skip_the_backend(self):
+        with patch.object(ovos_number_parser, "_pronounce_number_uncached",
+                          wraps=ovos_number_parser._pronounce_number_uncached
+                          ) as backend:
+            for _ in range(3):
+                self.assertEqual(pronounce_number(21, "en"), "twenty one")
+        self.assertEqual(backend.call_count, 1)
+        info = pronounce_number.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+    def test_equal_numbers_are_kept_apart(self):
+        numbers = [1, 1.0, True, 0.0, -0.0, 0]
+        disable_pronounce_cache()
+        expected = [pronounce_number(n, "en") for n in numbers]
+        enable_pronounce_cache(16)
+        self.assertEqual([pronounce_number(n, "en") for n in numbers],
+                         expected)
+        self.assertEqual(pronounce_number.cache_info().misses, len(numbers))
+
+    def test_settings_are_part_of_the_key(self):
+        self.assertEqual(pronounce_number(10 ** 9, "en"), "one billion")
+        self.assertEqual(pronounce_number(10 ** 9, "en", scale=Scale.LONG),
+                         "one thousand million")
+        self.assertEqual(pronounce_number(3, "en", ordinals=True), "third")
+        self.assertEqual(pronounce_number(3, "en"), "three")
+        self.assertEqual(pronounce_number(2.5, "es"), "dos coma cinco")
+
+    def test_bounded_lru(self):
+        for n in range(6):
+            pronounce_number(n, "en")
+        self.assertEqual(pronounce_number.cache_info().currsize, 4)
+        pronounce_number(5, "en")  # most recent: still cached
+        self.assertEqual(pronounce_number.cache_info().hits, 1)
+        pronounce_number(0, "en")  # evicted first
+        self.assertEqual(pronounce_number.cache_info().misses, 7)
+        enable_pronounce_cache(2)
+        self.assertEqual(pronounce_number.cache_info().currsize, 2)
+
+    def test_shared_with_parser_handles(self):
+        pronounce_number(7, "pt")
+        self.assertEqual(get_parser("pt").pronounce_number(7), "sete")
+        self.assertEqual(pronounce_number.cache_info().hits, 1)
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            pronounce_number(float("nan"), "en")
+        self.assertEqual(pronounce_number.cache_info().currsize, 0)
+
+    def test_invalid_size(self):
+        for size in (0, -1, 2.5, True):
+            with self.assertRaises(ValueError):
+                enable_pronounce_cache(size)
+
+    def test_threads(self):
+        enable_pronounce_cache(32)
+        expected = {n: pronounce_number(n, "en") for n in range(64)}
+        errors = []
+
+        def speak():
+            for n in range(64):
+                if pronounce_number(n, "en") != expected[n]:
+                    errors.append(n)
+
+        threads = [threading.Thread(target=speak) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(pronounce_number.cache_info().currsize, 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Precomputed 0..9999 tables answer exactly like the backends they are
+built from."""
+import unittest
+from unittest.mock import patch
+
+import ovos_number_parser
+from ovos_number_parser import (disable_pronounce_tables,
+                                 enable_pronounce_tables, get_parser,
+                                 pronounce_fraction, pronounce_number,
+                                 pronounce_ordinal)
+from ovos_number_parser.util import GrammaticalGender
+
+
+def spoken(lang, numbers, **kwargs):
+    return [pronounce_number(n, lang, **kwargs) for n in numbers]
+
+
+class TestPronounceTables(unittest.TestCase):
+    NUMBERS = [0, 1, 2, 7, 21, 99, 100, 101, 110, 999, 1000, 1001, 2345,
+               9999]
+
+    def setUp(self):
+        enable_pronounce_tables()
+
+    def tearDown(self):
+        disable_pronounce_tables()
+
+    def expected(self, fn, *args, **kwargs):
+        disable_pronounce_tables()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            enable_pronounce_tables()
+
+    def test_cardinals_match_backends(self):
+        for lang in ("en", "de", "ru", "pt", "pt-BR", "es", "ar"):
+            for gender in (GrammaticalGender.MASCULINE,
+                           GrammaticalGender.FEMININE):
+                self.assertEqual(
+                    spoken(lang, self.NUMBERS, gender=gender),
+                    self.expected(spoken, lang, self.NUMBERS, gender=gender),
+                    f"{lang} {gender}")
+
+    def test_ordinals_match_backends(self):
+        for lang in ("de", "pt", "pl"):
+            for n in (1, 2, 3, 21, 100, 1000):
+                self.assertEqual(
+                    pronounce_ordinal(n, lang),
+                    self.expected(pronounce_ordinal, n, lang), f"{lang} {n}")
+                self.assertEqual(
+                    get_parser(lang).pronounce_ordinal(n),
+                    pronounce_ordinal(n, lang), f"{lang} {n}")
+
+    def test_fractions_match_backends(self):
+        for lang in ("de", "ru", "sv"):
+            for fraction in ("1/2", "3/4", "2/3", "5/16", "19/20", "-1/3"):
+                self.assertEqual(
+                    pronounce_fraction(fraction, lang),
+                    self.expected(pronounce_fraction, fraction, lang),
+                    f"{lang} {fraction}")
+
+    def test_lookups_skip_the_backend(self):
+        pronounce_number(21, "de")
+        with patch.object(ovos_number_parser, "_pronounce_number_uncached",
+                          wraps=ovos_number_parser._pronounce_number_uncached
+                          ) as backend:
+            self.assertEqual(pronounce_number(21, "de"), "einundzwanzig")
+            self.assertEqual(pronounce_number(42, "de"), "zweiundvierzig")
+        backend.assert_not_called()
+
+    def test_only_small_ints_are_tabled(self):
+        with patch.object(ovos_number_parser, "_PRONOUNCE_TABLES",
+                          wraps=ovos_number_parser._PRONOUNCE_TABLES) as tables:
+            tables.enabled = True
+            for n in (True, 1.0, -1, 10000, 2.5):
+                self.assertEqual(pronounce_number(n, "en"),
+                                 self.expected(pronounce_number, n, "en"))
+            pronounce_number(5, "en", scientific=True)
+        tables.lookup.assert_not_called()
+
+    def test_blocks_are_compact_and_lazy(self):
+        pronounce_number(250, "en")
+        blocks = ovos_number_parser._PRONOUNCE_TABLES._tables[
+            ("number", "en", False,
+             ovos_number_parser.DigitPronunciation.FULL_NUMBER,
+             GrammaticalGender.MASCULINE,
+             ovos_number_parser.Scale.SHORT, None)]
+        self.assertEqual(len(blocks), 100)
+        self.assertEqual([i for i, b in enumerate(blocks) if b], [2])
+        self.assertIsInstance(blocks[2].text, str)
+        self.assertEqual(blocks[2][50], "two hundred and fifty")
+
+    def test_unsupported_language_still_raises(self):
+        with self.assertRaises(NotImplementedError):
+            pronounce_number(3, "xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""StreamingNumberNormalizer: numbers_to_digits over a word-by-word stream."""
+import unittest
+
+from ovos_number_parser import StreamingNumberNormalizer, numbers_to_digits
+
+
+def _stream(words, lang):
+    stream = StreamingNumberNormalizer(lang)
+    out = [stream.push(word) for word in words] + [stream.flush()]
+    return " ".join(part for part in out if part)
+
+
+class TestStreamingNumberNormalizer(unittest.TestCase):
+    def test_matches_whole_text(self):
+        for lang, text in (
+                ("en", "I have two hundred and five apples and three cats"),
+                ("en", "set a timer for twenty one minutes"),
+                ("pt", "tenho vinte e um anos e três gatos"),
+                ("de", "ich habe zwei und zwanzig Katzen"),
+                ("es", "tengo mil quinientos gatos"),
+                ("nl", "ik heb drie honden")):
+            with self.subTest(lang=lang, text=text):
+                self.assertEqual(_stream(text.split(), lang),
+                                 numbers_to_digits(text, lang))
+
+    def test_open_number_is_held(self):
+        stream = StreamingNumberNormalizer("en")
+        self.assertEqual(stream.push("I have two hundred"), "I have")
+        self.assertEqual(stream.pending, "two hundred")
+        self.assertEqual(stream.push("and five"), "")
+        self.assertEqual(stream.pending, "two hundred and five")
+        self.assertEqual(stream.push("apples"), "205 apples")
+        self.assertEqual(stream.pending, "")
+
+    def test_fraction_after_an_open_number(self):
+        # "and a" may still lead into "half": the stream must not settle
+        # "two and a" before it knows
+        for lang, text in (
+                ("en", "two and a half hours"),
+                ("en", "one and a quarter"),
+                ("en", "one hundred and a half"),
+                ("en", "I ate two a day"),
+                ("fy", "twa en in heal oere"),
+                ("ru", "два с половиной часа"),
+                ("ru", "два и половина часа"),
+                ("tr", "iki ve yarım saat"),
+                ("sk", "dva a pol hodiny")):
+            with self.subTest(lang=lang, text=text):
+                self.assertEqual(_stream(text.split(), lang),
+                                 numbers_to_digits(text, lang))
+        self.assertEqual(_stream("two and a half hours".split(), "en"),
+                         "2.5 hours")
+
+    def test_clause_mark_closes_a_number(self):
+        stream = StreamingNumberNormalizer("en")
+        self.assertEqual(stream.push("it is twenty."),
+                         numbers_to_digits("it is twenty.", "en"))
+        self.assertEqual(stream.pending, "")
+
+    def test_flush_and_reset(self):
+        stream = StreamingNumberNormalizer("en")
+        stream.push("twenty")
+        self.assertEqual(stream.flush(), "20")
+        self.assertEqual(stream.flush(), "")
+        stream.push("three")
+        stream.reset()
+        self.assertEqual(stream.pending, "")
+        self.assertEqual(stream.flush(), "")
+
+    def test_unsupported_language(self):
+        with self.assertRaises(NotImplementedError):
+            StreamingNumberNormalizer("xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Lazily built tables are safe to build from many threads at once."""
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import ovos_number_parser
+from ovos_number_parser import (_ORDINAL_REVERSE_CACHE, extract_number,
+                                is_ordinal, numbers_to_digits,
+                                pronounce_number, pronounce_ordinal)
+
+_THREADS = 8
+
+
+def _race(fn, *args):
+    """Run ``fn(*args)`` in every thread at the same moment."""
+    barrier = threading.Barrier(_THREADS)
+
+    def run():
+        barrier.wait()
+        return fn(*args)
+
+    with ThreadPoolExecutor(_THREADS) as pool:
+        return [f.result() for f in [pool.submit(run)
+                                     for _ in range(_THREADS)]]
+
+
+class TestColdTablesUnderThreads(unittest.TestCase):
+    def test_backend_ordinal_tables(self):
+        from ovos_number_parser import numbers_et, numbers_fi, numbers_hu, \
+            numbers_sl
+        # the last word a table gets, which a half-built one is missing
+        for module, lang, value in ((numbers_hu, "hu", 10 ** 6),
+                                    (numbers_fi, "fi", 10 ** 6),
+                                    (numbers_et, "et", 10 ** 6),
+                                    (numbers_sl, "sl", 10 ** 6)):
+            word = pronounce_ordinal(value, lang)
+            builder = getattr(module, f"_ordinal_reverse_{lang}")
+            with self.subTest(lang=lang):
+                builder.cache_clear()
+                self.assertEqual(_race(is_ordinal, word, lang),
+                                 [value] * _THREADS)
+
+    def test_generic_ordinal_table(self):
+        _ORDINAL_REVERSE_CACHE.pop("fr", None)
+        self.assertEqual(_race(is_ordinal, "vingt-et-unième", "fr"),
+                         [21] * _THREADS)
+
+    def test_mixed_calls_agree_with_serial_calls(self):
+        calls = [(pronounce_number, 1234, "de"),
+                 (extract_number, "einundzwanzig Katzen", "de"),
+                 (numbers_to_digits, "dois mil e vinte e três", "pt"),
+                 (ovos_number_parser.classify_tokens, ["tausend"], "de"),
+                 (ovos_number_parser.extract_numbers, "tre e venti", "it")]
+        expected = [fn(*args) for fn, *args in calls]
+        with ThreadPoolExecutor(_THREADS) as pool:
+            for _ in range(3):
+                futures = [pool.submit(fn, *args) for fn, *args in calls
+                           for _ in range(_THREADS)]
+                results = [f.result() for f in futures]
+                self.assertEqual(results[::_THREADS], expected)
+                self.assertEqual(
+                    results, [r for r in expected for _ in range(_THREADS)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""normalize_for_tts() spells out the written numbers of a text."""
+import types
+import unittest
+
+from ovos_number_parser import (normalize_for_tts, pronounce_number,
+                                pronounce_ordinal)
+from ovos_number_parser.util import GrammaticalGender
+
+
+def _tts(text, lang, **kwargs):
+    return "".join(normalize_for_tts(text, lang, **kwargs))
+
+
+class TestNormalizeForTTS(unittest.TestCase):
+    def test_sentences(self):
+        text = "It was the 21st. Water boils at 100 degrees!  Done"
+        result = normalize_for_tts(text, "en")
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertEqual(list(result), [
+            "It was the twenty-first. ",
+            "Water boils at one hundred degrees!  ",
+            "Done"])
+
+    def test_decimal_and_grouping_marks(self):
+        self.assertEqual(_tts("1,234.56 and -3.5", "en"),
+                         f"{pronounce_number(1234.56, 'en', places=2)} and "
+                         f"{pronounce_number(-3.5, 'en', places=1)}")
+        self.assertEqual(_tts("1.234,5 Euro", "de"),
+                         pronounce_number(1234.5, "de", places=1) + " Euro")
+        self.assertEqual(_tts("custa 1.000.000 euros", "pt"),
+                         f"custa {pronounce_number(1000000, 'pt')} euros")
+        self.assertEqual(_tts("1 234 €", "fr"),
+                         pronounce_number(1234, "fr") + " €")
+
+    def test_point_in_a_decimal_comma_language(self):
+        self.assertEqual(_tts("3.5 und 3.500", "de"),
+                         f"{pronounce_number(3.5, 'de', places=1)} und "
+                         f"{pronounce_number(3500, 'de')}")
+
+    def test_written_decimals_are_all_spoken(self):
+        self.assertEqual(_tts("3.14159", "en"),
+                         pronounce_number(3.14159, "en", places=5))
+
+    def test_ordinals(self):
+        self.assertEqual(_tts("1st 2ND 23rd", "en"), " ".join(
+            pronounce_ordinal(n, "en") for n in (1, 2, 23)))
+        self.assertEqual(
+            _tts("o 2º lugar e a 1.ª vez", "pt"),
+            f"o {pronounce_ordinal(2, 'pt')} lugar e a "
+            f"{pronounce_ordinal(1, 'pt', gender=GrammaticalGender.FEMININE)}"
+            f" vez")
+        self.assertEqual(_tts("le 3e", "fr"),
+                         "le " + pronounce_ordinal(3, "fr"))
+        # a point after a number ends the sentence, it is no ordinal
+        self.assertEqual(_tts("am 21. Mai", "de"),
+                         f"am {pronounce_number(21, 'de')}. Mai")
+
+    def test_numbers_inside_words_and_ranges(self):
+        self.assertEqual(_tts("mp3 and 10-20", "en"), "mp3 and ten-twenty")
+
+    def test_gender(self):
+        self.assertEqual(
+            _tts("1 hora", "pt", gender=GrammaticalGender.FEMININE),
+            pronounce_number(1, "pt", gender=GrammaticalGender.FEMININE)
+            + " hora")
+
+    def test_text_without_numbers(self):
+        for text in ("", "  ", "nothing here.", None):
+            with self.subTest(text=text):
+                self.assertEqual(_tts(text, "en"), text or "")
+
+    def test_language_read_through_rbnf(self):
+        self.assertEqual(_tts("I have 2 cats", "sw"),
+                         f"I have {pronounce_number(2, 'sw')} cats")
+
+    def test_rbnf_languages_group_thousands_with_a_comma(self):
+        for text, lang, number, rest in (("1,000円", "ja", 1000, "円"),
+                                         ("1,000人", "zh", 1000, "人"),
+                                         ("1,000 रुपये", "hi", 1000, " रुपये"),
+                                         ("2.5", "hi", 2.5, "")):
+            with self.subTest(lang=lang, text=text):
+                self.assertEqual(_tts(text, lang),
+                                 pronounce_number(number, lang) + rest)
+        # the languages that write a decimal comma keep it
+        self.assertEqual(_tts("1.000,5", "vi"),
+                         pronounce_number(1000.5, "vi"))
+
+    def test_unsupported_language_raises_at_the_call(self):
+        with self.assertRaises(NotImplementedError):
+            normalize_for_tts("1", "xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import patch
 
 from ovos_number_parser.util import (
-    Token, Scale, ReplaceableNumber, tokenize, partition_list,
+    Token, Scale, ReplaceableNumber, tokenize, partition_list, partition_count,
     invert_dict, is_numeric, look_for_fractions, convert_to_mixed_fraction, word_tokenize
 )
 
@@ -450,6 +450,17 @@ class TestPartitionList(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+    def test_partition_count_matches_partition_list(self):
+        """partition_count predicts the length of partition_list."""
+        for words in (["and"], ["a", "and", "b"], ["and", "and", "b"],
+                      ["a", "and", "and"], ["and", "a", "and"], ["a", "b"],
+                      ["and", "and", "and"], []):
+            positions = tuple(i for i, w in enumerate(words) if w == "and")
+            self.assertEqual(
+                partition_count(positions, len(words)),
+                len(partition_list(words, lambda w: w == "and")), words)
+
+
 class TestInvertDict(unittest.TestCase):
     """Test cases for the invert_dict function."""
 
@@ -911,6 +922,183 @@ class TestRomanceNumberExtractorNonDecimalUnicodeDigits(unittest.TestCase):
                 self.assertEqual(extract_number('٢', lang=lang), 2)
 
 
+class TestNumberVocabularyLexicons(unittest.TestCase):
+    """The derived lexicons are built once per (vocabulary, scale) and are
+    read-only, so no caller can corrupt the shared copy."""
+
+    def test_lexicons_are_memoized_per_scale(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        vocab = PT_PT.vocab
+        self.assertIs(vocab.get_number_strings(Scale.LONG),
+                      vocab.get_number_strings(Scale.LONG))
+        self.assertIs(vocab.get_ordinal_strings(), vocab.get_ordinal_strings())
+        self.assertIs(vocab.get_fraction_strings(),
+                      vocab.get_fraction_strings())
+        self.assertIsNot(vocab.get_number_strings(Scale.SHORT),
+                         vocab.get_number_strings(Scale.LONG))
+        self.assertEqual(vocab.get_number_strings(Scale.SHORT)["bilião"], 10 ** 9)
+        self.assertEqual(vocab.get_number_strings(Scale.LONG)["bilião"], 10 ** 12)
+
+    def test_lexicons_are_read_only(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        numbers = PT_PT.vocab.get_number_strings()
+        with self.assertRaises(TypeError):
+            numbers["um"] = 2
+        self.assertEqual(PT_PT.vocab.get_number_strings()["um"], 1)
+
+
+class TestRomanceTokenIndex(unittest.TestCase):
+    """Token roles are classified once per scale and read back with a single
+    lookup per word."""
+
+    def test_index_is_built_once_per_scale(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        self.assertIs(PT_PT._token_index(Scale.LONG),
+                      PT_PT._token_index(Scale.LONG))
+        self.assertEqual(PT_PT._token_index(Scale.SHORT)["bilião"].cardinal,
+                         10 ** 9)
+        self.assertEqual(PT_PT._token_index(Scale.LONG)["bilião"].cardinal,
+                         10 ** 12)
+
+    def test_token_roles(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        from ovos_number_parser.numbers_ro import RO
+        index = PT_PT._token_index(Scale.LONG)
+        self.assertTrue(index["e"].joiner)
+        self.assertTrue(index["menos"].negative)
+        self.assertTrue(index["vírgula"].decimal_marker)
+        self.assertEqual(index["terço"].fraction, 1 / 3)
+        self.assertTrue(index["terços"].plural_fraction)
+        self.assertFalse(index["terço"].plural_fraction)
+        self.assertEqual(index["terceiro"].ordinal, 3)
+        # ordinal particles are dropped before the lookup
+        self.assertEqual(RO.is_ordinal("al doilea"), 2)
+        self.assertFalse(RO.is_ordinal("al"))
+
+    def test_lookups_match_vocabulary(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        self.assertEqual(PT_PT.is_fractional("Terço "), 1 / 3)
+        self.assertFalse(PT_PT.is_fractional("gato"))
+        self.assertEqual(PT_PT.is_ordinal("terceiro"), 3)
+        self.assertFalse(PT_PT.is_ordinal("gato"))
+        self.assertEqual(PT_PT.extract_number("dois terços"), 2 / 3)
+        self.assertEqual(PT_PT.extract_number("menos vinte e um"), -21)
+        self.assertEqual(PT_PT.extract_number("o terceiro", ordinals=True), 3)
+
+
+class TestRomanceSpanReading(unittest.TestCase):
+    """numbers_to_digits reads a number span once, however many joiners it
+    crosses."""
+
+    def test_long_numeral(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        phrase = ("dois milhões trezentos e quarenta e cinco mil e "
+                  "seiscentos e setenta e oito")
+        with patch.object(PT_PT, "extract_number",
+                          wraps=PT_PT.extract_number) as extract:
+            self.assertEqual(PT_PT.numbers_to_digits(f"são {phrase} euros"),
+                             "são 2345678 euros")
+        extract.assert_not_called()
+        self.assertEqual(PT_PT.extract_number(phrase), 2345678)
+
+    def test_span_ends_where_extract_number_would(self):
+        from ovos_number_parser.numbers_es import ES
+        self.assertEqual(ES.numbers_to_digits("a las tres y veinte"),
+                         "a las 3 y 20")
+        self.assertEqual(ES.numbers_to_digits("mil y quinientos"), "1500")
+        self.assertEqual(ES.numbers_to_digits("veinte y uno coma cinco"),
+                         "21.5")
+
+
+class TestTokenNumberExtractor(unittest.TestCase):
+    """The English-derived parsers share one extraction pipeline."""
+
+    def test_languages_share_the_engine(self):
+        from ovos_number_parser.util import TokenNumberExtractor
+        from ovos_number_parser import (numbers_az, numbers_cs, numbers_en,
+                                        numbers_fy, numbers_hr, numbers_nl,
+                                        numbers_pl, numbers_ru, numbers_sk,
+                                        numbers_tr, numbers_uk)
+        for engine in (numbers_en._ENGINE_EN, numbers_ru._ENGINE_RU,
+                       numbers_uk._ENGINE_UK, numbers_pl._ENGINE_PL,
+                       numbers_cs._ENGINE_CS, numbers_tr._ENGINE_TR,
+                       numbers_az._ENGINE_AZ, numbers_nl._ENGINE_NL,
+                       numbers_fy._ENGINE_FY, numbers_hr._ENGINE_HR,
+                       numbers_sk._ENGINE_SK):
+            self.assertIsInstance(engine, TokenNumberExtractor)
+
+    def test_scale_after(self):
+        from ovos_number_parser.numbers_en import _ENGINE_EN
+        tokens = tokenize("two Million five hundred thousand cats")
+        self.assertEqual(_ENGINE_EN.scale_after(tokens, True),
+                         [1e6, 1e6, 1000, 1000, 1000, None, None])
+
+    def test_extract_numbers(self):
+        from ovos_number_parser.numbers_en import _ENGINE_EN
+        numbers = _ENGINE_EN.extract_numbers(
+            tokenize("two and a half cats or three point five dogs"))
+        self.assertEqual([(n.value, n.start_index, n.end_index)
+                          for n in numbers],
+                         [(2.5, 0, 3), (3.5, 6, 8)])
+        self.assertEqual(_ENGINE_EN.extract_number(tokenize("a dozen")).value,
+                         False)
+
+    def test_languages(self):
+        from ovos_number_parser import (numbers_to_digits_cs,
+                                        numbers_to_digits_pl,
+                                        numbers_to_digits_ru,
+                                        numbers_to_digits_uk)
+        self.assertEqual(numbers_to_digits_ru("двадцать два кота и три собаки"),
+                         "22 кота и 3 собаки")
+        self.assertEqual(numbers_to_digits_uk("дві тисячі п'ятсот гривень"),
+                         "2500 гривень")
+        self.assertEqual(numbers_to_digits_pl("dwadzieścia dwa koty"),
+                         "22 koty")
+        self.assertEqual(numbers_to_digits_cs("dvacet dva koček"),
+                         "22 koček")
+
+    def test_long_utterance(self):
+        from ovos_number_parser import numbers_to_digits_ru
+        sentence = "двадцать два кота и три собаки"
+        self.assertEqual(numbers_to_digits_ru(" ".join([sentence] * 300)),
+                         " ".join(["22 кота и 3 собаки"] * 300))
+
+    def test_numbers_back_to_back(self):
+        from unittest import mock
+        from ovos_number_parser import numbers_to_digits, pronounce_number
+        from ovos_number_parser import (numbers_az, numbers_cs, numbers_fy,
+                                        numbers_hr, numbers_nl, numbers_pl,
+                                        numbers_ru, numbers_sk, numbers_tr,
+                                        numbers_uk)
+        for lang, engine in (("ru", numbers_ru._ENGINE_RU),
+                             ("uk", numbers_uk._ENGINE_UK),
+                             ("pl", numbers_pl._ENGINE_PL),
+                             ("cs", numbers_cs._ENGINE_CS),
+                             ("tr", numbers_tr._ENGINE_TR),
+                             ("az", numbers_az._ENGINE_AZ),
+                             ("nl", numbers_nl._ENGINE_NL),
+                             ("fy", numbers_fy._ENGINE_FY),
+                             ("hr", numbers_hr._ENGINE_HR),
+                             ("sk", numbers_sk._ENGINE_SK)):
+            digits = [pronounce_number(n, lang) for n in (5, 1, 9, 4, 7)]
+            reader = engine.whole_number
+            read = []
+
+            def counting(tokens, short_scale, ordinals, start=0, *args):
+                read.append(len(tokens) - start)
+                return reader(tokens, short_scale, ordinals, start, *args)
+
+            with self.subTest(lang=lang), \
+                    mock.patch.object(engine, "whole_number", counting):
+                self.assertEqual(numbers_to_digits(" ".join(digits * 200),
+                                                   lang),
+                                 " ".join(["5 1 9 4 7"] * 200))
+                # one read of the run and one of each number, not a read of
+                # the run for each number in it
+                self.assertTrue(read)
+                self.assertLess(sum(read), 5 * 1000)
+
+
 if __name__ == '__main__':
     # Run the tests with verbose output
     unittest.main(verbosity=2)
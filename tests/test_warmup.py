@@ -0,0 +1,51 @@
+"""warmup() builds the lazy per-language state before the first request."""
+import gc
+import unittest
+
+import ovos_number_parser
+from ovos_number_parser import (_ORDINAL_REVERSE_CACHE, _rbnf_engine,
+                                 disable_pronounce_tables,
+                                 enable_pronounce_tables, warmup)
+
+
+class TestWarmup(unittest.TestCase):
+    def test_builds_lazy_tables(self):
+        _ORDINAL_REVERSE_CACHE.pop("fr", None)
+        warmup(["fr", "hu", "sw"])
+        self.assertIn("fr", _ORDINAL_REVERSE_CACHE)
+        from ovos_number_parser.numbers_hu import _ordinal_reverse_hu
+        self.assertEqual(_ordinal_reverse_hu.cache_info().currsize, 1)
+        hits = _rbnf_engine.cache_info().hits
+        ovos_number_parser.pronounce_number(2, "sw")
+        self.assertEqual(_rbnf_engine.cache_info().hits, hits + 1)
+
+    def test_builds_lexicons(self):
+        from ovos_number_parser.numbers_pt import PT_PT
+        from ovos_number_parser.util import Scale
+        PT_PT._token_indexes.clear()
+        warmup(["pt"])
+        self.assertEqual(set(PT_PT._token_indexes), set(Scale))
+
+    def test_unsupported_languages_are_skipped(self):
+        warmup(["xx", "sw"])
+
+    def test_fills_enabled_tables(self):
+        enable_pronounce_tables()
+        try:
+            warmup(["de"])
+            tables = ovos_number_parser._PRONOUNCE_TABLES._tables
+            cardinals = [blocks for key, blocks in tables.items()
+                         if key[:3] == ("number", "de", False)]
+            self.assertTrue(cardinals)
+            self.assertTrue(all(cardinals[0]))
+        finally:
+            disable_pronounce_tables()
+
+    def test_freeze(self):
+        self.addCleanup(gc.unfreeze)
+        warmup(["en"], freeze=True)
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()